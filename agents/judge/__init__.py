@@ -1 +1,3 @@
-from .evaluator import Judge
+from .audit_log import AuditBufferFull, AuditLogBuffer, DatabaseAuditWriter
+from .evaluator import BatchDecisions, Judge
+from .hitl_rules import HITLRuleEngine, compile_rules
@@ -0,0 +1,208 @@
+"""
+Write-behind audit trail for Judge decisions.
+
+``Judge.evaluate`` appends each decision to an ``AuditLogBuffer``, and
+``Judge.evaluate_batch`` appends its whole batch as one chunk with
+``record_many``. A background thread turns decisions into rows and writes
+them to ``audit_logs`` in batches, whenever ``batch_size`` rows are
+waiting or ``flush_interval`` seconds have passed. Evaluation latency
+therefore never includes a database round trip.
+
+* Backpressure: the buffer holds at most ``max_buffered`` decisions. A
+  record blocks for up to ``put_timeout`` seconds until its whole chunk
+  fits, then raises ``AuditBufferFull`` without queueing any of it.
+* Failed writes are retried with backoff; a batch is only dropped (and
+  counted in ``stats()``) if it still fails while ``close()`` drains.
+* ``close()`` (also registered with ``atexit``) rejects new decisions and
+  waits for everything already buffered to be written.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+REVIEW_STATUS = {
+    "escalate": "pending_hitl",
+    "queue": "queued",
+    "approve": "auto_approved",
+}
+
+
+class AuditBufferFull(RuntimeError):
+    """Raised when the audit buffer stays full for longer than put_timeout."""
+
+
+class DatabaseAuditWriter:
+    """Writes a batch of audit rows with one executemany INSERT."""
+
+    def __init__(self, engine=None):
+        self.engine = engine
+
+    def __call__(self, rows):
+        from models.database import AuditLog, get_engine
+
+        engine = self.engine or get_engine()
+        with engine.begin() as conn:
+            conn.execute(AuditLog.__table__.insert(), rows)
+
+
+class AuditLogBuffer:
+    def __init__(self, writer=None, batch_size=500, flush_interval=1.0,
+                 max_buffered=50_000, put_timeout=5.0, agent_id="judge"):
+        self.writer = writer or DatabaseAuditWriter()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.put_timeout = put_timeout
+        self.agent_id = agent_id
+        self._chunks = deque()  # [decisions, timestamp, next index] awaiting the flusher
+        self._buffered = 0  # decisions in _chunks
+        self._closing = False
+        self._cond = threading.Condition()
+        self._unwritten = 0  # recorded but not yet committed
+        self.written = 0
+        self.dropped = 0
+        self.failed_writes = 0
+        self._thread = threading.Thread(target=self._run, name="audit-log-flusher", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, decision):
+        """Queue one Judge decision; blocks briefly when the buffer is full."""
+        self.record_many((dict(decision),))
+
+    def record_many(self, decisions):
+        """Queue a batch of decisions (e.g. ``BatchDecisions``) as one chunk.
+
+        Rows are built on the flusher thread. The batch is queued whole or
+        not at all; one larger than ``max_buffered`` waits for an empty
+        buffer.
+        """
+        count = len(decisions)
+        if count == 0:
+            return
+        with self._cond:
+            fits = self._cond.wait_for(
+                lambda: self._closing or self._buffered == 0
+                or self._buffered + count <= self.max_buffered,
+                self.put_timeout,
+            )
+            if self._closing:
+                raise RuntimeError("AuditLogBuffer is closed")
+            if not fits:
+                raise AuditBufferFull(
+                    f"Audit buffer full ({self.max_buffered} rows) for {self.put_timeout}s"
+                )
+            self._chunks.append([decisions, datetime.now(timezone.utc), 0])
+            self._buffered += count
+            self._unwritten += count
+            self._cond.notify_all()
+
+    def _row(self, decision, timestamp):
+        return {
+            "task_id": decision.get("task_id"),
+            "action": decision["action"],
+            "reason": decision.get("reason"),
+            "confidence": decision.get("confidence"),
+            "agent_id": self.agent_id,
+            "review_status": REVIEW_STATUS.get(decision["action"], "unknown"),
+            "timestamp": timestamp,
+        }
+
+    @property
+    def pending(self):
+        return self._buffered
+
+    def stats(self):
+        return {"written": self.written, "pending": self._unwritten,
+                "dropped": self.dropped, "failed_writes": self.failed_writes}
+
+    def _settle(self, written, dropped=0):
+        with self._cond:
+            self.written += written
+            self.dropped += dropped
+            self._unwritten -= written + dropped
+            self._cond.notify_all()
+
+    def _next_batch(self):
+        """Take up to batch_size rows, waiting at most flush_interval for a full batch."""
+        with self._cond:
+            deadline = time.monotonic() + self.flush_interval
+            while self._buffered < self.batch_size and not self._closing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if self._buffered:
+                        break
+                    deadline = time.monotonic() + self.flush_interval
+                    continue
+                self._cond.wait(remaining)
+            slices, taken = [], 0
+            while self._chunks and taken < self.batch_size:
+                chunk = self._chunks[0]
+                decisions, timestamp, start = chunk
+                stop = min(len(decisions), start + self.batch_size - taken)
+                slices.append((decisions, timestamp, start, stop))
+                taken += stop - start
+                if stop == len(decisions):
+                    self._chunks.popleft()
+                else:
+                    chunk[2] = stop
+            self._buffered -= taken
+            self._cond.notify_all()  # room for blocked producers
+        # Build the rows outside the lock
+        return [self._row(decisions[i], timestamp)
+                for decisions, timestamp, start, stop in slices for i in range(start, stop)]
+
+    def _write(self, batch):
+        delay = 0.1
+        while True:
+            try:
+                self.writer(batch)
+            except Exception as e:
+                self.failed_writes += 1
+                logger.error(f"Audit log write of {len(batch)} rows failed: {e}")
+                if self._closing and delay > 5:
+                    logger.error(f"Giving up on {len(batch)} audit rows at shutdown")
+                    self._settle(0, len(batch))
+                    return
+                time.sleep(delay)
+                delay = min(delay * 2, 10.0)
+            else:
+                self._settle(len(batch))
+                return
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+            elif self._closing:
+                return
+
+    def flush(self, timeout=None):
+        """Block until everything recorded so far has been written.
+
+        Returns False if ``timeout`` expired first.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._unwritten == 0, timeout)
+
+    def close(self, timeout=30.0):
+        """Stop accepting decisions and durably flush what is buffered.
+
+        Raises ``TimeoutError`` if rows are still unwritten after ``timeout``.
+        """
+        with self._cond:
+            closing, self._closing = self._closing, True
+            self._cond.notify_all()
+        if not closing:
+            atexit.unregister(self.close)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError(
+                f"{self._unwritten} audit rows still unwritten after {timeout}s"
+            )
@@ -1,13 +1,39 @@
+from .hitl_rules import ALWAYS, HITLRuleEngine
+
+LOW_CONFIDENCE_THRESHOLD = 0.7
+HIGH_CONFIDENCE_THRESHOLD = 0.9
+
+# Decision codes used by evaluate_batch: code -> (action, reason)
+DECISIONS = (
+    ("escalate", "HITL_REQUIRED"),
+    ("escalate", "LOW_CONFIDENCE"),
+    ("queue", "REVIEW_REQUIRED"),
+    ("approve", "HIGH_CONFIDENCE"),
+)
+HITL, LOW, REVIEW, HIGH = range(4)
+
 class Judge:
-    def __init__(self):
-        pass
-    
+    def __init__(self, hitl_rules=None, audit_log=None):
+        # A shared HITLRuleEngine (reloadable at runtime) or a declarative rule dict
+        if isinstance(hitl_rules, HITLRuleEngine):
+            self.hitl_rules = hitl_rules
+        else:
+            self.hitl_rules = HITLRuleEngine(hitl_rules)
+        # Optional AuditLogBuffer; decisions are persisted write-behind
+        self.audit_log = audit_log
+
     def evaluate(self, task_result):
         """Evaluate task result and make routing decision."""
+        decision = self._decide(task_result)
+        if self.audit_log is not None:
+            self.audit_log.record(decision)
+        return decision
+
+    def _decide(self, task_result):
         # Extract confidence
         confidence = task_result.get("confidence", 0.0)
         task_id = task_result.get("task_id", "unknown")
-        
+
         # Check for HITL triggers first (highest priority)
         if self._requires_hitl_review(task_result):
             return {
@@ -17,36 +43,161 @@ class Judge:
                 "details": "Sensitive task requiring human review",
                 "confidence": confidence
             }
-        
+
         # Route based on confidence thresholds
-        if confidence < 0.7:
+        if confidence < LOW_CONFIDENCE_THRESHOLD:
             action = "escalate"
             reason = "LOW_CONFIDENCE"
-        elif confidence <= 0.9:
+        elif confidence <= HIGH_CONFIDENCE_THRESHOLD:
             action = "queue"
             reason = "REVIEW_REQUIRED"
         else:  # confidence > 0.9
             action = "approve"
             reason = "HIGH_CONFIDENCE"
-        
+
         return {
             "task_id": task_id,
             "action": action,
             "reason": reason,
             "confidence": confidence
         }
-    
+
+    def evaluate_batch(self, results):
+        """Evaluate many results at once with vectorized NumPy masks.
+
+        ``results`` is either a list of result dicts or a columnar mapping
+        with ``confidence`` and optional ``task_type``, ``amount``,
+        ``campaign_id`` and ``task_id`` columns. Returns ``BatchDecisions``;
+        per-row semantics match ``evaluate``.
+        """
+        import numpy as np
+
+        if not hasattr(results, "keys"):
+            results = self._to_columns(results)
+
+        confidence = np.asarray(results["confidence"], dtype=np.float64)
+        n = len(confidence)
+        task_type = results.get("task_type")
+        amount = results.get("amount")
+
+        hitl = np.zeros(n, dtype=bool)
+        if task_type is not None:
+            task_type = np.asarray(task_type)
+            amount = np.zeros(n) if amount is None else np.asarray(amount, dtype=np.float64)
+            campaign_ids = results.get("campaign_id")
+            rules = self.hitl_rules.rules  # one snapshot for the whole batch
+            if campaign_ids is None:
+                hitl = self._hitl_mask(np, rules.default, task_type, amount)
+            else:
+                campaign_ids = np.asarray(campaign_ids, dtype=object)
+                for campaign_id in set(campaign_ids.tolist()):
+                    rows = campaign_ids == campaign_id
+                    hitl[rows] = self._hitl_mask(
+                        np, rules.table_for(campaign_id), task_type[rows], amount[rows]
+                    )
+
+        # Order matters: later assignments win, mirroring the if/elif chain
+        codes = np.full(n, HIGH, dtype=np.int8)
+        codes[confidence <= HIGH_CONFIDENCE_THRESHOLD] = REVIEW
+        codes[confidence < LOW_CONFIDENCE_THRESHOLD] = LOW
+        codes[hitl] = HITL
+        decisions = BatchDecisions(codes, confidence, results.get("task_id"))
+        if self.audit_log is not None:
+            self.audit_log.record_many(decisions)
+        return decisions
+
+    @staticmethod
+    def _hitl_mask(np, table, task_type, amount):
+        """Vectorized HITL check against one compiled rule table."""
+        if task_type.dtype.kind == "U":
+            # Look up each distinct task_type once, then broadcast
+            uniques, inverse = np.unique(task_type, return_inverse=True)
+            limits = np.array([table.get(t, np.nan) for t in uniques.tolist()],
+                              dtype=np.float64)[inverse]
+        else:
+            limits = np.fromiter((table.get(t, np.nan) for t in task_type.tolist()),
+                                 dtype=np.float64, count=len(task_type))
+        # NaN limits (no rule) compare False
+        return (limits == ALWAYS) | (amount > limits)
+
+    @staticmethod
+    def _to_columns(results):
+        """Convert result dicts to columns, applying evaluate()'s defaults."""
+        return {
+            "task_id": [r.get("task_id", "unknown") for r in results],
+            "confidence": [r.get("confidence", 0.0) for r in results],
+            "task_type": [r.get("task_type") for r in results],
+            "amount": [r.get("amount", 0) for r in results],
+            "campaign_id": [r.get("campaign_id") for r in results],
+        }
+
     def _requires_hitl_review(self, task_result):
-        """Check if task requires Human-in-the-Loop review."""
-        # Finance > $50 (from spec)
-        if task_result.get("task_type") == "finance":
-            amount = task_result.get("amount", 0)
-            if amount > 50:
-                return True
-        
-        # Other sensitive categories (extendable)
-        sensitive_categories = ["politics", "health", "legal", "security"]
-        if task_result.get("task_type") in sensitive_categories:
-            return True
-        
-        return False
+        """Check if task requires Human-in-the-Loop review (see hitl_rules)."""
+        return self.hitl_rules.requires_review(
+            task_result.get("task_type"),
+            task_result.get("amount", 0),
+            task_result.get("campaign_id"),
+        )
+
+class BatchDecisions:
+    """Decision arrays from ``Judge.evaluate_batch``.
+
+    ``codes`` indexes into ``DECISIONS``; per-result dicts identical to
+    ``Judge.evaluate`` output are only built when indexed or iterated.
+    """
+    __slots__ = ("codes", "confidence", "task_ids")
+
+    def __init__(self, codes, confidence, task_ids=None):
+        self.codes = codes
+        self.confidence = confidence
+        self.task_ids = task_ids
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def hitl(self):
+        return self.codes == HITL
+
+    @property
+    def escalate(self):
+        return self.codes <= LOW
+
+    @property
+    def queue(self):
+        return self.codes == REVIEW
+
+    @property
+    def approve(self):
+        return self.codes == HIGH
+
+    def counts(self):
+        """Number of approve / queue / escalate decisions."""
+        import numpy as np
+
+        per_code = np.bincount(self.codes, minlength=len(DECISIONS))
+        return {
+            "approve": int(per_code[HIGH]),
+            "queue": int(per_code[REVIEW]),
+            "escalate": int(per_code[HITL] + per_code[LOW]),
+        }
+
+    def __getitem__(self, index):
+        code = int(self.codes[index])
+        action, reason = DECISIONS[code]
+        decision = {
+            "task_id": self.task_ids[index] if self.task_ids is not None else "unknown",
+            "action": action,
+            "reason": reason
+        }
+        if code == HITL:
+            decision["details"] = "Sensitive task requiring human review"
+        decision["confidence"] = float(self.confidence[index])
+        return decision
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dicts(self):
+        return list(self)
@@ -0,0 +1,93 @@
+"""
+Declarative Human-in-the-Loop rules for the Judge.
+
+Rules are plain data (JSON-friendly)::
+
+    {
+        "sensitive_categories": ["politics", "health", "legal", "security"],
+        "amount_thresholds": {"finance": 50},
+        "campaigns": {
+            "<campaign_id>": {
+                "sensitive_categories": ["crypto"],     # added to the globals
+                "amount_thresholds": {"finance": 10}    # overrides per task_type
+            }
+        }
+    }
+
+``compile_rules`` folds each rule set into one dict per campaign mapping
+``task_type`` to an amount limit (``ALWAYS`` for sensitive categories), so
+a check is a single dict lookup no matter how many rules exist.
+``HITLRuleEngine.reload`` swaps in a freshly compiled table atomically.
+"""
+import json
+
+ALWAYS = float("-inf")  # any amount exceeds it
+
+DEFAULT_RULES = {
+    "sensitive_categories": ["politics", "health", "legal", "security"],
+    "amount_thresholds": {"finance": 50},
+}
+
+
+def _build_table(categories, thresholds):
+    table = {task_type: float(limit) for task_type, limit in thresholds.items()}
+    # Sensitive categories always win over an amount threshold
+    table.update(dict.fromkeys(categories, ALWAYS))
+    return table
+
+
+class CompiledRules:
+    """Immutable dispatch tables produced by ``compile_rules``."""
+    __slots__ = ("default", "campaigns", "rule_count")
+
+    def __init__(self, default, campaigns, rule_count):
+        self.default = default
+        self.campaigns = campaigns
+        self.rule_count = rule_count
+
+    def table_for(self, campaign_id=None):
+        return self.campaigns.get(campaign_id, self.default)
+
+    def requires_review(self, task_type, amount=0, campaign_id=None):
+        limit = self.table_for(campaign_id).get(task_type)
+        if limit is None:
+            return False
+        return limit is ALWAYS or amount > limit
+
+
+def compile_rules(rules):
+    """Validate a declarative rule set and compile it into lookup tables."""
+    unknown = set(rules) - {"sensitive_categories", "amount_thresholds", "campaigns"}
+    if unknown:
+        raise ValueError(f"Unknown HITL rule keys: {sorted(unknown)}")
+
+    categories = frozenset(rules.get("sensitive_categories", ()))
+    thresholds = dict(rules.get("amount_thresholds", {}))
+    rule_count = len(categories) + len(thresholds)
+
+    campaigns = {}
+    for campaign_id, override in rules.get("campaigns", {}).items():
+        extra = frozenset(override.get("sensitive_categories", ()))
+        merged = {**thresholds, **override.get("amount_thresholds", {})}
+        campaigns[campaign_id] = _build_table(categories | extra, merged)
+        rule_count += len(extra) + len(override.get("amount_thresholds", {}))
+
+    return CompiledRules(_build_table(categories, thresholds), campaigns, rule_count)
+
+
+class HITLRuleEngine:
+    """Holds the active compiled rules; safe to reload while evaluating."""
+
+    def __init__(self, rules=None):
+        self.rules = compile_rules(DEFAULT_RULES if rules is None else rules)
+
+    def reload(self, rules):
+        """Compile ``rules`` and swap them in (a single reference assignment)."""
+        self.rules = compile_rules(rules)
+
+    def reload_file(self, path):
+        with open(path) as f:
+            self.reload(json.load(f))
+
+    def requires_review(self, task_type, amount=0, campaign_id=None):
+        return self.rules.requires_review(task_type, amount, campaign_id)
@@ -0,0 +1,266 @@
+"""
+Ephemeral agent memory: short-lived, per-agent key/value context.
+
+Implements the ``ephemeral_memory:<agent_id>`` keys from the technical
+spec. Each agent gets a bounded store. Entries expire after a TTL (one
+hour by default), and the least recently used entry is evicted once an
+agent holds ``max_entries``.
+
+Two interchangeable backends:
+
+* ``RedisMemoryBackend`` is shared by every process. Batch reads and
+  writes each take one pipelined round trip, and values are
+  JSON-encoded.
+* ``InProcessMemoryBackend`` is used for tests and single-node runs.
+
+``get_memory_backend`` picks Redis when ``REDIS_URL`` is set.
+
+``SemanticMemory`` adds similarity recall over longer-lived memories.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_ENTRIES = 1000
+KEY_PREFIX = "ephemeral_memory"
+
+
+class InProcessMemoryBackend:
+    """Per-agent LRU dicts with per-entry expiry; thread-safe."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._agents = {}  # agent_id -> OrderedDict(key -> (expires_at, value))
+        self._lock = threading.Lock()
+
+    def get_many(self, agent_id, keys):
+        now = self.clock()
+        values = []
+        with self._lock:
+            entries = self._agents.get(agent_id)
+            for key in keys:
+                entry = entries.get(key) if entries else None
+                if entry is None:
+                    values.append(None)
+                elif entry[0] <= now:
+                    del entries[key]
+                    values.append(None)
+                else:
+                    entries.move_to_end(key)
+                    values.append(entry[1])
+        return values
+
+    def set_many(self, agent_id, items, ttl):
+        expires_at = self.clock() + ttl
+        with self._lock:
+            entries = self._agents.setdefault(agent_id, OrderedDict())
+            for key, value in items.items():
+                entries[key] = (expires_at, value)
+                entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def delete(self, agent_id, keys):
+        with self._lock:
+            entries = self._agents.get(agent_id, {})
+            for key in keys:
+                entries.pop(key, None)
+
+    def clear(self, agent_id):
+        with self._lock:
+            self._agents.pop(agent_id, None)
+
+    def size(self, agent_id):
+        now = self.clock()
+        with self._lock:
+            entries = self._agents.get(agent_id, {})
+            return sum(1 for expires_at, _ in entries.values() if expires_at > now)
+
+
+class RedisMemoryBackend:
+    """Redis-backed store shared across processes.
+
+    Each entry is a string key ``ephemeral_memory:<agent_id>:<key>`` with a
+    native TTL. A sorted set ``ephemeral_memory:<agent_id>`` scores keys by
+    last access and drives LRU trimming; its TTL tracks the longest-lived
+    entry.
+    """
+
+    def __init__(self, client, max_entries=DEFAULT_MAX_ENTRIES, prefix=KEY_PREFIX,
+                 clock=time.time):
+        self.client = client
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self.clock = clock
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis
+
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def _index(self, agent_id):
+        return f"{self.prefix}:{agent_id}"
+
+    def _key(self, agent_id, key):
+        return f"{self.prefix}:{agent_id}:{key}"
+
+    def get_many(self, agent_id, keys):
+        keys = list(keys)
+        if not keys:
+            return []
+        pipe = self.client.pipeline(transaction=False)
+        pipe.mget([self._key(agent_id, key) for key in keys])
+        # Touch for LRU; XX so expired/evicted keys are not resurrected
+        pipe.zadd(self._index(agent_id), dict.fromkeys(keys, self.clock()), xx=True)
+        raw, _ = pipe.execute()
+        return [None if value is None else json.loads(value) for value in raw]
+
+    def set_many(self, agent_id, items, ttl):
+        if not items:
+            return
+        index = self._index(agent_id)
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._key(agent_id, key), json.dumps(value), px=int(ttl * 1000))
+        pipe.zadd(index, dict.fromkeys(items, self.clock()))
+        # The index must outlive every entry it tracks, so its TTL only grows:
+        # NX sets it on a new index, GT extends it (both need Redis 7)
+        index_ttl = int(ttl * 1000) + 1000
+        pipe.pexpire(index, index_ttl, nx=True)
+        pipe.pexpire(index, index_ttl, gt=True)
+        pipe.zcard(index)
+        overflow = pipe.execute()[-1] - self.max_entries
+        if overflow > 0:
+            evicted = [member for member, _ in self.client.zpopmin(index, overflow)]
+            self.client.delete(*(self._key(agent_id, member.decode()) for member in evicted))
+
+    def delete(self, agent_id, keys):
+        keys = list(keys)
+        if not keys:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        pipe.delete(*(self._key(agent_id, key) for key in keys))
+        pipe.zrem(self._index(agent_id), *keys)
+        pipe.execute()
+
+    def clear(self, agent_id):
+        index = self._index(agent_id)
+        members = [member.decode() for member in self.client.zrange(index, 0, -1)]
+        self.client.delete(index, *(self._key(agent_id, member) for member in members))
+
+    def size(self, agent_id):
+        members = [member.decode() for member in self.client.zrange(self._index(agent_id), 0, -1)]
+        if not members:
+            return 0
+        return self.client.exists(*(self._key(agent_id, member) for member in members))
+
+
+def get_memory_backend(url=None, **kwargs):
+    """Redis when ``url`` / ``REDIS_URL`` is set, otherwise in-process."""
+    url = url or os.getenv("REDIS_URL")
+    if url:
+        return RedisMemoryBackend.from_url(url, **kwargs)
+    return InProcessMemoryBackend(**kwargs)
+
+
+class EphemeralMemory:
+    """Agent-facing API over a memory backend."""
+
+    def __init__(self, backend=None, default_ttl=DEFAULT_TTL):
+        self.backend = backend or get_memory_backend()
+        self.default_ttl = default_ttl
+
+    def for_agent(self, agent_id):
+        return AgentMemory(self, agent_id)
+
+    def get(self, agent_id, key, default=None):
+        (value,) = self.backend.get_many(agent_id, [key])
+        return default if value is None else value
+
+    def set(self, agent_id, key, value, ttl=None):
+        self.backend.set_many(agent_id, {key: value}, self.default_ttl if ttl is None else ttl)
+
+    def get_many(self, agent_id, keys):
+        """Return ``{key: value}`` for the keys that are present."""
+        keys = list(keys)
+        values = self.backend.get_many(agent_id, keys)
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    def set_many(self, agent_id, items, ttl=None):
+        self.backend.set_many(agent_id, dict(items), self.default_ttl if ttl is None else ttl)
+
+    def delete(self, agent_id, *keys):
+        self.backend.delete(agent_id, keys)
+
+    def clear(self, agent_id):
+        self.backend.clear(agent_id)
+
+    def size(self, agent_id):
+        return self.backend.size(agent_id)
+
+
+class AgentMemory:
+    """``EphemeralMemory`` bound to one agent_id."""
+    __slots__ = ("memory", "agent_id")
+
+    def __init__(self, memory, agent_id):
+        self.memory = memory
+        self.agent_id = agent_id
+
+    def get(self, key, default=None):
+        return self.memory.get(self.agent_id, key, default)
+
+    def set(self, key, value, ttl=None):
+        self.memory.set(self.agent_id, key, value, ttl)
+
+    def get_many(self, keys):
+        return self.memory.get_many(self.agent_id, keys)
+
+    def set_many(self, items, ttl=None):
+        self.memory.set_many(self.agent_id, items, ttl)
+
+    def delete(self, *keys):
+        self.memory.delete(self.agent_id, *keys)
+
+    def clear(self):
+        self.memory.clear(self.agent_id)
+
+    def __len__(self):
+        return self.memory.size(self.agent_id)
+
+
+class SemanticMemory:
+    """Long-term memory recall by similarity, backed by a local ``VectorIndex``.
+
+    The embedded counterpart of the spec's Weaviate ``AgentMemory`` class:
+    ``remember`` embeds and stores texts, ``recall`` returns an agent's
+    most similar memories. ``embed`` maps a list of texts to an
+    ``(n, dim)`` array and defaults to a hashing embedder.
+    """
+
+    def __init__(self, embed=None, dim=1024, index=None):
+        from models.vector_index import VectorIndex, hashing_embedder
+
+        self.embed = embed or hashing_embedder(dim)
+        self.index = index if index is not None else VectorIndex(dim)
+        self._lock = threading.Lock()
+
+    def remember(self, agent_id, texts, metadata=None):
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        metadata = metadata or [{} for _ in texts]
+        rows = [dict(meta, agent_id=agent_id, text=text) for text, meta in zip(texts, metadata)]
+        vectors = self.embed(texts)
+        with self._lock:
+            self.index.add(vectors, metadata=rows)
+
+    def recall(self, agent_id, query, k=5):
+        """``[(text, score), ...]`` of the agent's ``k`` closest memories."""
+        vector = self.embed([query])[0]
+        with self._lock:
+            hits = self.index.search(vector, k=k, where={"agent_id": agent_id})
+        return [(hit["metadata"]["text"], hit["score"]) for hit in hits]
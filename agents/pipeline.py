@@ -0,0 +1,216 @@
+"""
+Pipelined Planner -> Worker -> Judge runtime.
+
+The three agents run as concurrent stages connected by bounded asyncio
+queues, so a task is judged as soon as it has executed instead of after
+the whole campaign::
+
+    planner --[tasks]--> workers (N) --[results]--> judges (M) --[decisions]--> caller
+
+* Backpressure: a full queue suspends its producer. A slow consumer of
+  ``SwarmPipeline.run`` therefore throttles judging, execution and
+  finally task generation.
+* Graceful drain: when the planner is exhausted (or ``stop()`` is called)
+  every task already planned is still executed and judged before ``run``
+  finishes.
+* ``stats()`` reports per-stage throughput and queue depth at any time.
+* Judge evaluations run in worker threads, ``judge_concurrency`` at a
+  time, so a blocking audit-log write never stalls the event loop.
+
+A consumer that may stop early must close the stream, so the stages are
+cancelled right away rather than when the loop shuts down::
+
+    async with contextlib.aclosing(pipeline.run(goals, workers)) as decisions:
+        async for decision in decisions:
+            ...
+"""
+import asyncio
+import time
+
+_DONE = object()  # end-of-stream marker, one per downstream consumer
+
+
+class StageStats:
+    """Counters for one pipeline stage and the queue feeding it."""
+
+    def __init__(self, name, concurrency, inbox=None):
+        self.name = name
+        self.concurrency = concurrency
+        self.inbox = inbox
+        self.processed = 0
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.started = None
+        self.finished = None
+
+    def observe_queue(self):
+        if self.inbox is not None:
+            self.max_queue_depth = max(self.max_queue_depth, self.inbox.qsize())
+
+    def snapshot(self):
+        elapsed = ((self.finished or time.perf_counter()) - self.started) if self.started else 0.0
+        return {
+            "processed": self.processed,
+            "in_flight": self.in_flight,
+            "concurrency": self.concurrency,
+            "queue_depth": self.inbox.qsize() if self.inbox is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "throughput": self.processed / elapsed if elapsed else 0.0,
+        }
+
+
+class SwarmPipeline:
+    def __init__(self, planner=None, worker=None, judge=None, worker_concurrency=50,
+                 judge_concurrency=1, queue_size=1000, default_action="execute"):
+        from agents.judge.evaluator import Judge
+        from agents.planner.task_decomposer import Planner
+        from agents.worker.executor import Worker
+
+        self.planner = planner or Planner()
+        self.worker = worker or Worker()
+        self.judge = judge or Judge()
+        self.worker_concurrency = worker_concurrency
+        self.judge_concurrency = judge_concurrency
+        self.queue_size = queue_size
+        # Planner tasks carry no action; the Worker requires one
+        self.default_action = default_action
+        self._stopping = None
+        self._stages = {}
+        self.first_decision_latency = None
+
+    def stop(self):
+        """Stop planning new tasks; in-flight tasks still drain through."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    def stats(self):
+        stats = {name: stage.snapshot() for name, stage in self._stages.items()}
+        stats["first_decision_latency"] = self.first_decision_latency
+        return stats
+
+    async def run(self, goals, workers, policy="round_robin"):
+        """Async-iterate Judge decisions (each with its ``result``) as tasks complete.
+
+        Wrap in ``contextlib.aclosing`` when breaking out early: the stages
+        keep running until the generator is closed.
+        """
+        self._stopping = asyncio.Event()
+        tasks = asyncio.Queue(self.queue_size)
+        results = asyncio.Queue(self.queue_size)
+        decisions = asyncio.Queue(self.queue_size)
+        self._stages = {
+            "plan": StageStats("plan", 1),
+            "execute": StageStats("execute", self.worker_concurrency, tasks),
+            "judge": StageStats("judge", self.judge_concurrency, results),
+            "output": StageStats("output", 1, decisions),
+        }
+        self.first_decision_latency = None
+        started = time.perf_counter()
+        for stage in self._stages.values():
+            stage.started = started
+
+        runners = [
+            asyncio.ensure_future(self._plan(goals, workers, policy, tasks)),
+            asyncio.ensure_future(self._stage(
+                "execute", self._execute, tasks, results, self.judge_concurrency)),
+            asyncio.ensure_future(self._stage("judge", self._judge, results, decisions, 1)),
+        ]
+        output = self._stages["output"]
+        try:
+            while True:
+                decision = await decisions.get()
+                if decision is _DONE:
+                    break
+                if self.first_decision_latency is None:
+                    self.first_decision_latency = time.perf_counter() - started
+                output.processed += 1
+                yield decision
+            # Surface stage failures instead of ending the stream silently. A
+            # failed stage may leave its producer blocked, so check first.
+            for runner in runners:
+                if runner.done() and runner.exception() is not None:
+                    raise runner.exception()
+            await asyncio.gather(*runners)
+        finally:
+            output.finished = time.perf_counter()
+            for runner in runners:
+                runner.cancel()
+            await asyncio.gather(*runners, return_exceptions=True)
+
+    async def run_all(self, goals, workers, policy="round_robin"):
+        """Collect every decision of ``run`` into a list."""
+        return [decision async for decision in self.run(goals, workers, policy)]
+
+    async def _plan(self, goals, workers, policy, outbox):
+        stage = self._stages["plan"]
+        error = None
+        try:
+            for worker_id, task in self.planner.assign_tasks_iter(goals, workers, policy):
+                if self._stopping.is_set():
+                    break
+                task["assigned_to"] = worker_id
+                task.setdefault("action", self.default_action)
+                await outbox.put(task)
+                stage.processed += 1
+                self._stages["execute"].observe_queue()
+                if outbox.qsize() < outbox.maxsize:
+                    # put() did not suspend; let the other stages run
+                    await asyncio.sleep(0)
+        except Exception as e:
+            error = e
+        stage.finished = time.perf_counter()
+        await self._close(outbox, self.worker_concurrency, error)
+
+    async def _stage(self, name, handle, inbox, outbox, downstream):
+        stage = self._stages[name]
+        next_stage = self._stages["judge" if name == "execute" else "output"]
+
+        async def consume():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    return
+                stage.in_flight += 1
+                try:
+                    out = await handle(item)
+                finally:
+                    stage.in_flight -= 1
+                stage.processed += 1
+                await outbox.put(out)
+                next_stage.observe_queue()
+
+        consumers = [asyncio.ensure_future(consume()) for _ in range(stage.concurrency)]
+        error = None
+        try:
+            await asyncio.gather(*consumers)
+        except Exception as e:
+            error = e
+        finally:
+            # On failure (or cancellation) stop the sibling consumers too
+            for consumer in consumers:
+                consumer.cancel()
+            stage.finished = time.perf_counter()
+        await self._close(outbox, downstream, error)
+
+    @staticmethod
+    async def _close(outbox, downstream, error=None):
+        """End the stream for every downstream consumer, then re-raise ``error``.
+
+        Ending the stream even on failure lets ``run`` drain and report the
+        error instead of waiting forever.
+        """
+        for _ in range(downstream):
+            await outbox.put(_DONE)
+        if error is not None:
+            raise error
+
+    async def _execute(self, task):
+        result = await self.worker.execute_async(task)
+        result["task_id"] = task["task_id"]
+        result["assigned_to"] = task["assigned_to"]
+        return result
+
+    async def _judge(self, result):
+        decision = await asyncio.to_thread(self.judge.evaluate, result)
+        decision["result"] = result
+        return decision
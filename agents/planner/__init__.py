@@ -1 +1,3 @@
-from .task_decomposer import Planner
\ No newline at end of file
+from .task_decomposer import Planner, TaskBatch
+from .scheduler import WorkerDescriptor
+from .task_ids import UUID7Generator, get_id_generator
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Task-to-worker scheduling policies for the Planner.
+
+A policy is a callable ``policy(tasks, workers)`` that lazily yields
+``(worker_id, task)`` pairs. ``round_robin`` keeps the even-distribution
+guarantee; ``least_loaded`` uses a heap keyed on each worker's projected
+completion time so slow or busy workers receive proportionally less work.
+"""
+import heapq
+from dataclasses import dataclass
+from itertools import cycle
+
+
+@dataclass
+class WorkerDescriptor:
+    worker_id: str
+    capacity: int = 1  # tasks the worker runs in parallel
+    in_flight: int = 0  # tasks already running or queued on the worker
+    ewma_latency: float = 1.0  # smoothed seconds per task
+
+    def __post_init__(self):
+        if self.capacity < 1:
+            raise ValueError(f"Worker {self.worker_id} capacity must be >= 1")
+
+    def projected_finish(self, queued=0):
+        """Estimated seconds until a newly assigned task would complete."""
+        return (self.in_flight + queued + 1) / self.capacity * self.ewma_latency
+
+    def record_latency(self, seconds, alpha=0.2):
+        """Fold an observed task latency into the EWMA."""
+        self.ewma_latency = alpha * seconds + (1 - alpha) * self.ewma_latency
+
+
+def as_descriptor(worker):
+    """Accept either a bare worker id or a ``WorkerDescriptor``."""
+    if isinstance(worker, WorkerDescriptor):
+        return worker
+    return WorkerDescriptor(worker_id=worker)
+
+
+def worker_id(worker):
+    return worker.worker_id if isinstance(worker, WorkerDescriptor) else worker
+
+
+def round_robin(tasks, workers):
+    """Even distribution: worker loads differ by at most one task."""
+    return zip(cycle([worker_id(w) for w in workers]), tasks)
+
+
+def least_loaded(tasks, workers):
+    """Assign each task to the worker with the earliest projected finish."""
+    descriptors = [as_descriptor(w) for w in workers]
+    # (projected finish, position for stable ties, queued count)
+    heap = [(d.projected_finish(), i, 0) for i, d in enumerate(descriptors)]
+    heapq.heapify(heap)
+    for task in tasks:
+        _, i, queued = heap[0]
+        queued += 1
+        heapq.heapreplace(heap, (descriptors[i].projected_finish(queued), i, queued))
+        yield descriptors[i].worker_id, task
+
+
+SCHEDULING_POLICIES = {
+    "round_robin": round_robin,
+    "least_loaded": least_loaded,
+}
+
+
+def get_scheduling_policy(policy="round_robin"):
+    """Resolve a scheduling policy by name, or pass a callable straight through."""
+    if callable(policy):
+        return policy
+    try:
+        return SCHEDULING_POLICIES[policy]
+    except KeyError:
+        raise ValueError(f"Unknown scheduling policy: {policy!r}") from None
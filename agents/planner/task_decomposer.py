@@ -1,42 +1,160 @@
-import uuid
 import math
+import sys
+from array import array
 from dataclasses import dataclass
 
+from .scheduler import get_scheduling_policy, worker_id
+from .task_ids import get_id_generator
+
+PRIORITIES = ("low", "medium", "high", "critical")
+DEFAULT_DEADLINE = "2026-12-31T00:00:00Z"
+
 @dataclass
 class Task:
     task_id: str
     spec: str  # Renamed from 'action' to match the test requirements
     budget: float
     priority: str = "medium"
-    deadline: str = "2026-12-31T00:00:00Z"
+    deadline: str = DEFAULT_DEADLINE
+
+class TaskBatch:
+    """Columnar container for planner output.
+
+    Budgets live in a typed ``array('d')`` column (usable directly with
+    ``numpy.frombuffer``), priorities are stored as one-byte codes and
+    deadlines are interned into a per-batch lookup table. Iterating or
+    indexing yields the same five-key dicts that ``Planner.decompose`` returns.
+    """
+    __slots__ = ("task_ids", "specs", "budgets", "priority_codes",
+                 "deadline_codes", "_deadlines", "_deadline_index")
+
+    def __init__(self):
+        self.task_ids = []
+        self.specs = []
+        self.budgets = array("d")
+        self.priority_codes = array("B")
+        self.deadline_codes = array("I")
+        self._deadlines = []
+        self._deadline_index = {}
+
+    @classmethod
+    def from_tasks(cls, tasks):
+        """Build a batch from an iterable of task dicts."""
+        batch = cls()
+        for task in tasks:
+            batch.append(task["task_id"], task["spec"], task["budget"],
+                         task.get("priority", "medium"),
+                         task.get("deadline", DEFAULT_DEADLINE))
+        return batch
+
+    def append(self, task_id, spec, budget, priority="medium", deadline=DEFAULT_DEADLINE):
+        """Add one task to the batch."""
+        code = self._deadline_index.get(deadline)
+        if code is None:
+            code = self._deadline_index[deadline] = len(self._deadlines)
+            self._deadlines.append(sys.intern(deadline))
+        self.task_ids.append(task_id)
+        self.specs.append(spec)
+        self.budgets.append(budget)
+        self.priority_codes.append(PRIORITIES.index(priority))
+        self.deadline_codes.append(code)
+
+    def __len__(self):
+        return len(self.task_ids)
+
+    def __getitem__(self, index):
+        """Return a dict view of the task at ``index``."""
+        return {
+            "task_id": self.task_ids[index],
+            "spec": self.specs[index],
+            "budget": self.budgets[index],
+            "priority": PRIORITIES[self.priority_codes[index]],
+            "deadline": self._deadlines[self.deadline_codes[index]]
+        }
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def task(self, index):
+        """Return the task at ``index`` as a ``Task`` dataclass."""
+        return Task(**self[index])
+
+    def to_dicts(self):
+        """Materialise the batch as a list of task dicts."""
+        return list(self)
+
+    def total_budget(self):
+        """Sum of all task budgets."""
+        return math.fsum(self.budgets)
 
 class Planner:
-    def __init__(self, cost_per_task=100.0):
+    ID_CHUNK_SIZE = 1024
+
+    def __init__(self, cost_per_task=100.0, id_generator="uuid4"):
         self.cost_per_task = cost_per_task
+        # "uuid4", "uuid7" (time-ordered) or any zero-arg callable returning a str
+        self.id_generator = get_id_generator(id_generator)
 
-    def decompose(self, goals: dict):
-        """Standard method for Task 1.2 and Unit Tests"""
+    def task_count(self, goals: dict):
+        """Number of tasks the campaign budget pays for (at least one)."""
         total_budget = goals.get("budget", 0)
-        num_tasks = max(1, math.floor(total_budget / self.cost_per_task))
-        
-        tasks = []
-        for i in range(num_tasks):
-            tasks.append({
-                "task_id": str(uuid.uuid4()),
-                "spec": f"Execute {goals.get('objective', 'task')} - Part {i+1}",
+        return max(1, math.floor(total_budget / self.cost_per_task))
+
+    def _task_ids(self, count):
+        """Yield ``count`` task IDs, drawing them in chunks when the generator supports it."""
+        bulk = getattr(self.id_generator, "bulk", None)
+        if bulk is None:
+            for _ in range(count):
+                yield self.id_generator()
+            return
+        for start in range(0, count, self.ID_CHUNK_SIZE):
+            yield from bulk(min(self.ID_CHUNK_SIZE, count - start))
+
+    def decompose_iter(self, goals: dict):
+        """Lazily yield task dicts one at a time so Workers can start immediately."""
+        objective = goals.get('objective', 'task')
+        for i, task_id in enumerate(self._task_ids(self.task_count(goals))):
+            yield {
+                "task_id": task_id,
+                "spec": f"Execute {objective} - Part {i+1}",
                 "budget": self.cost_per_task,
                 "priority": "medium",
-                "deadline": "2026-12-31T00:00:00Z"
-            })
-        return tasks
+                "deadline": DEFAULT_DEADLINE
+            }
+
+    def decompose(self, goals: dict):
+        """Standard method for Task 1.2 and Unit Tests"""
+        return list(self.decompose_iter(goals))
+
+    def decompose_batch(self, goals: dict):
+        """Decompose goals into a compact columnar ``TaskBatch``."""
+        return TaskBatch.from_tasks(self.decompose_iter(goals))
+
+    def assign_tasks_iter(self, goals: dict, workers: list, policy="round_robin"):
+        """Lazily yield (worker_id, task) pairs.
+
+        ``workers`` may hold worker ids or ``WorkerDescriptor`` objects;
+        ``policy`` is "round_robin" (even split), "least_loaded" or a callable.
+        """
+        if not workers:
+            raise ValueError("assign_tasks requires at least one worker")
+        return get_scheduling_policy(policy)(self.decompose_iter(goals), workers)
 
-    def assign_tasks(self, goals: dict, workers: list):
+    def assign_tasks(self, goals: dict, workers: list, policy="round_robin"):
         """The specific method the Integration Test is looking for"""
-        tasks = self.decompose(goals)
-        assignments = {worker: [] for worker in workers}
+        assignments = {worker_id(worker): [] for worker in workers}
         
-        for i, task in enumerate(tasks):
-            worker = workers[i % len(workers)]
+        for worker, task in self.assign_tasks_iter(goals, workers, policy):
             assignments[worker].append(task)
             
-        return assignments
\ No newline at end of file
+        return assignments
+
+    def assign_batches(self, goals: dict, workers: list, policy="round_robin"):
+        """Like ``assign_tasks`` but with one ``TaskBatch`` per worker."""
+        assignments = {worker_id(worker): TaskBatch() for worker in workers}
+
+        for worker, task in self.assign_tasks_iter(goals, workers, policy):
+            assignments[worker].append(**task)
+
+        return assignments
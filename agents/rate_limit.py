@@ -0,0 +1,209 @@
+"""
+Token-bucket rate limiting per agent and per upstream API.
+
+Implements the spec's ``rate_limit:<agent_id>`` keys, plus
+``rate_limit:upstream:<name>`` for third-party APIs. A bucket refills at
+``rate`` tokens per second, up to ``capacity`` (the allowed burst).
+
+``acquire`` reserves its tokens up front and then sleeps exactly until
+they are due. Concurrent callers queue up in reservation order without
+polling, and the limit holds however many coroutines or processes share
+the bucket.
+
+Backends:
+
+* ``RedisRateLimitBackend`` runs one atomic Lua script per reservation,
+  timed by the Redis server clock, so every worker process obeys one
+  global limit. Async acquires make that call off the event loop.
+* ``InProcessRateLimitBackend`` is used for tests and single-node runs.
+
+``get_rate_limit_backend`` picks Redis when ``REDIS_URL`` is set.
+"""
+import asyncio
+import os
+import threading
+import time
+
+KEY_PREFIX = "rate_limit"
+
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens < requested then
+    wait = (requested - tokens) / rate
+end
+if max_wait >= 0 and wait > max_wait then
+    return '-1'
+end
+tokens = tokens - requested
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class InProcessRateLimitBackend:
+    """Buckets in a dict; thread-safe, shared by every limiter in the process."""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._buckets = {}  # key -> [tokens, updated_at]
+        self._lock = threading.Lock()
+
+    def reserve(self, key, rate, capacity, tokens=1, max_wait=None):
+        """Take ``tokens`` and return the seconds until they are available.
+
+        Returns None, reserving nothing, if that wait would exceed ``max_wait``.
+        """
+        now = self.clock()
+        with self._lock:
+            available, updated_at = self._buckets.get(key, (capacity, now))
+            available = min(capacity, available + max(0.0, now - updated_at) * rate)
+            wait = max(0.0, (tokens - available) / rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._buckets[key] = [available - tokens, now]
+            return wait
+
+    async def reserve_async(self, key, rate, capacity, tokens=1, max_wait=None):
+        # No I/O and a short lock: safe to run on the event loop
+        return self.reserve(key, rate, capacity, tokens, max_wait)
+
+
+class RedisRateLimitBackend:
+    """Buckets as Redis hashes updated by one atomic Lua script."""
+
+    def __init__(self, client):
+        self.client = client
+        self._script = client.register_script(_RESERVE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url):
+        import redis
+
+        return cls(redis.Redis.from_url(url))
+
+    def reserve(self, key, rate, capacity, tokens=1, max_wait=None):
+        wait = float(self._script(
+            keys=[key], args=[rate, capacity, tokens, -1 if max_wait is None else max_wait]
+        ))
+        return None if wait < 0 else wait
+
+    async def reserve_async(self, key, rate, capacity, tokens=1, max_wait=None):
+        """``reserve`` on a worker thread, so the round trip never blocks the loop.
+
+        The sync client's pool is thread-safe and, unlike a ``redis.asyncio``
+        client, not tied to one event loop (``Worker.execute`` runs a new loop
+        per call).
+        """
+        return await asyncio.to_thread(self.reserve, key, rate, capacity, tokens, max_wait)
+
+
+def get_rate_limit_backend(url=None):
+    """Redis when ``url`` / ``REDIS_URL`` is set, otherwise in-process."""
+    url = url or os.getenv("REDIS_URL")
+    if url:
+        return RedisRateLimitBackend.from_url(url)
+    return InProcessRateLimitBackend()
+
+
+def agent_key(agent_id):
+    return f"{KEY_PREFIX}:{agent_id}"
+
+
+def upstream_key(name):
+    return f"{KEY_PREFIX}:upstream:{name}"
+
+
+class RateLimiter:
+    """Named token buckets over a shared backend.
+
+    Keys without a configured limit are unlimited, so callers can always
+    call ``acquire`` and let configuration decide.
+    """
+
+    def __init__(self, backend=None, limits=None):
+        self.backend = backend or get_rate_limit_backend()
+        self.limits = {}  # key -> (rate, capacity)
+        # limits: key -> rate, or key -> (rate, capacity)
+        for key, limit in (limits or {}).items():
+            rate, capacity = limit if isinstance(limit, tuple) else (limit, None)
+            self.configure(key, rate, capacity)
+
+    def configure(self, key, rate, capacity=None):
+        """Allow ``rate`` tokens/sec on ``key`` with bursts up to ``capacity``."""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.limits[key] = (float(rate), float(capacity if capacity is not None else rate))
+
+    def limit_agent(self, agent_id, rate, capacity=None):
+        self.configure(agent_key(agent_id), rate, capacity)
+
+    def limit_upstream(self, name, rate, capacity=None):
+        self.configure(upstream_key(name), rate, capacity)
+
+    def _limit(self, key, tokens):
+        limit = self.limits.get(key)
+        if limit is not None and tokens > limit[1]:
+            raise ValueError(f"Cannot acquire {tokens} tokens from '{key}' (capacity {limit[1]})")
+        return limit
+
+    def _reserve(self, key, tokens, max_wait):
+        limit = self._limit(key, tokens)
+        if limit is None:
+            return 0.0
+        return self.backend.reserve(key, *limit, tokens, max_wait)
+
+    async def _reserve_async(self, key, tokens, max_wait):
+        limit = self._limit(key, tokens)
+        if limit is None:
+            return 0.0
+        return await self.backend.reserve_async(key, *limit, tokens, max_wait)
+
+    def try_acquire(self, key, tokens=1):
+        """Take tokens only if they are available right now."""
+        return self._reserve(key, tokens, 0.0) is not None
+
+    async def acquire(self, key, tokens=1, timeout=None):
+        """Wait until ``tokens`` are granted on ``key``.
+
+        Returns False without consuming anything if the wait would exceed
+        ``timeout`` seconds.
+        """
+        wait = await self._reserve_async(key, tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    async def acquire_for(self, agent_id=None, upstream=None, tokens=1, timeout=None):
+        """Acquire on the agent's bucket and the upstream's bucket (when limited).
+
+        On a False return, a reservation already made on the agent bucket is
+        not given back.
+        """
+        keys = []
+        if agent_id is not None:
+            keys.append(agent_key(agent_id))
+        if upstream is not None:
+            keys.append(upstream_key(upstream))
+        # Reserve on every bucket first and wait once for the slowest
+        waits = []
+        for key in keys:
+            wait = await self._reserve_async(key, tokens, timeout)
+            if wait is None:
+                return False
+            waits.append(wait)
+        if waits and max(waits) > 0:
+            await asyncio.sleep(max(waits))
+        return True
@@ -1 +1,3 @@
 from .executor import Worker
+from .process_backend import ProcessPoolBackend
+from .retry_policy import CircuitBreaker, RetryBudget, RetryEngine, RetryPolicy
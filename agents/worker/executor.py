@@ -1,63 +1,253 @@
-import time
+import asyncio
+import inspect
 import random
 
+from .retry_policy import RetryEngine, RetryPolicy
+
+REQUIRED_FIELDS = frozenset(["task_id", "spec", "action"])
+
 class Worker:
-    def __init__(self, max_retries=3):
+    def __init__(self, max_retries=3, max_concurrency=100, process_backend=None,
+                 retry_engine=None, bulk_handlers=None, max_bulk_size=500, rate_limiter=None):
         self.max_retries = max_retries
-    
+        self.max_concurrency = max_concurrency
+        # action -> callable(list_of_task_specs) returning one output per spec
+        self.bulk_handlers = dict(bulk_handlers or {})
+        self.max_bulk_size = max_bulk_size
+        # Optional ProcessPoolBackend for CPU-bound actions
+        self.process_backend = process_backend
+        # Share one RetryEngine across Workers to pool budgets and breakers
+        self.retry_engine = retry_engine or RetryEngine(
+            default_policy=RetryPolicy(max_retries=max_retries)
+        )
+        # Optional shared RateLimiter pacing calls per agent and per upstream
+        self.rate_limiter = rate_limiter
+
     def execute(self, task_spec):
-        """Execute a task with retry logic for transient errors."""
+        """Execute a task with retry logic for transient errors.
+
+        Blocking wrapper around ``execute_async``; do not call it from
+        inside a running event loop.
+        """
+        return asyncio.run(self.execute_async(task_spec))
+
+    async def execute_async(self, task_spec):
+        """Execute a task on the event loop with non-blocking retry backoff."""
         # Validate task spec
         if not self._is_valid_task_spec(task_spec):
             return self._error_response("INVALID_SPEC", "Missing required fields")
-        
+
+        engine = self.retry_engine
+        key = engine.key_for(task_spec)
+        policy = engine.policy_for(key)
+        breaker = engine.breaker_for(key)
+        engine.record_request()
+
         # Execute with retry logic
-        for attempt in range(self.max_retries + 1):
+        delay = 0.0
+        for attempt in range(policy.max_retries + 1):
+            if self.rate_limiter is not None:
+                # Pace calls up front instead of retrying upstream 429s
+                await self.rate_limiter.acquire_for(task_spec.get("assigned_to"), key)
+            if not engine.acquire_call(key):
+                return self._error_response("CIRCUIT_OPEN", f"Circuit open for '{key}'")
             try:
-                result = self._execute_single(task_spec)
-                
+                result = await self._execute_single(task_spec)
+
                 # Simulate transient errors randomly
-                if self._simulate_transient_error():
-                    if attempt < self.max_retries:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        return self._error_response("API_ERROR", "Max retries exceeded")
-                
-                return result
-                
+                if not self._simulate_transient_error():
+                    breaker.record_success()
+                    result["attempts"] = attempt + 1
+                    return result
+                error = ("API_ERROR", "Max retries exceeded")
+
             except Exception as e:
-                if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    return self._error_response("EXECUTION_ERROR", str(e))
-    
-    def _execute_single(self, task_spec):
+                # CancelledError is a BaseException, so cancellation propagates
+                error = ("EXECUTION_ERROR", str(e))
+
+            breaker.record_failure()
+            if attempt == policy.max_retries:
+                return self._error_response(*error)
+            if not engine.acquire_retry():
+                return self._error_response("RETRY_BUDGET_EXHAUSTED", "Retry budget exhausted")
+            delay = policy.next_delay(attempt, delay)
+            await asyncio.sleep(delay)
+
+    async def execute_many_async(self, task_specs, max_concurrency=None):
+        """Execute many tasks on one event loop, at most ``max_concurrency`` at a time.
+
+        ``task_specs`` may be any iterable (including a Planner stream); it is
+        consumed lazily. Results are returned in input order.
+        """
+        limit = max_concurrency or self.max_concurrency
+        pending = enumerate(task_specs)
+        results = {}
+
+        async def consume():
+            # Each consumer pulls the next spec only when it has a free slot
+            for index, task_spec in pending:
+                results[index] = await self.execute_async(task_spec)
+
+        await asyncio.gather(*(consume() for _ in range(limit)))
+        return [results[i] for i in range(len(results))]
+
+    def register_bulk_handler(self, action, handler):
+        """Let ``execute_batch`` send all tasks for ``action`` in one call.
+
+        ``handler`` takes a list of task specs and returns (or awaits to) a
+        list with one output per spec, in the same order.
+        """
+        self.bulk_handlers[action] = handler
+
+    def execute_batch(self, task_specs, max_concurrency=None):
+        """Blocking iterator over ``execute_batch_async`` results."""
+        loop = asyncio.new_event_loop()
+        results = self.execute_batch_async(task_specs, max_concurrency)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.close()
+
+    async def execute_batch_async(self, task_specs, max_concurrency=None):
+        """Execute a batch of tasks, yielding results in completion order.
+
+        The batch is validated in one pass, then grouped by ``action``:
+        actions with a bulk handler get one call per group (chunked by
+        ``max_bulk_size``), the rest run through ``execute_async``. Every
+        result carries its ``task_id``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        groups = {}
+        for task_spec in task_specs:
+            if self._is_valid_task_spec(task_spec):
+                # Split by retry key too, so one bulk call maps to one breaker
+                group = (task_spec["action"], self.retry_engine.key_for(task_spec))
+                groups.setdefault(group, []).append(task_spec)
+            else:
+                result = self._error_response("INVALID_SPEC", "Missing required fields")
+                result["task_id"] = task_spec.get("task_id")
+                yield result
+
+        async def run_single(task_spec):
+            async with semaphore:
+                result = await self.execute_async(task_spec)
+            result["task_id"] = task_spec["task_id"]
+            return [result]
+
+        async def run_bulk(action, handler, chunk):
+            async with semaphore:
+                return await self._execute_bulk(action, handler, chunk)
+
+        jobs = []
+        for (action, _), specs in groups.items():
+            handler = self.bulk_handlers.get(action)
+            if handler is None:
+                jobs.extend(asyncio.ensure_future(run_single(spec)) for spec in specs)
+                continue
+            for start in range(0, len(specs), self.max_bulk_size):
+                chunk = specs[start:start + self.max_bulk_size]
+                jobs.append(asyncio.ensure_future(run_bulk(action, handler, chunk)))
+
+        try:
+            for next_done in asyncio.as_completed(jobs):
+                for result in await next_done:
+                    yield result
+        finally:
+            # Consumer stopped early or was cancelled: do not leak running jobs
+            for job in jobs:
+                job.cancel()
+            await asyncio.gather(*jobs, return_exceptions=True)
+
+    async def _execute_bulk(self, action, handler, task_specs):
+        """One bulk handler call for a group of same-action, same-key tasks."""
+        engine = self.retry_engine
+        key = engine.key_for(task_specs[0])
+        breaker = engine.breaker_for(key)
+        engine.record_request()
+        if self.rate_limiter is not None:
+            # One upstream call, so one token; the agent bucket only when unambiguous
+            agents = {task_spec.get("assigned_to") for task_spec in task_specs}
+            await self.rate_limiter.acquire_for(agents.pop() if len(agents) == 1 else None, key)
+        if not engine.acquire_call(key):
+            error = ("CIRCUIT_OPEN", f"Circuit open for '{key}'")
+            outputs = None
+        else:
+            try:
+                outputs = handler(task_specs)
+                if inspect.isawaitable(outputs):
+                    outputs = await outputs
+                if len(outputs) != len(task_specs):
+                    raise ValueError(
+                        f"Bulk handler for '{action}' returned {len(outputs)} "
+                        f"results for {len(task_specs)} tasks"
+                    )
+            except Exception as e:
+                breaker.record_failure()
+                error = ("EXECUTION_ERROR", str(e))
+                outputs = None
+            else:
+                breaker.record_success()
+
+        results = []
+        for i, task_spec in enumerate(task_specs):
+            if outputs is None:
+                result = self._error_response(*error)
+            else:
+                result = self._success_response(outputs[i])
+            result["task_id"] = task_spec["task_id"]
+            results.append(result)
+        return results
+
+    def execute_in_processes(self, task_specs):
+        """Run CPU-bound task specs on the process backend.
+
+        Yields result dicts (each carrying its ``task_id``) in completion order.
+        """
+        if self.process_backend is None:
+            raise RuntimeError("Worker has no process_backend configured")
+        return self.process_backend.map_unordered(task_specs)
+
+    async def _execute_single(self, task_spec):
         """Execute a single task attempt."""
         # Simulate work
-        time.sleep(0.01)  # Small delay
-        
+        await asyncio.sleep(0.01)  # Small delay
+
         # Determine confidence based on task complexity
         complexity = len(str(task_spec)) % 10 / 10.0
         confidence = 0.7 + (random.random() * 0.25)  # 0.7-0.95
-        
+
         return {
             "success": True,
             "output": f"Executed: {task_spec['spec']}",
             "confidence": confidence,
             "attempts": 1
         }
-    
+
     def _simulate_transient_error(self):
         """Simulate transient errors 10% of the time."""
         return random.random() < 0.1
-    
+
     def _is_valid_task_spec(self, task_spec):
         """Validate task specification has required fields."""
-        required = ["task_id", "spec", "action"]
-        return all(field in task_spec for field in required)
-    
+        return REQUIRED_FIELDS <= task_spec.keys()
+
+    def _success_response(self, output):
+        """Wrap a handler output; dict outputs may carry their own confidence."""
+        confidence = 1.0
+        if isinstance(output, dict) and "confidence" in output:
+            confidence = output["confidence"]
+        return {
+            "success": True,
+            "output": output,
+            "confidence": confidence,
+            "attempts": 1
+        }
+
     def _error_response(self, error_code, message):
         """Create standardized error response."""
         return {
@@ -0,0 +1,111 @@
+"""
+Process-pool execution backend for CPU-bound Worker actions.
+
+Task specs are shipped in chunks to a persistent ``ProcessPoolExecutor``.
+Each child process resolves its action handlers once in the pool
+initializer, so imported skills and instantiated skill objects stay warm
+across every task that process runs. Results stream back in completion
+order.
+
+Handlers map an ``action`` name to either a picklable top-level callable
+or an import path: ``"package.module:function"`` or
+``"package.module:Class.method"`` (the class is instantiated once per
+process).
+"""
+import importlib
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+# Per-process warm state, populated by _init_process
+_handlers = {}
+_worker = None
+
+
+def resolve_handler(target):
+    """Turn a handler spec into a callable, instantiating classes once."""
+    if callable(target):
+        return target
+    module_name, _, attr_path = target.partition(":")
+    obj = importlib.import_module(module_name)
+    for attr in attr_path.split("."):
+        obj = getattr(obj, attr)
+        if isinstance(obj, type):
+            obj = obj()
+    return obj
+
+
+def _init_process(handlers):
+    global _worker
+    from agents.worker.executor import Worker
+
+    _worker = Worker()
+    for action, target in handlers.items():
+        _handlers[action] = resolve_handler(target)
+
+
+def _run_task(task_spec):
+    if not _worker._is_valid_task_spec(task_spec):
+        result = _worker._error_response("INVALID_SPEC", "Missing required fields")
+    elif task_spec["action"] not in _handlers:
+        result = _worker._error_response(
+            "UNKNOWN_ACTION", f"No process handler for action '{task_spec['action']}'"
+        )
+    else:
+        try:
+            output = _handlers[task_spec["action"]](task_spec)
+        except Exception as e:
+            result = _worker._error_response("EXECUTION_ERROR", str(e))
+        else:
+            result = _worker._success_response(output)
+    result["task_id"] = task_spec.get("task_id")
+    return result
+
+
+def _run_chunk(task_specs):
+    return [_run_task(task_spec) for task_spec in task_specs]
+
+
+class ProcessPoolBackend:
+    """Persistent process pool that executes task specs by action."""
+
+    def __init__(self, handlers, max_workers=None, chunk_size=32, max_pending_chunks=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # Bound in-flight chunks so streamed inputs never pile up in memory
+        self.max_pending_chunks = max_pending_chunks or self.max_workers * 2
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_process,
+            initargs=(dict(handlers),),
+        )
+
+    def map_unordered(self, task_specs):
+        """Yield results for ``task_specs`` in completion order."""
+        specs = iter(task_specs)
+        pending = set()
+        try:
+            while True:
+                while len(pending) < self.max_pending_chunks:
+                    chunk = list(islice(specs, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.add(self._executor.submit(_run_chunk, chunk))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            # Consumer stopped early: drop chunks that have not started yet
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -0,0 +1,228 @@
+"""
+Retry policies, retry budgets and circuit breakers for the Worker.
+
+* ``RetryPolicy`` computes backoff delays with optional full or
+  decorrelated jitter so workers do not retry in lock-step.
+* ``RetryBudget`` caps retries to a fraction of total requests (plus a
+  small time-based reserve), so a degraded upstream is not hammered.
+* ``CircuitBreaker`` fails fast while an action's recent failure rate is
+  too high and lets a limited number of probe calls through once the
+  reset timeout elapses (half-open).
+* ``RetryEngine`` ties them together per action and exposes a monitoring
+  snapshot.
+"""
+import random
+import threading
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+JITTER_MODES = ("none", "full", "decorrelated")
+
+
+class RetryPolicy:
+    def __init__(self, max_retries=3, base=1.0, cap=30.0, jitter="full"):
+        if jitter not in JITTER_MODES:
+            raise ValueError(f"Unknown jitter mode: {jitter!r}")
+        self.max_retries = max_retries
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+
+    def next_delay(self, attempt, previous_delay=0.0):
+        """Seconds to wait before retry ``attempt + 1``."""
+        if self.jitter == "decorrelated":
+            upper = max(self.base, previous_delay * 3)
+            return min(self.cap, random.uniform(self.base, upper))
+        delay = min(self.cap, self.base * 2 ** attempt)
+        if self.jitter == "full":
+            return random.uniform(0, delay)
+        return delay
+
+
+class RetryBudget:
+    """Token bucket that allows retries as a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one.
+    ``min_retries_per_sec`` tokens trickle in regardless, so low-traffic
+    actions can still retry.
+    """
+
+    def __init__(self, ratio=0.2, min_retries_per_sec=10.0, max_tokens=None, clock=time.monotonic):
+        self.ratio = ratio
+        self.min_retries_per_sec = min_retries_per_sec
+        self.max_tokens = max_tokens if max_tokens is not None else max(10.0, min_retries_per_sec * 10)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.max_tokens
+        self._last = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._last) * self.min_retries_per_sec)
+        self._last = now
+
+    def record_request(self):
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self):
+        """Consume one retry token; False means the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    @property
+    def tokens(self):
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class CircuitBreaker:
+    """Rolling-window failure-rate breaker with a half-open probe state."""
+
+    def __init__(self, window_size=20, failure_rate_threshold=0.5, min_calls=20,
+                 reset_timeout=30.0, half_open_max_calls=1, clock=time.monotonic):
+        self.window_size = window_size
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min(min_calls, window_size)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window = deque(maxlen=window_size)  # True for failure
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        now = self._clock()
+        if self._state != CLOSED and now - self._opened_at >= self.reset_timeout:
+            # Also re-arms probes that never reported back (e.g. cancelled calls)
+            self._state = HALF_OPEN
+            self._opened_at = now
+            self._probes = 0
+
+    def _trip(self):
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.times_opened += 1
+
+    def allow(self):
+        """Return True if a call may proceed."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._state = CLOSED
+                self._window.clear()
+            self._window.append(False)
+
+    def record_failure(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trip()
+                return
+            self._window.append(True)
+            if (self._state == CLOSED and len(self._window) >= self.min_calls
+                    and sum(self._window) / len(self._window) >= self.failure_rate_threshold):
+                self._trip()
+
+    def snapshot(self):
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state,
+                "window_calls": len(self._window),
+                "window_failures": sum(self._window),
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class RetryEngine:
+    """Per-action retry policies, a shared retry budget and per-action breakers."""
+
+    def __init__(self, default_policy=None, budget=None, breaker_factory=CircuitBreaker):
+        self.default_policy = default_policy or RetryPolicy()
+        self.budget = budget or RetryBudget()
+        self.breaker_factory = breaker_factory
+        self._policies = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "retries": 0, "budget_exhausted": 0, "circuit_rejections": 0}
+
+    @staticmethod
+    def key_for(task_spec):
+        """Breakers and policies are keyed by skill when given, else by action."""
+        return task_spec.get("skill") or task_spec.get("action")
+
+    def set_policy(self, key, policy):
+        self._policies[key] = policy
+
+    def policy_for(self, key):
+        return self._policies.get(key, self.default_policy)
+
+    def breaker_for(self, key):
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, self.breaker_factory())
+        return breaker
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def record_request(self):
+        self._count("requests")
+        self.budget.record_request()
+
+    def acquire_call(self, key):
+        """Check the action's breaker before an attempt."""
+        if self.breaker_for(key).allow():
+            return True
+        self._count("circuit_rejections")
+        return False
+
+    def acquire_retry(self):
+        """Spend retry budget before a retry."""
+        if self.budget.try_withdraw():
+            self._count("retries")
+            return True
+        self._count("budget_exhausted")
+        return False
+
+    def snapshot(self):
+        """Counters, remaining budget and breaker states for monitoring."""
+        with self._lock:
+            counters = dict(self._counters)
+            breakers = dict(self._breakers)
+        counters["budget_tokens"] = self.budget.tokens
+        counters["breakers"] = {key: breaker.snapshot() for key, breaker in breakers.items()}
+        return counters
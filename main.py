@@ -1,6 +1,22 @@
 # main.py update
 import uuid
-from models.database import init_db, Task, Campaign
+from collections import Counter
+from models.bulk import bulk_insert_tasks
+from models.database import init_db, Campaign
+
+WORKERS = ["worker_1", "worker_2", "worker_3"]
+
+def task_rows(campaign_id, assignments, counts):
+    """Turn streamed (worker_id, task) pairs into ``tasks`` rows."""
+    for worker_id, t in assignments:
+        counts[worker_id] += 1
+        yield {
+            "id": t["task_id"],
+            "campaign_id": campaign_id,
+            "assigned_to": worker_id,
+            "action": t["spec"],
+            "status": "pending"
+        }
 
 def run_swarm():
     print("🚀 Project Chimera: Swarm Initialized")
@@ -14,27 +30,23 @@ def run_swarm():
         status="active"
     )
     db_session.add(new_campaign)
+    # Tasks reference the campaign, so it must hit the DB before the bulk insert
+    db_session.flush()
     
     # 2. Let the Planner do its thing
-    from agents.planner.task_decomposer import TaskDecomposer
-    planner = TaskDecomposer()
-    assignments = planner.decompose_goal(new_campaign.objective, new_campaign.budget)
+    from agents.planner.task_decomposer import Planner
+    planner = Planner()
+    goals = {"objective": new_campaign.objective, "budget": new_campaign.budget}
+    assignments = planner.assign_tasks_iter(goals, WORKERS)
 
-    # 3. Save Assignments to Postgres
-    for worker_id, task_list in assignments.items():
-        print(f"🤖 {worker_id} assigned {len(task_list)} tasks.")
-        for t in task_list:
-            db_task = Task(
-                id=t.task_id,
-                campaign_id=new_campaign.id,
-                assigned_to=worker_id,
-                action=t.action,
-                status="pending"
-            )
-            db_session.add(db_task)
+    # 3. Stream assignments to Postgres in bounded chunks
+    counts = Counter()
+    bulk_insert_tasks(db_session, task_rows(new_campaign.id, assignments, counts))
+    for worker_id in WORKERS:
+        print(f"🤖 {worker_id} assigned {counts[worker_id]} tasks.")
     
     db_session.commit()
     print("✅ Tasks persisted to PostgreSQL.")
 
 if __name__ == "__main__":
-    run_swarm()
\ No newline at end of file
+    run_swarm()
@@ -0,0 +1,148 @@
+"""
+Async data access for ``Campaign`` and ``Task`` on SQLAlchemy's asyncio engine.
+
+Lets asyncio agents (Worker.execute_async, the wallet skill) persist
+results without blocking the event loop. ``DATABASE_URL`` keeps its sync
+form; ``async_database_url`` maps it onto an async driver (asyncpg for
+PostgreSQL, aiosqlite for SQLite).
+"""
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from models.bulk import iter_row_chunks
+from models.database import Base, Campaign, Task, create_task_indexes, database_url
+from models.result_store import load_results, migrate_inline_results, store_blobs
+
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+_RESULT_COLUMNS = ("id", "status", "result_ref", "result_size")
+
+
+def async_database_url(url=None):
+    """Swap the sync driver in ``url`` for its asyncio counterpart."""
+    url = make_url(url or database_url())
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def create_async_db(url=None, **engine_options):
+    """Return ``(engine, session_factory)`` for an async database."""
+    engine = create_async_engine(async_database_url(url), **engine_options)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def create_schema_async(engine):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(migrate_inline_results)
+        await conn.run_sync(create_task_indexes)
+
+
+async def _store_blobs(session, blobs):
+    if blobs:
+        await session.run_sync(lambda sync_session: store_blobs(sync_session.connection(), blobs))
+
+
+def _by_columns(chunk):
+    """Split a chunk by key set: one executemany needs rows of one shape."""
+    groups = {}
+    for row in chunk:
+        groups.setdefault(tuple(row), []).append(row)
+    return groups.items()
+
+
+class CampaignRepository:
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    async def add(self, campaign_id, objective, budget, status="active"):
+        async with self.session_factory.begin() as session:
+            session.add(Campaign(id=campaign_id, objective=objective, budget=budget, status=status))
+
+    async def get(self, campaign_id):
+        async with self.session_factory() as session:
+            return await session.get(Campaign, campaign_id)
+
+
+class TaskRepository:
+    def __init__(self, session_factory, chunk_size=1000):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    async def add_many(self, rows):
+        """Insert task row dicts in chunks; returns the number written."""
+        total = 0
+        async with self.session_factory.begin() as session:
+            for chunk, blobs in iter_row_chunks(rows, self.chunk_size):
+                await _store_blobs(session, blobs)
+                await session.execute(Task.__table__.insert(), chunk)
+                total += len(chunk)
+        return total
+
+    async def upsert_results(self, rows):
+        """Bulk upsert ``status``/``result`` keyed by task ``id``.
+
+        Result payloads go to the blob store. Existing tasks only have the
+        columns a row actually carries overwritten (``status``, the result
+        reference, or both); unknown ids are inserted with whatever other
+        columns the rows carry. Dialects without ON CONFLICT fall back to
+        an update by primary key.
+        """
+        total = 0
+        async with self.session_factory.begin() as session:
+            dialect = session.get_bind().dialect.name
+            make_insert = _UPSERT_INSERTS.get(dialect)
+            for chunk, blobs in iter_row_chunks(rows, self.chunk_size, fill_defaults=False):
+                await _store_blobs(session, blobs)
+                for columns, group in _by_columns(chunk):
+                    updates = [column for column in _RESULT_COLUMNS[1:] if column in columns]
+                    if make_insert is None:
+                        if updates:
+                            # ORM bulk UPDATE by primary key (executemany)
+                            await session.execute(update(Task), [
+                                {column: row[column] for column in ("id", *updates)}
+                                for row in group
+                            ])
+                        continue
+                    stmt = make_insert(Task.__table__)
+                    if updates:
+                        stmt = stmt.on_conflict_do_update(
+                            index_elements=[Task.__table__.c.id],
+                            set_={column: stmt.excluded[column] for column in updates},
+                        )
+                    else:
+                        stmt = stmt.on_conflict_do_nothing(index_elements=[Task.__table__.c.id])
+                    await session.execute(stmt, group)
+                total += len(chunk)
+        return total
+
+    async def get(self, task_id):
+        async with self.session_factory() as session:
+            return await session.get(Task, task_id)
+
+    async def get_results(self, refs):
+        """Load result payloads for ``result_ref`` values; returns ``{ref: payload}``."""
+        async with self.session_factory() as session:
+            return await session.run_sync(load_results, refs)
+
+    async def stream(self, campaign_id=None, status=None, batch_size=None):
+        """Async-iterate task rows as dicts, fetching ``batch_size`` at a time.
+
+        Rows carry ``result_ref``; payloads are loaded on demand with ``get_results``.
+        """
+        query = select(Task.__table__).order_by(Task.id)
+        if campaign_id is not None:
+            query = query.where(Task.campaign_id == campaign_id)
+        if status is not None:
+            query = query.where(Task.status == status)
+        query = query.execution_options(yield_per=batch_size or self.chunk_size)
+
+        async with self.session_factory() as session:
+            result = await session.stream(query)
+            async for partition in result.mappings().partitions():
+                for row in partition:
+                    yield dict(row)
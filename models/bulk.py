@@ -0,0 +1,97 @@
+"""
+Bulk persistence for planner output.
+
+``bulk_insert_tasks`` streams task rows into the ``tasks`` table in
+fixed-size chunks, bypassing ORM unit-of-work bookkeeping. Every dialect
+gets a Core ``INSERT`` executed as executemany (SQLAlchemy batches it into
+multi-row statements where the driver allows); PostgreSQL on psycopg2 uses
+``COPY ... FROM STDIN`` instead. Only one chunk is held in memory at a
+time, whatever the campaign size. ``result`` payloads in the rows are moved
+to the ``result_blobs`` store (see ``models.result_store``) chunk by chunk.
+"""
+import io
+from itertools import islice
+
+from sqlalchemy import insert
+
+from models.database import Task
+from models.result_store import externalize, store_blobs
+
+TASK_COLUMNS = ("id", "campaign_id", "assigned_to", "action", "status", "result_ref", "result_size")
+_DEFAULTS = {"status": "pending"}
+
+
+def iter_row_chunks(rows, size, fill_defaults=True):
+    """Group row dicts into lists of ``size`` normalised to ``TASK_COLUMNS``.
+
+    Yields ``(chunk, blobs)``: ``result`` payloads are swapped for
+    references, and ``blobs`` must be stored before ``chunk`` is inserted.
+    With ``fill_defaults=False`` rows keep only the columns they carry
+    (for partial updates) instead of filling in every missing one.
+    """
+    rows = iter(rows)
+    while True:
+        chunk, blobs = externalize(islice(rows, size))
+        if not chunk:
+            return
+        if fill_defaults:
+            chunk = [
+                {column: row.get(column, _DEFAULTS.get(column)) for column in TASK_COLUMNS}
+                for row in chunk
+            ]
+        else:
+            chunk = [{column: row[column] for column in TASK_COLUMNS if column in row}
+                     for row in chunk]
+        yield chunk, blobs
+
+
+def supports_copy(connection):
+    """COPY needs PostgreSQL and a driver exposing ``copy_expert``."""
+    return connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2"
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def _insert_chunk(connection, chunk):
+    connection.execute(insert(Task.__table__), chunk)
+
+
+def _copy_chunk(connection, chunk):
+    buffer = io.StringIO()
+    for row in chunk:
+        buffer.write("\t".join(_copy_value(row[column]) for column in TASK_COLUMNS))
+        buffer.write("\n")
+    buffer.seek(0)
+    # Same DBAPI connection, so COPY joins the session's transaction
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {Task.__tablename__} ({', '.join(TASK_COLUMNS)}) FROM STDIN", buffer
+        )
+    finally:
+        cursor.close()
+
+
+def bulk_insert_tasks(session, rows, chunk_size=5000, use_copy=None):
+    """Insert task row dicts (keys from ``TASK_COLUMNS``) in chunks.
+
+    Runs inside ``session``'s transaction; the caller commits. Flush any
+    pending ORM objects the rows depend on (e.g. the campaign) first.
+    Returns the number of rows written.
+    """
+    connection = session.connection()
+    if use_copy is None:
+        use_copy = supports_copy(connection)
+    write_chunk = _copy_chunk if use_copy else _insert_chunk
+
+    total = 0
+    for chunk, blobs in iter_row_chunks(rows, chunk_size):
+        store_blobs(connection, blobs)
+        write_chunk(connection, chunk)
+        total += len(chunk)
+    return total
@@ -1,9 +1,46 @@
-from sqlalchemy import Column, String, Float, ForeignKey, create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base, relationship
+from sqlalchemy import (
+    Column, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, create_engine,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base, relationship
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.util import ScopedRegistry
+import asyncio
 import os
+import threading
+import uuid
+import weakref
 
 Base = declarative_base()
 
+class BinaryUUID(TypeDecorator):
+    """UUID strings stored as 16 raw bytes (native ``uuid`` on PostgreSQL).
+
+    Python code keeps seeing canonical 36-char strings; the index only
+    stores 16 bytes per key.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return uuid.UUID(value).bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return str(uuid.UUID(bytes=value))
+
+# Opt-in compact primary keys for tasks; pair with Planner(id_generator="uuid7")
+TASK_ID_TYPE = BinaryUUID() if os.getenv("CHIMERA_BINARY_TASK_IDS") == "1" else String
+
 class Campaign(Base):
     __tablename__ = 'campaigns'
     id = Column(String, primary_key=True)
@@ -16,20 +53,177 @@ class Campaign(Base):
 
 class Task(Base):
     __tablename__ = 'tasks'
-    id = Column(String, primary_key=True)
+    id = Column(TASK_ID_TYPE, primary_key=True)
     campaign_id = Column(String, ForeignKey('campaigns.id'))
     assigned_to = Column(String)
     action = Column(String)
     status = Column(String, default="pending")
-    result = Column(String, nullable=True)
+    # Payloads live out of line in result_blobs (see models.result_store);
+    # the row only keeps the content hash and the uncompressed size
+    result_ref = Column(String(64), ForeignKey('result_blobs.digest'), nullable=True)
+    result_size = Column(Integer, nullable=True)
 
     # Relationship back to campaign
     campaign = relationship("Campaign", back_populates="tasks")
+    result_blob = relationship("ResultBlob", lazy="select")
+
+    @property
+    def result(self):
+        """Result payload, fetched and decompressed on first access."""
+        return self.result_blob.payload if self.result_blob is not None else None
+
+    # Queue scans: pending work per campaign and per worker (see models.task_queue)
+    __table_args__ = (
+        Index("ix_tasks_campaign_status", "campaign_id", "status"),
+        Index("ix_tasks_assigned_status", "assigned_to", "status"),
+    )
+
+class ResultBlob(Base):
+    """Compressed, content-addressed task output shared by identical results."""
+    __tablename__ = 'result_blobs'
+    digest = Column(String(64), primary_key=True)  # sha256 of the raw payload
+    codec = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+
+    @property
+    def payload(self):
+        from models.result_store import decode
+        return decode(self.codec, self.data)
+
+class AuditLog(Base):
+    """Judge decisions, written in batches by agents.judge.audit_log."""
+    __tablename__ = 'audit_logs'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(String, index=True)
+    action = Column(String, nullable=False)
+    reason = Column(String)
+    confidence = Column(Float)
+    agent_id = Column(String)
+    review_status = Column(String)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
+
+DEFAULT_DATABASE_URL = "postgresql://user:pass@db:5432/chimera"
+
+# Process-wide engine state, keyed by database URL
+_engine_lock = threading.Lock()
+_engines = {}
+_engine_pid = os.getpid()
+_session_factories = {}
+_schema_ready = set()
+
+def database_url():
+    return os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
+
+def pool_options(url):
+    """Pool settings from CHIMERA_DB_* env vars (QueuePool-only ones skipped for SQLite)."""
+    options = {
+        "pool_pre_ping": os.getenv("CHIMERA_DB_POOL_PRE_PING", "1") == "1",
+        "pool_recycle": int(os.getenv("CHIMERA_DB_POOL_RECYCLE", "1800")),
+    }
+    if make_url(url).get_backend_name() != "sqlite":
+        options["pool_size"] = int(os.getenv("CHIMERA_DB_POOL_SIZE", "5"))
+        options["max_overflow"] = int(os.getenv("CHIMERA_DB_MAX_OVERFLOW", "10"))
+    return options
+
+def _check_fork():
+    """Drop engines inherited across fork(); their sockets belong to the parent."""
+    global _engine_pid
+    if os.getpid() != _engine_pid:
+        for engine in _engines.values():
+            engine.dispose(close=False)
+        _engines.clear()
+        _session_factories.clear()
+        _engine_pid = os.getpid()
+
+def get_engine(url=None, **overrides):
+    """Return this process's engine for ``url``, creating it on first use.
+
+    ``overrides`` (pool_size, max_overflow, pool_pre_ping, pool_recycle, ...)
+    only apply when the engine is first created.
+    """
+    url = url or database_url()
+    with _engine_lock:
+        _check_fork()
+        engine = _engines.get(url)
+        if engine is None:
+            engine = create_engine(url, **{**pool_options(url), **overrides})
+            _engines[url] = engine
+        return engine
+
+def dispose_engines():
+    """Close every pooled connection and forget the engines (tests, shutdown)."""
+    with _engine_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
+        _schema_ready.clear()
+
+def create_task_indexes(connection):
+    """Add the task queue indexes to a ``tasks`` table created without them.
+
+    ``create_all`` skips tables that already exist, so older databases
+    only pick these up here.
+    """
+    for index in Task.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+def create_schema(engine=None):
+    """One-time migration step: create missing tables and upgrade old layouts."""
+    from models.result_store import migrate_inline_results
+
+    engine = engine or get_engine()
+    with engine.begin() as connection:
+        Base.metadata.create_all(connection)
+        # Databases created before results moved to result_blobs
+        migrate_inline_results(connection)
+        create_task_indexes(connection)
+    _schema_ready.add(engine.url.render_as_string(hide_password=False))
+
+def _current_scope():
+    """Scope sessions per asyncio task when on an event loop, else per thread."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task if task is not None else threading.current_thread()
+
+class _WeakScopedRegistry(ScopedRegistry):
+    """ScopedRegistry keyed weakly on the task / thread object itself.
+
+    Unlike ``id()`` or thread idents, a key is never reused by a later task
+    or thread, and an entry goes away with its owner if ``.remove()`` is skipped.
+    """
+
+    def __init__(self, createfunc, scopefunc):
+        super().__init__(createfunc, scopefunc)
+        self.registry = weakref.WeakKeyDictionary()
+
+def get_session_factory(url=None):
+    """Scoped session registry: one Session per thread / asyncio task.
+
+    Call ``.remove()`` on the returned registry when a unit of work ends.
+    """
+    engine = get_engine(url)
+    key = engine.url.render_as_string(hide_password=False)
+    with _engine_lock:
+        factory = _session_factories.get(key)
+        if factory is None:
+            factory = scoped_session(sessionmaker(bind=engine))
+            factory.registry = _WeakScopedRegistry(factory.session_factory, _current_scope)
+            _session_factories[key] = factory
+        return factory
 
 def init_db():
-    db_url = os.getenv("DATABASE_URL", "postgresql://user:pass@db:5432/chimera")
-    engine = create_engine(db_url)
-    # This is where the magic happens - it creates the tables
-    Base.metadata.create_all(engine)
+    """Return a new Session on the shared engine, creating the schema on first use."""
+    engine = get_engine()
+    if engine.url.render_as_string(hide_password=False) not in _schema_ready:
+        create_schema(engine)
     Session = sessionmaker(bind=engine)
-    return Session()
\ No newline at end of file
+    return Session()
+
+if __name__ == "__main__":
+    # python -m models.database  -> run the schema migration once
+    create_schema()
+    print(f"✅ Schema ready on {get_engine().url.render_as_string(hide_password=True)}")
@@ -0,0 +1,182 @@
+"""
+Content-addressed, compressed storage for task results.
+
+Task rows only carry ``result_ref`` (sha256 of the payload) and
+``result_size``, so queue scans never read result payloads. The payload
+lives once in ``result_blobs``, however many tasks produced it.
+Compression uses zstd when the optional ``zstandard`` package is installed
+and zlib otherwise. The codec is recorded per blob, so blobs written with
+either codec can be read back. Payloads that do not shrink are stored raw.
+
+``migrate_inline_results`` upgrades databases created before this layout
+(with an inline ``tasks.result`` column); ``create_schema`` runs it.
+"""
+import hashlib
+from itertools import islice
+import zlib
+
+from sqlalchemy import bindparam, column, insert, inspect, select, table, text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models.database import ResultBlob
+
+try:
+    import zstandard
+except ImportError:  # optional; zlib is always available
+    zstandard = None
+
+DEFAULT_CODEC = "zstd" if zstandard is not None else "zlib"
+_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+_LOOKUP_CHUNK = 500  # digests per IN (...) clause
+
+
+def _compress(codec, raw):
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(raw)
+    if codec == "zlib":
+        return zlib.compress(raw, 6)
+    raise ValueError(f"Unknown result codec '{codec}'")
+
+
+def _blob(raw, digest, codec):
+    data = _compress(codec, raw)
+    if len(data) >= len(raw):
+        codec, data = "raw", raw
+    return {"digest": digest, "codec": codec, "size": len(raw), "data": data}
+
+
+def encode(payload, codec=DEFAULT_CODEC):
+    """Return the ``result_blobs`` row for a str payload."""
+    raw = payload.encode("utf-8")
+    return _blob(raw, hashlib.sha256(raw).hexdigest(), codec)
+
+
+def decode(codec, data):
+    """Inverse of ``encode``: blob codec and bytes back to the str payload."""
+    if codec == "raw":
+        raw = data
+    elif codec == "zlib":
+        raw = zlib.decompress(data)
+    elif codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Result blob is zstd-compressed; install 'zstandard' to read it")
+        raw = zstandard.ZstdDecompressor().decompress(bytes(data))
+    else:
+        raise ValueError(f"Unknown result codec '{codec}'")
+    return bytes(raw).decode("utf-8")
+
+
+def externalize(rows, codec=DEFAULT_CODEC):
+    """Replace each row's ``result`` payload with ``result_ref``/``result_size``.
+
+    Returns ``(rows, blobs)``. The rows are new dicts, and ``blobs`` holds
+    one entry per distinct payload. Rows without a ``result`` key pass
+    through unchanged.
+    """
+    out, blobs = [], {}
+    for row in rows:
+        if "result" in row:
+            row = dict(row)
+            payload = row.pop("result")
+            if payload is None:
+                row["result_ref"] = row["result_size"] = None
+            else:
+                raw = payload.encode("utf-8")
+                digest = hashlib.sha256(raw).hexdigest()
+                if digest not in blobs:
+                    blobs[digest] = _blob(raw, digest, codec)
+                row["result_ref"], row["result_size"] = digest, len(raw)
+        out.append(row)
+    return out, list(blobs.values())
+
+
+def _chunked(values):
+    values = iter(values)
+    while chunk := list(islice(values, _LOOKUP_CHUNK)):
+        yield chunk
+
+
+def store_blobs(connection, blobs):
+    """Write blob rows not stored yet on ``connection``; returns how many were new.
+
+    Digests that already exist are skipped before any payload is sent. On
+    PostgreSQL and SQLite the insert also uses ON CONFLICT DO NOTHING, so
+    concurrent writers of the same payload do not collide.
+    """
+    existing = set()
+    for chunk in _chunked(blob["digest"] for blob in blobs):
+        existing.update(connection.execute(
+            select(ResultBlob.digest).where(ResultBlob.digest.in_(chunk))
+        ).scalars())
+    missing = [blob for blob in blobs if blob["digest"] not in existing]
+    if not missing:
+        return 0
+
+    make_insert = _CONFLICT_INSERTS.get(connection.dialect.name)
+    if make_insert is None:
+        stmt = insert(ResultBlob.__table__)
+    else:
+        stmt = make_insert(ResultBlob.__table__).on_conflict_do_nothing(index_elements=["digest"])
+    connection.execute(stmt, missing)
+    return len(missing)
+
+
+def load_results(connection, refs):
+    """Fetch and decompress payloads for ``refs``; returns ``{ref: payload}``.
+
+    ``connection`` may be a Connection or a Session.
+    """
+    payloads = {}
+    for chunk in _chunked({ref for ref in refs if ref is not None}):
+        rows = connection.execute(
+            select(ResultBlob.digest, ResultBlob.codec, ResultBlob.data)
+            .where(ResultBlob.digest.in_(chunk))
+        )
+        payloads.update((digest, decode(codec, data)) for digest, codec, data in rows)
+    return payloads
+
+
+def migrate_inline_results(connection, chunk_size=1000):
+    """Move a legacy ``tasks.result`` column into ``result_blobs``.
+
+    Adds ``result_ref`` / ``result_size`` when missing, externalizes every
+    stored payload in id-ordered chunks and drops ``result``. Does nothing
+    on an up-to-date schema. Run it inside one transaction (``engine.begin()``)
+    so a failure leaves the old layout intact. Returns the number of
+    payloads moved.
+    """
+    columns = {info["name"] for info in inspect(connection).get_columns("tasks")}
+    if "result" not in columns:
+        return 0
+    if "result_ref" not in columns:
+        connection.execute(text(
+            "ALTER TABLE tasks ADD COLUMN result_ref VARCHAR(64) REFERENCES result_blobs (digest)"
+        ))
+    if "result_size" not in columns:
+        connection.execute(text("ALTER TABLE tasks ADD COLUMN result_size INTEGER"))
+
+    # Untyped columns: ids round-trip as stored, whatever TASK_ID_TYPE is
+    legacy = table("tasks", column("id"), column("result"),
+                   column("result_ref"), column("result_size"))
+    move = (legacy.update().where(legacy.c.id == bindparam("task_id"))
+            .values(result_ref=bindparam("ref"), result_size=bindparam("size")))
+    moved, last_id = 0, None
+    while True:
+        query = (select(legacy.c.id, legacy.c.result).where(legacy.c.result.is_not(None))
+                 .order_by(legacy.c.id).limit(chunk_size))
+        if last_id is not None:
+            query = query.where(legacy.c.id > last_id)
+        rows = connection.execute(query).all()
+        if not rows:
+            break
+        chunk, blobs = externalize({"id": task_id, "result": result} for task_id, result in rows)
+        store_blobs(connection, blobs)
+        connection.execute(move, [
+            {"task_id": row["id"], "ref": row["result_ref"], "size": row["result_size"]}
+            for row in chunk
+        ])
+        moved += len(chunk)
+        last_id = rows[-1][0]
+
+    connection.execute(text("ALTER TABLE tasks DROP COLUMN result"))
+    return moved
@@ -0,0 +1,97 @@
+"""
+Database-backed work queue on the ``tasks`` table.
+
+Workers call ``claim_tasks`` to atomically move up to ``n`` pending tasks
+to ``running``. On PostgreSQL the candidate rows are picked with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent claimers never block
+on, or double-claim, each other's rows. SQLite ignores ``FOR UPDATE``, but
+it runs the single ``UPDATE ... RETURNING`` statement under its database
+write lock, which gives the same no-double-claim guarantee for local runs.
+
+Tasks are claimed in primary-key order, so time-ordered (uuid7) IDs give
+FIFO behaviour.
+"""
+from sqlalchemy import select, update
+
+from models.database import Task
+from models.result_store import externalize, store_blobs
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def claim_tasks(session, worker_id, n, campaign_id=None, any_worker=False):
+    """Claim up to ``n`` pending tasks for ``worker_id`` and commit.
+
+    By default only tasks already assigned to ``worker_id`` are claimed
+    (served by the ``(assigned_to, status)`` index). With
+    ``any_worker=True`` any pending task may be taken and is reassigned to
+    ``worker_id`` (work stealing; narrow it with ``campaign_id``, served by
+    the ``(campaign_id, status)`` index). Returns the claimed rows as dicts.
+    """
+    candidates = select(Task.id).where(Task.status == PENDING)
+    if not any_worker:
+        candidates = candidates.where(Task.assigned_to == worker_id)
+    if campaign_id is not None:
+        candidates = candidates.where(Task.campaign_id == campaign_id)
+    candidates = candidates.order_by(Task.id).limit(n).with_for_update(skip_locked=True)
+
+    columns = (Task.id, Task.campaign_id, Task.assigned_to, Task.action)
+    values = {"status": RUNNING, "assigned_to": worker_id}
+
+    if session.get_bind().dialect.update_returning:
+        claim = (
+            update(Task)
+            .where(Task.id.in_(candidates.scalar_subquery()))
+            .values(**values)
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        )
+        rows = session.execute(claim).mappings().all()
+    else:
+        # No RETURNING: pick ids, claim only those still pending, read back ours
+        ids = session.execute(candidates).scalars().all()
+        session.execute(
+            update(Task)
+            .where(Task.id.in_(ids), Task.status == PENDING)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        rows = session.execute(
+            select(*columns).where(
+                Task.id.in_(ids), Task.assigned_to == worker_id, Task.status == RUNNING
+            )
+        ).mappings().all()
+    session.commit()
+    # RETURNING order is unspecified; hand tasks back in queue order
+    return sorted((dict(row) for row in rows), key=lambda row: row["id"])
+
+
+def complete_task(session, task_id, result=None, status=DONE):
+    """Record a claimed task's outcome and commit.
+
+    ``result`` is stored out of line; the row only gets its reference.
+    """
+    (values,), blobs = externalize([{"status": status, "result": result}])
+    store_blobs(session.connection(), blobs)
+    session.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+
+
+def release_tasks(session, worker_id):
+    """Return a worker's running tasks to the queue (e.g. on shutdown)."""
+    released = session.execute(
+        update(Task)
+        .where(Task.assigned_to == worker_id, Task.status == RUNNING)
+        .values(status=PENDING)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    session.commit()
+    return released
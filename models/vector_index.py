@@ -0,0 +1,302 @@
+"""
+Embedded vector index for semantic search without a network service.
+
+A local stand-in for the Weaviate ``Skills`` and ``AgentMemory`` classes
+in the technical spec.
+
+* Exact mode: brute-force top-k with NumPy, run over the whole matrix in
+  bounded query chunks.
+* Approximate mode: ``build_ivf()`` clusters the vectors with k-means into
+  ``nlist`` inverted lists, and searches scan only the ``nprobe`` closest
+  lists.
+* Metrics are ``cosine`` (vectors normalised on insert), ``ip`` (inner
+  product) and ``l2``. Scores are always "higher is better"; l2 returns
+  the negative squared distance.
+* ``search(..., where={"agent_id": "w1"})`` restricts results to rows whose
+  metadata match every key. On an IVF index, a filtered search keeps
+  probing lists past ``nprobe``, nearest first, until ``k`` rows match. A
+  filter that matches no more rows than ``nprobe`` lists hold on average
+  skips the probe and scores its matches exactly.
+* ``save(path)`` writes a directory of ``.npy`` files plus JSON metadata,
+  and ``VectorIndex.load(path)`` memory-maps the vectors back, so large
+  indexes open instantly and share pages between processes.
+"""
+import json
+import os
+
+import numpy as np
+
+METRICS = ("cosine", "ip", "l2")
+_SCORE_BLOCK = 1 << 24  # max query x vector scores materialised at once
+
+
+class VectorIndex:
+    def __init__(self, dim, metric="cosine"):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+        self.dim = dim
+        self.metric = metric
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)  # squared norms, for l2
+        self._size = 0
+        self.ids = []
+        self.metadata = []
+        self._columns = {}  # metadata key -> object array, built on first filter
+        self.centroids = None
+        self._lists = None  # IVF: one int64 array of row positions per centroid
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def vectors(self):
+        return self._vectors[:self._size]
+
+    @property
+    def is_ivf(self):
+        return self.centroids is not None
+
+    def _prepare(self, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors[None, :]
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of dimension {self.dim}, got {vectors.shape[1]}")
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.maximum(norms, 1e-12)
+        return vectors
+
+    def _reserve(self, extra):
+        needed = self._size + extra
+        if needed <= len(self._vectors) and self._vectors.flags.writeable:
+            return
+        capacity = max(needed, 2 * len(self._vectors), 1024)
+        grown = np.empty((capacity, self.dim), dtype=np.float32)
+        grown[:self._size] = self._vectors[:self._size]
+        norms = np.empty(capacity, dtype=np.float32)
+        norms[:self._size] = self._norms[:self._size]
+        self._vectors, self._norms = grown, norms
+
+    def add(self, vectors, ids=None, metadata=None):
+        """Append a batch of vectors; returns their ids (row numbers by default)."""
+        vectors = self._prepare(vectors)
+        n = len(vectors)
+        ids = list(range(self._size, self._size + n)) if ids is None else list(ids)
+        metadata = [{} for _ in range(n)] if metadata is None else list(metadata)
+        if len(ids) != n or len(metadata) != n:
+            raise ValueError("ids and metadata must match the number of vectors")
+
+        self._reserve(n)
+        start = self._size
+        self._vectors[start:start + n] = vectors
+        self._norms[start:start + n] = np.einsum("ij,ij->i", vectors, vectors)
+        self._size += n
+        self.ids.extend(ids)
+        self.metadata.extend(metadata)
+        self._columns.clear()
+
+        if self.is_ivf:
+            assignments = self._nearest_centroids(vectors)
+            positions = np.arange(start, start + n)
+            for list_id in np.unique(assignments):
+                self._lists[list_id] = np.concatenate(
+                    [self._lists[list_id], positions[assignments == list_id]]
+                )
+        return ids
+
+    def _scores(self, queries, rows=None):
+        """Scores of every query against ``rows`` (all vectors when None)."""
+        vectors = self.vectors if rows is None else self._vectors[rows]
+        scores = queries @ vectors.T
+        if self.metric == "l2":
+            norms = self._norms[:self._size] if rows is None else self._norms[rows]
+            scores = 2 * scores - norms - np.einsum("ij,ij->i", queries, queries)[:, None]
+        return scores
+
+    def _column(self, key):
+        column = self._columns.get(key)
+        if column is None:
+            column = np.empty(self._size, dtype=object)
+            column[:] = [meta.get(key) for meta in self.metadata]
+            self._columns[key] = column
+        return column
+
+    def _mask(self, where):
+        if not where:
+            return None
+        mask = np.ones(self._size, dtype=bool)
+        for key, value in where.items():
+            mask &= self._column(key) == value
+        return mask
+
+    @staticmethod
+    def _top_k(scores, k):
+        k = min(k, scores.shape[-1])
+        if k == 0:
+            return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+        top = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=-1), axis=-1, kind="stable")
+        return np.take_along_axis(top, order, axis=-1)
+
+    def _hits(self, rows, scores):
+        return [
+            {"id": self.ids[row], "score": float(score), "metadata": self.metadata[row]}
+            for row, score in zip(rows.tolist(), scores.tolist())
+        ]
+
+    def search(self, queries, k=10, where=None, nprobe=8, exact=None):
+        """Top-``k`` hits per query as ``[{"id", "score", "metadata"}, ...]``.
+
+        A single vector returns one hit list; a 2-D batch returns a list of
+        them. IVF indexes search approximately unless ``exact=True``; with
+        ``where`` they still return ``k`` hits whenever ``k`` rows match.
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        single = queries.ndim == 1
+        queries = self._prepare(queries)
+        mask = self._mask(where)
+        if self._size == 0:
+            results = [[] for _ in queries]
+        elif self.is_ivf and not exact:
+            matches = None if mask is None else np.flatnonzero(mask)
+            if matches is not None and len(matches) <= nprobe * self._size / len(self.centroids):
+                # Selective filter: the matches are no more rows than a probe scans
+                results = [self._search_rows(query, k, matches) for query in queries]
+            else:
+                results = [self._search_ivf(query, k, mask, nprobe) for query in queries]
+        else:
+            results = self._search_exact(queries, k, mask)
+        return results[0] if single else results
+
+    def _search_exact(self, queries, k, mask):
+        results = []
+        chunk = max(1, _SCORE_BLOCK // self._size)
+        for start in range(0, len(queries), chunk):
+            scores = self._scores(queries[start:start + chunk])
+            if mask is not None:
+                scores[:, ~mask] = -np.inf
+            for row_scores, top in zip(scores, self._top_k(scores, k)):
+                top = top[np.isfinite(row_scores[top])]
+                results.append(self._hits(top, row_scores[top]))
+        return results
+
+    def _search_ivf(self, query, k, mask, nprobe):
+        centroid_scores = self._centroid_scores(query[None, :])[0]
+        if mask is None:
+            probe = self._top_k(centroid_scores, nprobe)
+            return self._search_rows(query, k, np.concatenate(
+                [self._lists[list_id] for list_id in probe.tolist()]))
+        # Filtered: probe past nprobe lists, nearest first, until k rows match
+        parts, found = [], 0
+        for probed, list_id in enumerate(np.argsort(-centroid_scores, kind="stable").tolist()):
+            if probed >= nprobe and found >= k:
+                break
+            rows = self._lists[list_id]
+            parts.append(rows[mask[rows]])
+            found += len(parts[-1])
+        return self._search_rows(query, k, np.concatenate(parts))
+
+    def _search_rows(self, query, k, rows):
+        if len(rows) == 0:
+            return []
+        scores = self._scores(query[None, :], rows)[0]
+        top = self._top_k(scores, k)
+        return self._hits(rows[top], scores[top])
+
+    def _centroid_scores(self, vectors):
+        """Closeness of each vector to each centroid under the index metric."""
+        scores = vectors @ self.centroids.T
+        if self.metric == "l2":
+            # -|v - c|^2 up to the per-vector |v|^2 term, which does not change the ranking
+            scores = 2 * scores - np.einsum("ij,ij->i", self.centroids, self.centroids)
+        return scores
+
+    def _nearest_centroids(self, vectors):
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        chunk = max(1, _SCORE_BLOCK // len(self.centroids))
+        for start in range(0, len(vectors), chunk):
+            block = self._centroid_scores(vectors[start:start + chunk])
+            assignments[start:start + chunk] = block.argmax(axis=1)
+        return assignments
+
+    def build_ivf(self, nlist=None, iterations=10, sample_size=50_000, seed=0):
+        """Cluster the vectors into ``nlist`` inverted lists (k-means on a sample)."""
+        if self._size == 0:
+            raise ValueError("Cannot build an IVF index on an empty index")
+        nlist = min(nlist or max(1, int(4 * np.sqrt(self._size))), self._size)
+        rng = np.random.default_rng(seed)
+        sample_rows = rng.choice(self._size, size=min(sample_size, self._size), replace=False)
+        sample = np.asarray(self._vectors[np.sort(sample_rows)])
+
+        self.centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = self._nearest_centroids(sample)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=nlist)
+            filled = counts > 0
+            self.centroids[filled] = sums[filled] / counts[filled, None]
+            if self.metric == "cosine":
+                self.centroids /= np.maximum(
+                    np.linalg.norm(self.centroids, axis=1, keepdims=True), 1e-12)
+
+        self._set_lists(self._nearest_centroids(self.vectors))
+
+    def _set_lists(self, assignments):
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(len(self.centroids) + 1))
+        self._lists = [order[bounds[i]:bounds[i + 1]] for i in range(len(self.centroids))]
+
+    def save(self, path):
+        """Write the index to directory ``path``."""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "vectors.npy"), self.vectors)
+        if self.is_ivf:
+            assignments = np.empty(self._size, dtype=np.int64)
+            for list_id, rows in enumerate(self._lists):
+                assignments[rows] = list_id
+            np.save(os.path.join(path, "centroids.npy"), self.centroids)
+            np.save(os.path.join(path, "assignments.npy"), assignments)
+        with open(os.path.join(path, "index.json"), "w") as f:
+            json.dump({"dim": self.dim, "metric": self.metric, "ids": self.ids,
+                       "metadata": self.metadata}, f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Open a saved index; vectors are memory-mapped read-only by default."""
+        with open(os.path.join(path, "index.json")) as f:
+            header = json.load(f)
+        index = cls(header["dim"], header["metric"])
+        index._vectors = np.load(os.path.join(path, "vectors.npy"),
+                                 mmap_mode="r" if mmap else None)
+        index._size = len(index._vectors)
+        if index.metric == "l2":
+            index._norms = np.einsum("ij,ij->i", index._vectors, index._vectors).astype(np.float32)
+        else:  # only l2 reads the norms; skip a pass over every page of the file
+            index._norms = np.zeros(index._size, dtype=np.float32)
+        index.ids = header["ids"]
+        index.metadata = header["metadata"]
+        if os.path.exists(os.path.join(path, "centroids.npy")):
+            index.centroids = np.load(os.path.join(path, "centroids.npy"))
+            index._set_lists(np.load(os.path.join(path, "assignments.npy")))
+        return index
+
+
+def hashing_embedder(dim=1024):
+    """Dependency-free text embedder (hashed bag of words) for local search.
+
+    Good enough for keyword-level skill discovery; swap in a real model's
+    encoder for semantic recall.
+    """
+    import re
+    import zlib
+
+    def embed(texts):
+        vectors = np.zeros((len(texts), dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in re.findall(r"[a-z0-9]+", text.lower()):
+                h = zlib.crc32(token.encode())
+                vectors[i, h % dim] += 1.0 if h & 0x80000000 else -1.0
+        return vectors
+    return embed
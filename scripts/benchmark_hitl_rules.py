@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Microbenchmark HITL evaluation throughput as the rule set grows.
+
+Compares the compiled dispatch tables with a naive linear scan over the
+same rules at 1, 50 and 500 rules.
+
+Usage: python scripts/benchmark_hitl_rules.py [--calls 200000]
+"""
+import argparse
+import random
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+from agents.judge.evaluator import Judge
+
+
+def make_rules(count):
+    """Half sensitive categories, half amount thresholds."""
+    categories = [f"category_{i}" for i in range(count // 2)]
+    thresholds = {f"spend_{i}": 50 + i for i in range(count - len(categories))}
+    return {"sensitive_categories": categories, "amount_thresholds": thresholds}
+
+
+def linear_requires_review(rules, task_result):
+    """Baseline: what the original method does, scaled to N rules."""
+    for category in list(rules["sensitive_categories"]):
+        if task_result.get("task_type") == category:
+            return True
+    for task_type, limit in rules["amount_thresholds"].items():
+        if task_result.get("task_type") == task_type and task_result.get("amount", 0) > limit:
+            return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"📊 HITL rule evaluation ({args.calls} calls per row)")
+    print(f"{'rules':>6} {'compiled':>16} {'linear scan':>16}")
+    for count in (1, 50, 500):
+        rules = make_rules(count)
+        judge = Judge(hitl_rules=rules)
+        names = rules["sensitive_categories"] + list(rules["amount_thresholds"]) + ["regular"]
+        rng = random.Random(0)
+        results = [{"task_type": rng.choice(names), "amount": rng.random() * 1000}
+                   for _ in range(args.calls)]
+
+        start = time.perf_counter()
+        for result in results:
+            judge._requires_hitl_review(result)
+        compiled = args.calls / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for result in results:
+            linear_requires_review(rules, result)
+        linear = args.calls / (time.perf_counter() - start)
+
+        print(f"{count:>6} {compiled:>12,.0f}/s {linear:>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark list vs streaming Planner decomposition.
+
+Reports time-to-first-task, total time and peak RSS for each mode. Every
+case runs in a fresh interpreter so peak RSS is not polluted by earlier runs.
+
+Usage: python scripts/benchmark_planner.py [--sizes 1000 100000 1000000]
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+WORKERS = ["worker_1", "worker_2", "worker_3", "worker_4"]
+
+
+def run_case(mode, num_tasks):
+    from agents.planner.task_decomposer import Planner
+
+    planner = Planner()
+    goals = {"objective": "Benchmark", "budget": num_tasks * planner.cost_per_task}
+
+    start = time.perf_counter()
+    first = None
+    count = 0
+    if mode == "list":
+        assignments = planner.assign_tasks(goals, WORKERS)
+        for tasks in assignments.values():
+            for _ in tasks:
+                if first is None:
+                    first = time.perf_counter() - start
+                count += 1
+    else:
+        for _ in planner.assign_tasks_iter(goals, WORKERS):
+            if first is None:
+                first = time.perf_counter() - start
+            count += 1
+    total = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "mode": mode,
+        "tasks": count,
+        "first_task_ms": first * 1000,
+        "total_s": total,
+        "peak_rss_mb": peak_kib / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--case", nargs=2, metavar=("MODE", "N"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        mode, n = args.case
+        print(json.dumps(run_case(mode, int(n))))
+        return
+
+    print("📊 Planner decomposition benchmark")
+    print(f"{'tasks':>10} {'mode':>7} {'first task':>12} {'total':>9} {'peak RSS':>10}")
+    for n in args.sizes:
+        for mode in ("list", "stream"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--case", mode, str(n)],
+                capture_output=True, text=True, check=True,
+            )
+            r = json.loads(out.stdout)
+            print(f"{r['tasks']:>10} {r['mode']:>7} {r['first_task_ms']:>10.3f}ms "
+                  f"{r['total_s']:>8.3f}s {r['peak_rss_mb']:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
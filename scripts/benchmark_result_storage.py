@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Inline ``tasks.result`` vs the out-of-line compressed blob store.
+
+Writes the same task results both ways into fresh SQLite files. Reports
+the database size and the time of a full status scan over the tasks table.
+
+Usage:
+    python scripts/benchmark_result_storage.py [--tasks 20000] [--distinct 500] [--size 8000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, '.')
+
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from models.bulk import bulk_insert_tasks
+from models.database import Base, Campaign
+from models.result_store import DEFAULT_CODEC
+
+WORDS = "engagement trend audience reach caption hashtag video post reply".split()
+
+
+def make_results(num_tasks, distinct, size):
+    rng = random.Random(7)
+    pool = [" ".join(rng.choice(WORDS) for _ in range(size // 8)) for _ in range(distinct)]
+    return [rng.choice(pool) for _ in range(num_tasks)]
+
+
+def inline_layout(path, results):
+    engine = create_engine(f"sqlite:///{path}")
+    table = Table("tasks", MetaData(), Column("id", String, primary_key=True),
+                  Column("status", String), Column("result", String))
+    table.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(table), [
+            {"id": f"t{i:07d}", "status": "done", "result": r} for i, r in enumerate(results)
+        ])
+    return engine
+
+
+def blob_layout(path, results):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Campaign(id="c1", objective="Benchmark", budget=1.0))
+        session.flush()
+        bulk_insert_tasks(session, (
+            {"id": f"t{i:07d}", "campaign_id": "c1", "status": "done", "result": r}
+            for i, r in enumerate(results)
+        ))
+        session.commit()
+    return engine
+
+
+def status_scan(engine):
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT count(*) FROM tasks WHERE status = 'done'")).scalar()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--distinct", type=int, default=500, help="distinct result payloads")
+    parser.add_argument("--size", type=int, default=8_000, help="approx. bytes per payload")
+    args = parser.parse_args()
+
+    results = make_results(args.tasks, args.distinct, args.size)
+    print(f"📦 {args.tasks:,} results, {args.distinct:,} distinct, ~{args.size:,} B each "
+          f"(codec: {DEFAULT_CODEC})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, layout in (("inline", inline_layout), ("blob store", blob_layout)):
+            path = os.path.join(tmp, f"{name.replace(' ', '_')}.db")
+            engine = layout(path, results)
+            scan = status_scan(engine)
+            engine.dispose()
+            print(f"  {name:<11} {os.path.getsize(path) / 2**20:8.1f} MiB   "
+                  f"status scan {scan * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
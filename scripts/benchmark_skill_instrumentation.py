@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Per-call overhead of skill instrumentation at different sampling rates.
+
+Usage:
+    python scripts/benchmark_skill_instrumentation.py [--calls 1000000]
+"""
+import argparse
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+from skills.instrumentation import SkillMetrics
+
+
+class EchoSkill:
+    def echo(self, value):
+        return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    raw = EchoSkill().echo
+    base = min(timeit.repeat(lambda: raw(1), number=args.calls, repeat=3))
+    print(f"📏 {args.calls:,} calls; raw method {base / args.calls * 1e9:.0f} ns/call")
+    for label, every in (("counts only", 0), ("1 in 100 timed", 100), ("every call timed", 1)):
+        method = SkillMetrics(sample_every=every).instrument("echo", EchoSkill()).echo
+        elapsed = min(timeit.repeat(lambda: method(1), number=args.calls, repeat=3))
+        overhead = (elapsed - base) / args.calls * 1e9
+        print(f"  {label:<17} +{overhead:6.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Import cost of creating the SkillRegistry: lazy declaration vs eager loading.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime``.
+"eager" also resolves every core skill, which is what registry creation
+did before skills were loaded lazily.
+
+Usage:
+    python scripts/benchmark_skill_registry.py [--runs 5] [--top 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+sys.path.insert(0, '.')
+
+SETUP = "from skills.registry import get_skill_registry; registry = get_skill_registry()"
+SCENARIOS = {
+    "lazy": SETUP + "; registry.list_skills()",
+    "eager": SETUP + "; [registry.get_skill(s['name']) for s in registry.list_skills()]",
+}
+
+
+def import_times(code):
+    """Return ``{module: (self_us, cumulative_us)}`` for one fresh interpreter."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list")
+    args = parser.parse_args()
+
+    baseline = import_times("pass")  # interpreter start-up imports
+    print(f"⏱️  Registry import cost over {args.runs} fresh interpreters (median)")
+    for name, code in SCENARIOS.items():
+        runs = [import_times(code) for _ in range(args.runs)]
+        extra = [{m: t for m, t in run.items() if m not in baseline} for run in runs]
+        total_ms = statistics.median(sum(s for s, _ in run.values()) for run in extra) / 1000
+        print(f"  {name:<6} {total_ms:8.1f} ms   {len(extra[-1]):4d} modules imported")
+        slowest = sorted(extra[-1].items(), key=lambda item: item[1][0], reverse=True)
+        for module, (self_us, _) in slowest[:args.top]:
+            print(f"           {self_us / 1000:7.2f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
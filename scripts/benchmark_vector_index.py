@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Recall and latency of the local vector index: exact vs IVF search.
+
+Builds indexes over clustered synthetic embeddings and reports, per size,
+build time, per-query latency (p50/p95) and recall@k of IVF search
+against exact search, for a few ``nprobe`` settings.
+
+Usage:
+    python scripts/benchmark_vector_index.py [--sizes 10000 1000000] [--dim 64] [--metric l2]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+from models.vector_index import METRICS, VectorIndex
+
+
+def clustered(centers, n, rng, batch=100_000):
+    """Yield ``n`` points around ``centers`` in batches."""
+    for start in range(0, n, batch):
+        size = min(batch, n - start)
+        labels = rng.integers(len(centers), size=size)
+        yield centers[labels] + rng.normal(size=(size, centers.shape[1])).astype(np.float32)
+
+
+def timed_search(index, queries, k, **kwargs):
+    hits, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        hits.append({hit["id"] for hit in index.search(query, k=k, **kwargs)})
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return hits, statistics.median(latencies), latencies[int(len(latencies) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--metric", choices=METRICS, default="cosine")
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    for size in args.sizes:
+        print(f"\n📦 {size:,} vectors x {args.dim} dims")
+        index = VectorIndex(args.dim, metric=args.metric)
+        centers = rng.normal(size=(max(10, size // 1000), args.dim)).astype(np.float32) * 3
+        start = time.perf_counter()
+        for batch in clustered(centers, size, rng):
+            index.add(batch)
+        print(f"  add:       {time.perf_counter() - start:8.2f} s")
+        # In-distribution queries: fresh points around the indexed clusters
+        queries = np.concatenate(list(clustered(centers, args.queries, rng)))
+
+        truth, p50, p95 = timed_search(index, queries, args.k)
+        print(f"  exact:     p50 {p50:8.2f} ms   p95 {p95:8.2f} ms   recall@{args.k} 1.000")
+
+        start = time.perf_counter()
+        index.build_ivf()
+        print(f"  build_ivf: {time.perf_counter() - start:8.2f} s   nlist={len(index.centroids)}")
+        for nprobe in args.nprobe:
+            found, p50, p95 = timed_search(index, queries, args.k, nprobe=nprobe)
+            recall = statistics.mean(len(a & b) / args.k for a, b in zip(found, truth))
+            print(f"  ivf/{nprobe:<4}  p50 {p50:8.2f} ms   p95 {p95:8.2f} ms   "
+                  f"recall@{args.k} {recall:.3f}")
+
+        with tempfile.TemporaryDirectory() as path:
+            index.save(path)
+            start = time.perf_counter()
+            VectorIndex.load(path)
+            print(f"  mmap load: {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Per-skill invocation metrics for the SkillRegistry.
+
+``SkillMetrics.instrument`` wraps a skill (a function or an object whose
+methods are the tools) so that every call updates per skill and per method:
+
+* call and error counts, always;
+* a latency histogram, for one call in ``sample_every`` (0 disables
+  timing and leaves only two counter increments on the hot path).
+
+Counters are updated without locks to keep per-call overhead low; under
+heavy thread contention they may slightly undercount. Read the data with
+``snapshot()`` or export it with ``to_prometheus()``.
+
+The global registry enables this when ``CHIMERA_SKILL_METRICS`` is set.
+"""
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+# Histogram upper bounds in seconds (a final +Inf bucket is implied)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0,
+)
+
+
+class MethodStats:
+    """Counters and latency histogram for one skill method."""
+    __slots__ = ("calls", "errors", "sampled", "total_seconds", "max_seconds", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.sampled = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.sampled += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "sampled": self.sampled,
+            "mean_seconds": self.total_seconds / self.sampled if self.sampled else 0.0,
+            "max_seconds": self.max_seconds,
+            "total_seconds": self.total_seconds,
+            "buckets": dict(zip(LATENCY_BUCKETS + (float("inf"),), self.buckets)),
+        }
+
+
+class InstrumentedSkill:
+    """Transparent proxy that instruments a skill object's callable attributes."""
+
+    def __init__(self, name: str, skill: Any, metrics: "SkillMetrics"):
+        object.__setattr__(self, "_skill_name", name)
+        object.__setattr__(self, "_skill", skill)
+        object.__setattr__(self, "_metrics", metrics)
+
+    def __getattr__(self, attribute: str) -> Any:
+        value = getattr(self._skill, attribute)
+        if attribute.startswith("_") or not callable(value):
+            return value
+        wrapped = self._metrics.wrap(self._skill_name, attribute, value)
+        # Cache the wrapper; later lookups skip __getattr__ entirely
+        object.__setattr__(self, attribute, wrapped)
+        return wrapped
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self._skill, attribute, value)
+        self.__dict__.pop(attribute, None)
+
+    def __repr__(self) -> str:
+        return f"<InstrumentedSkill {self._skill_name}: {self._skill!r}>"
+
+
+class SkillMetrics:
+    """Collects invocation metrics for instrumented skills."""
+
+    def __init__(self, sample_every: int = 1, clock=time.perf_counter):
+        self.sample_every = sample_every
+        self.clock = clock
+        self._stats: Dict[Tuple[str, str], MethodStats] = {}
+
+    def stats_for(self, skill: str, method: str) -> MethodStats:
+        stats = self._stats.get((skill, method))
+        if stats is None:
+            stats = self._stats.setdefault((skill, method), MethodStats())
+        return stats
+
+    def instrument(self, name: str, skill: Any) -> Any:
+        """Return ``skill`` wrapped for metrics (functions as ``__call__``)."""
+        if inspect.isfunction(skill) or inspect.isbuiltin(skill) or inspect.ismethod(skill):
+            return self.wrap(name, "__call__", skill)
+        return InstrumentedSkill(name, skill, self)
+
+    def wrap(self, skill: str, method: str, fn):
+        stats = self.stats_for(skill, method)
+        every = self.sample_every
+        clock = self.clock
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                stats.calls += 1
+                start = clock() if every and stats.calls % every == 0 else None
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception:
+                    stats.errors += 1
+                    raise
+                finally:
+                    if start is not None:
+                        stats.observe(clock() - start)
+            return async_wrapper
+
+        if not every:
+            @functools.wraps(fn)
+            def counting_wrapper(*args, **kwargs):
+                stats.calls += 1
+                try:
+                    return fn(*args, **kwargs)
+                except Exception:
+                    stats.errors += 1
+                    raise
+            return counting_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            stats.calls += 1
+            if stats.calls % every:
+                try:
+                    return fn(*args, **kwargs)
+                except Exception:
+                    stats.errors += 1
+                    raise
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.observe(clock() - start)
+        return wrapper
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """``{skill: {method: stats}}`` for every method called so far."""
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (skill, method), stats in list(self._stats.items()):
+            result.setdefault(skill, {})[method] = stats.snapshot()
+        return result
+
+    def reset(self) -> None:
+        for stats in list(self._stats.values()):
+            stats.__init__()
+
+    def to_prometheus(self, prefix: str = "chimera_skill") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        series = [
+            (f'skill="{skill}",method="{method}"', stats)
+            for skill, methods in sorted(self.snapshot().items())
+            for method, stats in sorted(methods.items())
+        ]
+        lines: List[str] = []
+        for family, field in (("calls_total", "calls"), ("errors_total", "errors")):
+            lines.append(f"# TYPE {prefix}_{family} counter")
+            lines.extend(f"{prefix}_{family}{{{labels}}} {stats[field]}" for labels, stats in series)
+
+        histogram = f"{prefix}_latency_seconds"
+        lines.append(f"# TYPE {histogram} histogram")
+        for labels, stats in series:
+            cumulative = 0
+            for bound, count in stats["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{histogram}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{histogram}_sum{{{labels}}} {stats['total_seconds']}")
+            lines.append(f"{histogram}_count{{{labels}}} {stats['sampled']}")
+        return "\n".join(lines) + "\n"
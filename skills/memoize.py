@@ -0,0 +1,233 @@
+"""
+Opt-in result memoization for registered skills.
+
+A skill becomes cacheable when it is registered with
+``SkillRegistry.register(name, skill, cache=CachePolicy(...))``, or when it
+declares a ``cache_policy`` attribute itself. The registry then wraps it
+so that repeated calls with equal arguments are answered from an
+in-process cache:
+
+* Keys are a stable hash of (method, args, kwargs), computed from
+  canonical JSON, so equal dicts with a different key order share an entry.
+* Entries are bounded by ``maxsize`` (LRU) and expire after ``ttl``.
+* Single-flight: concurrent identical calls share one upstream call,
+  whether they come from threads or asyncio tasks. Cancelling one async
+  caller leaves the others waiting; the shared call is cancelled only
+  once every caller has gone.
+* Exceptions are never cached.
+
+Cached results are shared between callers; treat them as read-only.
+"""
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+
+class CachePolicy(NamedTuple):
+    """How a skill's results may be cached."""
+    ttl: float = 300.0
+    maxsize: int = 1024
+    methods: Optional[FrozenSet[str]] = None  # None: every public method
+
+
+def argument_key(method: str, args: tuple, kwargs: dict) -> str:
+    """Stable digest of a call; non-JSON values fall back to ``repr``."""
+    payload = json.dumps([method, args, kwargs], sort_keys=True, separators=(",", ":"),
+                         default=repr)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class _AsyncFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0  # callers awaiting the task; touched on its loop only
+
+
+class MemoCache:
+    """LRU + TTL result cache with single-flight call deduplication."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], _AsyncFlight] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= self.clock():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def _store(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def call(self, key: str, fn, args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            hit, value = self._lookup(key)
+            if hit:
+                return value
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = fn(*args, **kwargs)
+            self._store(key, flight.value)
+            return flight.value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def call_async(self, key: str, fn, args: tuple, kwargs: dict) -> Any:
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            hit, value = self._lookup(key)
+            if hit:
+                return value
+            flight = self._async_flights.get(flight_key)
+            if flight is None:
+                # The upstream call runs in its own task, so cancelling the
+                # caller that started it does not fail the others
+                task = loop.create_task(self._fill_async(key, flight_key, fn, args, kwargs))
+                flight = self._async_flights[flight_key] = _AsyncFlight(task)
+                self.misses += 1
+            else:
+                self.coalesced += 1
+            flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                abandoned = flight.waiters == 0 and not flight.task.done()
+                if abandoned and self._async_flights.get(flight_key) is flight:
+                    # Every caller gave up; unlist the flight now so a new
+                    # caller starts a fresh call instead of joining this one
+                    del self._async_flights[flight_key]
+            if abandoned:
+                flight.task.cancel()
+
+    async def _fill_async(self, key: str, flight_key: Tuple[int, str], fn, args: tuple,
+                          kwargs: dict) -> Any:
+        try:
+            value = await fn(*args, **kwargs)
+            self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                flight = self._async_flights.get(flight_key)
+                if flight is not None and flight.task is asyncio.current_task():
+                    del self._async_flights[flight_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def memoized(cache: MemoCache, method: str, fn):
+    """Wrap one callable so calls go through ``cache``."""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            return await cache.call_async(argument_key(method, args, kwargs), fn, args, kwargs)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return cache.call(argument_key(method, args, kwargs), fn, args, kwargs)
+    return wrapper
+
+
+class MemoizedSkill:
+    """Proxy whose cacheable methods are answered from a shared ``MemoCache``."""
+
+    def __init__(self, skill: Any, cache: MemoCache, methods: Optional[FrozenSet[str]] = None):
+        object.__setattr__(self, "_skill", skill)
+        object.__setattr__(self, "_cache", cache)
+        object.__setattr__(self, "_methods", methods)
+
+    def __getattr__(self, attribute: str) -> Any:
+        value = getattr(self._skill, attribute)
+        if attribute.startswith("_") or not callable(value):
+            return value
+        if self._methods is not None and attribute not in self._methods:
+            return value
+        wrapped = memoized(self._cache, attribute, value)
+        object.__setattr__(self, attribute, wrapped)
+        return wrapped
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self._skill, attribute, value)
+        self.__dict__.pop(attribute, None)
+
+    def __repr__(self) -> str:
+        return f"<MemoizedSkill {self._skill!r}>"
+
+
+def memoize_skill(skill: Any, policy: CachePolicy) -> Tuple[Any, MemoCache]:
+    """Wrap a function or object skill according to ``policy``."""
+    cache = MemoCache(maxsize=policy.maxsize, ttl=policy.ttl)
+    if inspect.isroutine(skill):
+        return memoized(cache, "__call__", skill), cache
+    return MemoizedSkill(skill, cache, policy.methods), cache
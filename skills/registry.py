@@ -2,70 +2,199 @@
 Skill Registry for Project Chimera
 Central registry for managing all agent skills and providing a 
 standardized interface for the Orchestrator.
+
+Core skills are declared lazily (name + import path) and only imported on
+the first ``get_skill`` call, so an agent process pays for the skill
+packages it actually uses (commerce pulls in Coinbase AgentKit).
 """
+import importlib
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import threading
+from typing import Dict, Any, NamedTuple, Optional, List
 
 # Setup logging for the registry
 logger = logging.getLogger(__name__)
 
+class LazySkill(NamedTuple):
+    """A skill declared by import path and resolved on first use."""
+    target: str                # "package.module:attribute"
+    type: str                  # reported by list_skills before import
+    instantiate: bool = False  # call the attribute (a class) once on load
+
+    @property
+    def module(self) -> str:
+        return self.target.partition(":")[0]
+
+    def load(self) -> Any:
+        module_name, _, attribute = self.target.partition(":")
+        skill = getattr(importlib.import_module(module_name), attribute)
+        return skill() if self.instantiate else skill
+
+# The 'Skill Capsule' core skills: functions or classes instantiated on load
+DEFAULT_SKILLS: Dict[str, LazySkill] = {
+    "trends": LazySkill("skills.trends.trend_fetcher:fetch_trends", "function"),
+    "commerce": LazySkill("skills.commerce.skill_commerce:execute_transaction", "function"),
+    "content": LazySkill("skills.content.generator:ContentGenerator", "ContentGenerator",
+                         instantiate=True),
+    "engagement": LazySkill("skills.engagement.replier:EngagementManager", "EngagementManager",
+                            instantiate=True),
+}
+
+class _Snapshot(NamedTuple):
+    """One immutable version of the registry contents."""
+    skills: Dict[str, Any]          # loaded skills or LazySkill placeholders
+    cache_policies: Dict[str, Any]  # name -> skills.memoize.CachePolicy
+    handles: Dict[str, Any]         # name -> the (possibly wrapped) object get_skill hands out
+
 class SkillRegistry:
-    """Registry for managing agent skills using a Singleton pattern."""
+    """Registry for managing agent skills using a Singleton pattern.
+
+    Safe to share between threads. Readers use the current ``_Snapshot``,
+    whose dicts are never modified after publication. Writers (``register``
+    and first-time loads) serialize on a lock, build a new snapshot and
+    swap it in with a single attribute assignment. A ``get_skill`` for an
+    already loaded skill therefore takes no lock at all.
+    """
     
-    def __init__(self):
-        self._skills: Dict[str, Any] = {}
+    def __init__(self, metrics: Optional[Any] = None):
+        self._state = _Snapshot({}, {}, {})
+        # Serializes writers; re-entrant so a skill may register others on load
+        self._write_lock = threading.RLock()
+        # Optional skills.instrumentation.SkillMetrics; get_skill then hands
+        # out instrumented proxies
+        self.metrics = metrics
+        self._memo_caches: Dict[str, Any] = {}
+        # (snapshot, models.vector_index.VectorIndex) built by search_skills
+        self._skill_index: Optional[Any] = None
         self._initialize_default_skills()
     
     def _initialize_default_skills(self):
-        """
-        Dynamically imports and registers the core skills.
-        This follows the 'Skill Capsule' architecture.
-        """
-        try:
-            # Import standardized interfaces from sub-packages
-            from skills.trends import fetch_trends
-            from skills.commerce import execute_transaction
-            from skills.content import ContentGenerator
-            from skills.engagement import EngagementManager
-
-            # Register functions or instantiated classes
-            self.register("trends", fetch_trends)
-            self.register("commerce", execute_transaction)
-            self.register("content", ContentGenerator())
-            self.register("engagement", EngagementManager())
-            
-            logger.info(f"Successfully registered {len(self._skills)} core skills.")
-            
-        except ImportError as e:
-            logger.error(f"Failed to initialize core skills: {e}")
-            # Non-blocking: Registry can still be used for manual registration
+        """Declare the core skills without importing them."""
+        for name, spec in DEFAULT_SKILLS.items():
+            self.register(name, spec)
+        logger.info(f"Declared {len(DEFAULT_SKILLS)} core skills (loaded on first use).")
     
-    def register(self, name: str, skill: Any) -> None:
-        """Register a new skill into the inventory."""
-        self._skills[name] = skill
+    def _publish(self, skills: Dict[str, Any], cache_policies: Dict[str, Any],
+                 handles: Dict[str, Any]) -> None:
+        # Caller holds _write_lock; readers see the old or new snapshot, never a mix
+        self._state = _Snapshot(skills, cache_policies, handles)
+    
+    def register(self, name: str, skill: Any, cache: Optional[Any] = None) -> None:
+        """Register a new skill into the inventory (a ``LazySkill`` defers the import).
+
+        ``cache`` (a ``skills.memoize.CachePolicy``) makes the skill's results
+        memoized; a skill may also declare its own ``cache_policy`` attribute.
+        """
+        with self._write_lock:
+            state = self._state
+            cache_policies = dict(state.cache_policies)
+            if cache is None:
+                cache_policies.pop(name, None)
+            else:
+                cache_policies[name] = cache
+            handles = dict(state.handles)
+            handles.pop(name, None)
+            memo_caches = dict(self._memo_caches)
+            memo_caches.pop(name, None)
+            self._memo_caches = memo_caches
+            self._publish({**state.skills, name: skill}, cache_policies, handles)
         logger.debug(f"Skill '{name}' registered.")
     
     def get_skill(self, name: str) -> Optional[Any]:
-        """Retrieve a skill by its unique name."""
-        return self._skills.get(name)
+        """Retrieve a skill by its unique name, importing it on first access."""
+        handle = self._state.handles.get(name)
+        if handle is not None:
+            return handle
+        with self._write_lock:
+            # Another thread may have loaded it while we waited
+            state = self._state
+            handle = state.handles.get(name)
+            if handle is not None:
+                return handle
+            skill = state.skills.get(name)
+            if isinstance(skill, LazySkill):
+                skill = self._load(name, skill)
+            if skill is None:
+                return None
+            handle = skill
+            if self.metrics is not None:
+                # Innermost, so metrics count real skill calls, not cache hits
+                handle = self.metrics.instrument(name, handle)
+            policy = state.cache_policies.get(name) or getattr(skill, "cache_policy", None)
+            if policy:
+                from skills.memoize import memoize_skill
+                handle, cache = memoize_skill(handle, policy)
+                self._memo_caches = {**self._memo_caches, name: cache}
+            state = self._state  # _load may have published
+            self._publish({**state.skills, name: skill}, state.cache_policies,
+                          {**state.handles, name: handle})
+            return handle
+    
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters for every memoized skill loaded so far."""
+        return {name: cache.stats() for name, cache in self._memo_caches.items()}
+    
+    def _load(self, name: str, spec: LazySkill) -> Optional[Any]:
+        try:
+            return spec.load()
+        except (ImportError, AttributeError) as e:
+            # Non-blocking: the other skills stay usable
+            logger.error(f"Failed to load skill '{name}' from {spec.target}: {e}")
+            return None
     
     def list_skills(self) -> List[Dict[str, str]]:
-        """List metadata for all registered skills for AI discovery."""
+        """List metadata for all registered skills for AI discovery (imports nothing)."""
+        return self._list(self._state)
+    
+    @staticmethod
+    def _list(state: _Snapshot) -> List[Dict[str, str]]:
         return [
+            {"name": name, "type": skill.type, "module": skill.module}
+            if isinstance(skill, LazySkill) else
             {
                 "name": name,
                 "type": type(skill).__name__,
                 "module": getattr(skill, "__module__", "unknown")
             }
-            for name, skill in self._skills.items()
+            for name, skill in state.skills.items()
         ]
     
+    def search_skills(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Rank registered skills by similarity to ``query`` (imports no skill).
+
+        Matches against each skill's name, type, module and docstring when
+        already loaded; every result is a ``list_skills`` entry plus a score.
+        """
+        from models.vector_index import VectorIndex, hashing_embedder
+
+        embed = hashing_embedder()
+        state = self._state
+        built = self._skill_index
+        if built is None or built[0].skills is not state.skills:
+            skills = self._list(state)
+            index = VectorIndex(dim=1024)
+            if skills:
+                texts = [" ".join([s["name"], s["type"], s["module"],
+                                   self._doc(state.skills[s["name"]])])
+                         for s in skills]
+                index.add(embed(texts), ids=[s["name"] for s in skills], metadata=skills)
+            # Rebuilt whenever a register or load publishes a new snapshot
+            built = self._skill_index = (state, index)
+        hits = built[1].search(embed([query])[0], k=k)
+        return [dict(hit["metadata"], score=hit["score"]) for hit in hits]
+    
+    @staticmethod
+    def _doc(skill: Any) -> str:
+        return "" if isinstance(skill, LazySkill) else (getattr(skill, "__doc__", None) or "")
+    
     def has_skill(self, name: str) -> bool:
         """Check if a specific skill is available in the registry."""
-        return name in self._skills
+        return name in self._state.skills
 
 # Global registry instance (Singleton)
 _registry_instance: Optional[SkillRegistry] = None
+_registry_lock = threading.Lock()
 
 def get_skill_registry() -> SkillRegistry:
     """
@@ -73,9 +202,21 @@ def get_skill_registry() -> SkillRegistry:
     Ensures all agents share the same tool definitions.
     """
     global _registry_instance
-    if _registry_instance is None:
-        _registry_instance = SkillRegistry()
-    return _registry_instance
+    registry = _registry_instance
+    if registry is not None:
+        return registry
+    with _registry_lock:
+        # Double-checked: only the first caller creates the registry
+        if _registry_instance is None:
+            # CHIMERA_SKILL_METRICS=N times 1 call in N per skill method (0 = counts only)
+            sample_every = os.getenv("CHIMERA_SKILL_METRICS")
+            metrics = None
+            if sample_every:
+                # Imported only when enabled to keep registry start-up cheap
+                from skills.instrumentation import SkillMetrics
+                metrics = SkillMetrics(sample_every=int(sample_every))
+            _registry_instance = SkillRegistry(metrics=metrics)
+        return _registry_instance
 
 if __name__ == "__main__":
     # Internal validation test
@@ -4,7 +4,10 @@ Exposes tools for market perception and social trend analysis.
 """
 
 # Import the actual logic from your script
-from .trend_fetcher import fetch_trends 
+from .trend_fetcher import (
+    TrendAggregator, TrendSource, fetch_trends, get_trend_aggregator, register_trend_source,
+)
 
-__all__ = ["fetch_trends"]
+__all__ = ["fetch_trends", "TrendAggregator", "TrendSource", "get_trend_aggregator",
+           "register_trend_source"]
 __version__ = "0.1.0"
\ No newline at end of file
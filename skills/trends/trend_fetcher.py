@@ -0,0 +1,275 @@
+"""
+Trend perception: concurrent, cached aggregation over pluggable sources.
+
+``fetch_trends`` polls every configured ``TrendSource`` at once over one
+shared, pooled ``httpx.AsyncClient``. It merges the results into the
+skill contract: a list of ``{"topic", "relevance_score", "source_url"}``
+dicts, most relevant first.
+
+* Each source has its own timeout. A slow or failing source never delays
+  or fails the poll; its last good result is reused when there is one,
+  and otherwise it is left out.
+* Responses are cached per request URL and revalidated with
+  ``If-None-Match`` / ``If-Modified-Since``. A ``304`` reuses the cached
+  trends, and while ``Cache-Control: max-age`` is fresh no request is
+  sent at all.
+
+Sources come from ``CHIMERA_TREND_SOURCES`` (comma-separated
+``name=url`` pairs) or ``register_trend_source``.
+"""
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_LIMIT = 20
+
+
+class TrendSource:
+    """An HTTP endpoint that returns trends as JSON.
+
+    Subclass and override ``request`` / ``parse`` for endpoints with a
+    different query or payload shape.
+    """
+
+    def __init__(self, name: str, url: str, timeout: float = DEFAULT_TIMEOUT,
+                 weight: float = 1.0, params: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.url = url
+        self.timeout = timeout
+        self.weight = weight
+        self.params = params or {}
+
+    def request(self, category: Optional[str]) -> Tuple[str, Dict[str, str]]:
+        """URL and query parameters to poll for ``category``."""
+        params = dict(self.params)
+        if category:
+            params["category"] = category
+        return self.url, params
+
+    def parse(self, payload: Any) -> List[Dict[str, Any]]:
+        """Normalise a payload into contract dicts.
+
+        Accepts a list, or a dict holding it under ``trends`` / ``items``.
+        Entries may be plain strings or dicts with ``topic`` / ``name`` /
+        ``title``, an optional ``relevance_score`` / ``score`` (rank-based
+        when missing) and ``source_url`` / ``url``.
+        """
+        if isinstance(payload, dict):
+            payload = payload.get("trends", payload.get("items", []))
+        trends = []
+        for rank, item in enumerate(payload):
+            if isinstance(item, str):
+                item = {"topic": item}
+            topic = item.get("topic") or item.get("name") or item.get("title")
+            if not topic:
+                continue
+            score = item.get("relevance_score", item.get("score"))
+            if score is None:
+                score = 1.0 - rank / len(payload)
+            trends.append({
+                "topic": str(topic),
+                "relevance_score": float(score) * self.weight,
+                "source_url": item.get("source_url") or item.get("url") or self.url,
+            })
+        return trends
+
+    def __repr__(self) -> str:
+        return f"<TrendSource {self.name}: {self.url}>"
+
+
+class _CachedResponse(NamedTuple):
+    trends: List[Dict[str, Any]]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh_until: float
+
+
+def _max_age(cache_control: str) -> float:
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    match = re.search(r"max-age=(\d+)", cache_control)
+    return float(match.group(1)) if match else 0.0
+
+
+class TrendAggregator:
+    """Polls trend sources concurrently with conditional-request caching."""
+
+    def __init__(self, sources: Iterable[TrendSource] = (), client: Optional[httpx.AsyncClient] = None,
+                 max_connections: int = 20, clock=time.monotonic):
+        self.sources: Dict[str, TrendSource] = {source.name: source for source in sources}
+        self.clock = clock
+        self.max_connections = max_connections
+        self._client = client
+        # One pooled client per event loop: an AsyncClient's connections are
+        # bound to the loop that opened them
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+            weakref.WeakKeyDictionary()
+        self._cache: Dict[str, _CachedResponse] = {}
+        self.last_errors: Dict[str, str] = {}
+        self.stats = {"requests": 0, "not_modified": 0, "fresh": 0, "timeouts": 0, "errors": 0}
+
+    def add_source(self, source: TrendSource) -> None:
+        self.sources[source.name] = source
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = httpx.AsyncClient(
+                headers={"Accept": "application/json"},
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+            )
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled client of the running loop (a passed-in client is left open)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def fetch(self, category: Optional[str] = None,
+                    limit: Optional[int] = DEFAULT_LIMIT) -> List[Dict[str, Any]]:
+        """Poll every source at once and merge their trends, most relevant first."""
+        sources = list(self.sources.values())
+        if not sources:
+            return []
+        client = self._get_client()
+        results = await asyncio.gather(*(self._poll(client, source, category) for source in sources))
+        return merge_trends(zip(sources, results), limit)
+
+    async def _poll(self, client: httpx.AsyncClient, source: TrendSource,
+                    category: Optional[str]) -> List[Dict[str, Any]]:
+        url, params = source.request(category)
+        key = str(httpx.URL(url, params=params))
+        try:
+            trends = await asyncio.wait_for(
+                self._fetch(client, source, key, url, params), source.timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            error = f"timed out after {source.timeout}s"
+        except (httpx.HTTPError, ValueError, TypeError, AttributeError) as e:
+            # Transport failures, error statuses and malformed payloads
+            self.stats["errors"] += 1
+            error = f"{type(e).__name__}: {e}"
+        else:
+            self.last_errors.pop(source.name, None)
+            return trends
+
+        self.last_errors[source.name] = error
+        cached = self._cache.get(key)
+        logger.warning(f"Trend source '{source.name}' {error}; "
+                       f"{'using last good result' if cached else 'skipped'}")
+        return cached.trends if cached else []
+
+    async def _fetch(self, client: httpx.AsyncClient, source: TrendSource, key: str,
+                     url: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        cached = self._cache.get(key)
+        if cached is not None and cached.fresh_until > self.clock():
+            self.stats["fresh"] += 1
+            return cached.trends
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        self.stats["requests"] += 1
+        response = await client.get(url, params=params, headers=headers, timeout=source.timeout)
+
+        if response.status_code == 304 and cached is not None:
+            self.stats["not_modified"] += 1
+            trends = cached.trends
+        else:
+            response.raise_for_status()
+            trends = source.parse(response.json())
+        # A 304 may omit validators; keep the ones we sent
+        self._cache[key] = _CachedResponse(
+            trends,
+            response.headers.get("ETag") or (cached.etag if cached else None),
+            response.headers.get("Last-Modified") or (cached.last_modified if cached else None),
+            self.clock() + _max_age(response.headers.get("Cache-Control", "")),
+        )
+        return trends
+
+
+def merge_trends(results: Iterable[Tuple[TrendSource, List[Dict[str, Any]]]],
+                 limit: Optional[int] = DEFAULT_LIMIT) -> List[Dict[str, Any]]:
+    """Merge per-source trends by topic (case-insensitive).
+
+    A topic keeps its best score and URL; ties are broken by the number
+    of sources reporting it, which are listed under ``sources``.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for source, trends in results:
+        for trend in trends:
+            key = trend["topic"].casefold()
+            current = merged.get(key)
+            if current is None:
+                merged[key] = dict(trend, sources=[source.name])
+                continue
+            if source.name not in current["sources"]:
+                current["sources"].append(source.name)
+            if trend["relevance_score"] > current["relevance_score"]:
+                current.update(relevance_score=trend["relevance_score"],
+                               source_url=trend["source_url"])
+    ranked = sorted(merged.values(),
+                    key=lambda t: (t["relevance_score"], len(t["sources"])), reverse=True)
+    return ranked if limit is None else ranked[:limit]
+
+
+def sources_from_env(value: Optional[str] = None) -> List[TrendSource]:
+    """Parse ``CHIMERA_TREND_SOURCES`` (``name=url,name=url``)."""
+    value = os.getenv("CHIMERA_TREND_SOURCES", "") if value is None else value
+    sources = []
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        name, sep, url = entry.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid trend source '{entry}', expected name=url")
+        sources.append(TrendSource(name.strip(), url.strip()))
+    return sources
+
+
+# Shared aggregator, so every caller reuses one connection pool and cache
+_aggregator: Optional[TrendAggregator] = None
+_aggregator_lock = threading.Lock()
+
+
+def get_trend_aggregator() -> TrendAggregator:
+    global _aggregator
+    aggregator = _aggregator
+    if aggregator is not None:
+        return aggregator
+    with _aggregator_lock:
+        if _aggregator is None:
+            _aggregator = TrendAggregator(sources_from_env())
+        return _aggregator
+
+
+def register_trend_source(source: TrendSource) -> None:
+    """Add a source to the shared aggregator used by ``fetch_trends``."""
+    get_trend_aggregator().add_source(source)
+
+
+async def fetch_trends(category: Optional[str] = None, limit: Optional[int] = DEFAULT_LIMIT,
+                       aggregator: Optional[TrendAggregator] = None) -> List[Dict[str, Any]]:
+    """
+    Fetch current trends, optionally for one ``category``.
+
+    Returns a list of dicts with ``topic``, ``relevance_score`` and
+    ``source_url`` (plus the reporting ``sources``), most relevant first.
+    """
+    return await (aggregator or get_trend_aggregator()).fetch(category, limit)
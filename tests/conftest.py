@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced stand-in for ``time.monotonic`` / ``time.time``."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
@@ -26,3 +26,32 @@ def test_planner_worker_judge_flow():
     assert len(results) == 2
     assert len(decisions) == 2
     print("✓ Integration test passed")
+
+def test_run_swarm_persists_campaign_tasks(tmp_path, monkeypatch):
+    from sqlalchemy import create_engine, text
+    import main
+    
+    db_url = f"sqlite:///{tmp_path / 'chimera.db'}"
+    monkeypatch.setenv("DATABASE_URL", db_url)
+    
+    main.run_swarm()
+    
+    with create_engine(db_url).connect() as conn:
+        rows = conn.execute(text("SELECT assigned_to, status FROM tasks")).all()
+    assert sorted(r[0] for r in rows) == ["worker_1", "worker_2", "worker_3"]
+    assert {r[1] for r in rows} == {"pending"}
+    print("✓ run_swarm persisted tasks")
+
+def test_pipelined_planner_worker_judge_flow():
+    import asyncio
+    from agents.pipeline import SwarmPipeline
+    
+    pipeline = SwarmPipeline(worker_concurrency=4)
+    campaign_goals = {"objective": "Test", "budget": 1000}
+    
+    decisions = asyncio.run(pipeline.run_all(campaign_goals, ["w1", "w2"]))
+    
+    assert len(decisions) == 10
+    assert all(d["action"] in ("escalate", "queue", "approve") for d in decisions)
+    assert pipeline.stats()["judge"]["processed"] == 10
+    print("✓ Pipelined integration test passed")
@@ -61,3 +61,29 @@ def test_judge_concurrent_evaluation():
     assert elapsed < 3.0, f"Judge too slow: {elapsed:.3f}s (SLA: <3s)"
     
     print(f"✅ PASS: Evaluated {len(decisions)} results in {elapsed:.3f}s (< 3.0s SLA)")
+
+def test_judge_batch_evaluation_throughput():
+    """Test vectorized Judge handles 1M columnar results well inside the 3s SLA."""
+    import numpy as np
+    from agents.judge.evaluator import Judge
+    
+    judge = Judge()
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    columns = {
+        "confidence": rng.random(n),
+        "task_type": rng.choice(np.array(["regular", "finance", "health"]), n),
+        "amount": rng.random(n) * 100,
+    }
+    
+    start_time = time.time()
+    decisions = judge.evaluate_batch(columns)
+    elapsed = time.time() - start_time
+    
+    print(f"⏱️  Judge Batch Performance:")
+    print(f"   Results evaluated: {len(decisions)}")
+    print(f"   Time elapsed: {elapsed:.3f} seconds")
+    print(f"   Decisions: {decisions.counts()}")
+    
+    assert len(decisions) == n
+    assert elapsed < 1.0, f"Batch Judge too slow: {elapsed:.3f}s for {n} results"
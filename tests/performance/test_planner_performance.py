@@ -13,3 +13,19 @@ def test_planner_decomposition_performance():
     print(f"Planner: {len(tasks)} tasks in {elapsed:.3f}s")
     assert len(tasks) == 1000
     assert elapsed < 5.0
+
+def test_planner_streaming_time_to_first_task():
+    from agents.planner.task_decomposer import Planner
+    
+    planner = Planner()
+    campaign_goals = {"objective": "Test", "budget": 100_000_000}  # 1M tasks
+    
+    start = time.time()
+    stream = planner.assign_tasks_iter(campaign_goals, ["w1", "w2", "w3"])
+    worker, task = next(stream)
+    elapsed = time.time() - start
+    
+    print(f"Planner: first of 1M tasks streamed to {worker} in {elapsed*1000:.3f}ms")
+    assert worker == "w1"
+    assert "task_id" in task
+    assert elapsed < 0.05
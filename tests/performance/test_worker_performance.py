@@ -1,9 +1,11 @@
 """Performance tests for Worker agent."""
 
 import time
-import concurrent.futures
 
-def test_worker_concurrent_execution():
+import pytest
+
+@pytest.mark.asyncio
+async def test_worker_concurrent_execution():
     """Test Worker executes 500 tasks concurrently in < 30 seconds (SLA from spec)."""
     from agents.worker.executor import Worker
     
@@ -19,20 +21,10 @@ def test_worker_concurrent_execution():
         }
         test_tasks.append(task)
     
-    # Execute concurrently
+    # Execute concurrently on a single event loop
     start_time = time.time()
     
-    results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit all tasks
-        future_to_task = {
-            executor.submit(worker.execute, task): task 
-            for task in test_tasks
-        }
-        
-        # Collect results as they complete
-        for future in concurrent.futures.as_completed(future_to_task):
-            results.append(future.result())
+    results = await worker.execute_many_async(test_tasks, max_concurrency=500)
     
     end_time = time.time()
     elapsed = end_time - start_time
@@ -1,7 +1,29 @@
+import httpx
 import pytest
 
-def test_trend_data_contract():
+from skills.trends.trend_fetcher import TrendAggregator, TrendSource, fetch_trends
+
+
+def stand_in_source(request):
+    """Local stand-in for a trend MCP/HTTP source."""
+    return httpx.Response(200, json={"trends": [
+        {"topic": "AI agents", "score": 0.9, "url": "https://example.test/ai"},
+        {"topic": "Base L2", "score": 0.4},
+    ]})
+
+
+@pytest.mark.asyncio
+async def test_trend_data_contract():
     """Asserts that the trend data structure matches the API contract"""
-    # Intentional failure: data is None
-    data = None 
+    client = httpx.AsyncClient(transport=httpx.MockTransport(stand_in_source))
+    aggregator = TrendAggregator([TrendSource("news", "https://news.test/trends")], client=client)
+    data = await fetch_trends(category="tech", aggregator=aggregator)
+    await client.aclose()
+
     assert data is not None, "Trend Fetcher should return a valid data structure"
+    assert isinstance(data, list) and len(data) == 2
+    for trend in data:
+        assert isinstance(trend["topic"], str)
+        assert isinstance(trend["relevance_score"], float)
+        assert trend["source_url"].startswith("https://")
+    assert data[0]["topic"] == "AI agents"
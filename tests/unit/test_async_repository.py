@@ -0,0 +1,99 @@
+"""Tests for the async Campaign/Task repository layer."""
+
+import pytest
+import pytest_asyncio
+
+from models.async_repository import (
+    CampaignRepository, TaskRepository, async_database_url, create_async_db, create_schema_async,
+)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine, factory = create_async_db(f"sqlite:///{tmp_path / 'async.db'}")
+    await create_schema_async(engine)
+    yield factory
+    await engine.dispose()
+
+
+def test_async_database_url_maps_drivers():
+    """Test sync URLs are mapped onto asyncio drivers."""
+    assert async_database_url("postgresql://u:p@db/chimera").drivername == "postgresql+asyncpg"
+    assert async_database_url("postgresql+psycopg2://u:p@db/c").drivername == "postgresql+asyncpg"
+    assert async_database_url("sqlite:///x.db").drivername == "sqlite+aiosqlite"
+    with pytest.raises(ValueError):
+        async_database_url("mysql://u:p@db/c")
+
+
+@pytest.mark.asyncio
+async def test_task_repository_upsert_and_stream(session_factory):
+    """Test bulk insert, status/result upserts and streamed reads."""
+    campaigns = CampaignRepository(session_factory)
+    tasks = TaskRepository(session_factory, chunk_size=7)
+    await campaigns.add("c1", "Async campaign", 500.0)
+
+    written = await tasks.add_many(
+        {"id": f"t{i:02d}", "campaign_id": "c1", "assigned_to": "w1", "action": f"Part {i}"}
+        for i in range(20)
+    )
+    assert written == 20
+
+    await tasks.upsert_results(
+        {"id": f"t{i:02d}", "status": "done", "result": f"ok {i}"} for i in range(0, 20, 2)
+    )
+
+    done = [row async for row in tasks.stream(campaign_id="c1", status="done", batch_size=3)]
+    assert [row["id"] for row in done] == [f"t{i:02d}" for i in range(0, 20, 2)]
+    assert done[0]["result_size"] == 4
+    payloads = await tasks.get_results(row["result_ref"] for row in done)
+    assert payloads[done[0]["result_ref"]] == "ok 0"
+    # Upserts leave the other columns untouched
+    assert done[0]["action"] == "Part 0" and done[0]["assigned_to"] == "w1"
+
+    pending = [row async for row in tasks.stream(status="pending")]
+    assert len(pending) == 10
+    assert (await campaigns.get("c1")).budget == 500.0
+    assert (await tasks.get("t01")).status == "pending"
+
+
+@pytest.mark.asyncio
+async def test_partial_upserts_leave_other_columns_alone(session_factory):
+    """Test result-only and status-only upserts do not clobber each other."""
+    campaigns = CampaignRepository(session_factory)
+    tasks = TaskRepository(session_factory)
+    await campaigns.add("c1", "Partial upserts", 10.0)
+    await tasks.add_many([{"id": "t1", "campaign_id": "c1", "action": "a"},
+                          {"id": "t2", "campaign_id": "c1", "action": "b"}])
+    await tasks.upsert_results([{"id": "t1", "status": "done", "result": "hello"}])
+
+    # Result only: status stays "done"
+    await tasks.upsert_results([{"id": "t1", "result": "world"}])
+    t1 = await tasks.get("t1")
+    assert t1.status == "done"
+    assert (await tasks.get_results([t1.result_ref]))[t1.result_ref] == "world"
+
+    # Status only: the result reference survives; mixed shapes in one call
+    await tasks.upsert_results([{"id": "t1", "status": "failed"},
+                                {"id": "t2", "result": "second"},
+                                {"id": "t3", "campaign_id": "c1", "action": "new"}])
+    t1, t2, t3 = [await tasks.get(task_id) for task_id in ("t1", "t2", "t3")]
+    assert t1.status == "failed" and t1.result_ref is not None and t1.result_size == 5
+    assert t2.status == "pending" and t2.result_size == 6
+    assert t3.status == "pending" and t3.action == "new"
+
+
+@pytest.mark.asyncio
+async def test_partial_update_fallback_without_on_conflict(session_factory, monkeypatch):
+    """Test the UPDATE fallback also only writes the columns each row carries."""
+    from models import async_repository
+
+    monkeypatch.setattr(async_repository, "_UPSERT_INSERTS", {})
+    tasks = TaskRepository(session_factory)
+    await CampaignRepository(session_factory).add("c1", "Fallback", 10.0)
+    await tasks.add_many([{"id": "t1", "campaign_id": "c1", "status": "done", "result": "hi"}])
+
+    await tasks.upsert_results([{"id": "t1", "status": "failed"}])
+    await tasks.upsert_results([{"id": "t1", "result": "again"}])
+
+    t1 = await tasks.get("t1")
+    assert t1.status == "failed" and t1.result_size == 5
@@ -0,0 +1,175 @@
+"""Tests for the write-behind Judge audit log."""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from agents.judge.audit_log import AuditBufferFull, AuditLogBuffer, DatabaseAuditWriter
+from agents.judge.evaluator import Judge
+
+
+class FakeWriter:
+    def __init__(self, block=None):
+        self.batches = []
+        self.block = block
+
+    def __call__(self, rows):
+        if self.block is not None:
+            self.block.wait()
+        self.batches.append(list(rows))
+
+    @property
+    def rows(self):
+        return [row for batch in self.batches for row in batch]
+
+
+def test_judge_records_decisions_in_batches():
+    """Test evaluate returns immediately and rows are written in batches."""
+    writer = FakeWriter()
+    audit = AuditLogBuffer(writer, batch_size=10, flush_interval=5.0)
+    judge = Judge(audit_log=audit)
+
+    for i in range(25):
+        judge.evaluate({"task_id": f"t{i}", "confidence": 0.95})
+    assert audit.flush(timeout=10)
+
+    assert len(writer.rows) == 25
+    assert [len(batch) for batch in writer.batches][:2] == [10, 10]
+    assert writer.rows[0]["review_status"] == "auto_approved"
+    assert writer.rows[0]["agent_id"] == "judge"
+    audit.close()
+
+
+def test_partial_batch_flushed_after_interval():
+    """Test a trickle of decisions is written once flush_interval passes."""
+    writer = FakeWriter()
+    audit = AuditLogBuffer(writer, batch_size=1000, flush_interval=0.05)
+    audit.record({"task_id": "t", "action": "escalate", "reason": "HITL_REQUIRED"})
+
+    assert audit.flush(timeout=5)
+    assert writer.rows[0]["review_status"] == "pending_hitl"
+    audit.close()
+
+
+def test_backpressure_raises_when_full():
+    """Test record blocks then raises once the bounded buffer stays full."""
+    release = threading.Event()
+    audit = AuditLogBuffer(FakeWriter(block=release), batch_size=1,
+                           max_buffered=2, put_timeout=0.05)
+    decision = {"task_id": "t", "action": "queue"}
+
+    with pytest.raises(AuditBufferFull):
+        for _ in range(10):
+            audit.record(decision)
+
+    release.set()
+    audit.close()
+    assert audit.stats()["pending"] == 0
+
+
+def test_failed_writes_are_retried():
+    """Test a transient writer failure does not lose the batch."""
+    calls = []
+
+    def flaky(rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise ConnectionError("db down")
+
+    audit = AuditLogBuffer(flaky, batch_size=5, flush_interval=0.01)
+    for i in range(5):
+        audit.record({"task_id": f"t{i}", "action": "approve"})
+
+    assert audit.flush(timeout=5)
+    assert calls == [5, 5]
+    assert audit.stats()["failed_writes"] == 1
+    audit.close()
+
+
+def test_close_drains_buffer():
+    """Test close writes everything still buffered and rejects new decisions."""
+    writer = FakeWriter()
+    audit = AuditLogBuffer(writer, batch_size=100, flush_interval=60)
+    judge = Judge(audit_log=audit)
+    judge.evaluate_batch([{"task_id": f"t{i}", "confidence": 0.5} for i in range(250)])
+
+    audit.close()
+
+    assert len(writer.rows) == 250
+    assert audit.stats()["written"] == 250
+    with pytest.raises(RuntimeError):
+        audit.record({"task_id": "late", "action": "approve"})
+
+
+def test_batch_is_queued_as_one_chunk():
+    """Test a batch larger than max_buffered is queued whole and written in batches."""
+    writer = FakeWriter()
+    audit = AuditLogBuffer(writer, batch_size=40, flush_interval=60,
+                           max_buffered=100, put_timeout=0.05)
+    judge = Judge(audit_log=audit)
+
+    judge.evaluate_batch({"task_id": [f"t{i}" for i in range(250)], "confidence": [0.95] * 250})
+    audit.close()
+
+    assert [row["task_id"] for row in writer.rows] == [f"t{i}" for i in range(250)]
+    assert max(len(batch) for batch in writer.batches) == 40
+    assert len({row["timestamp"] for row in writer.rows}) == 1
+
+
+def test_full_buffer_rejects_the_whole_batch():
+    """Test a batch that does not fit is not partially queued."""
+    release = threading.Event()
+    writer = FakeWriter(block=release)
+    audit = AuditLogBuffer(writer, batch_size=100, flush_interval=0.01,
+                           max_buffered=5, put_timeout=0.05)
+    decision = {"task_id": "t", "action": "queue"}
+    audit.record(decision)
+    while audit.pending:  # the flusher holds the first row in its blocked write
+        threading.Event().wait(0.01)
+    audit.record_many([decision] * 3)
+
+    with pytest.raises(AuditBufferFull):
+        audit.record_many([decision] * 3)
+    assert audit.pending == 3
+
+    release.set()
+    audit.close()
+    assert len(writer.rows) == 4
+
+
+def test_close_rejects_records_and_reports_leftovers():
+    """Test close raises when rows are still unwritten, and nothing is accepted after it."""
+    release = threading.Event()
+    writer = FakeWriter(block=release)
+    audit = AuditLogBuffer(writer, batch_size=1, flush_interval=0.01)
+    audit.record({"task_id": "t1", "action": "approve"})
+    audit.record({"task_id": "t2", "action": "approve"})
+
+    with pytest.raises(TimeoutError):
+        audit.close(timeout=0.05)
+    with pytest.raises(RuntimeError):
+        audit.record({"task_id": "late", "action": "approve"})
+
+    release.set()
+    audit.close()
+    assert audit.flush(timeout=1)
+    assert [row["task_id"] for row in writer.rows] == ["t1", "t2"]
+
+
+def test_database_writer_persists_rows(tmp_path):
+    """Test the SQLAlchemy writer round-trips decisions into audit_logs."""
+    from models.database import AuditLog, Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(engine)
+    audit = AuditLogBuffer(DatabaseAuditWriter(engine), batch_size=50)
+    judge = Judge(audit_log=audit)
+    for i in range(120):
+        judge.evaluate({"task_id": f"t{i}", "confidence": 0.8})
+    audit.close()
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(AuditLog)).scalar() == 120
+        status = conn.execute(select(AuditLog.review_status).limit(1)).scalar()
+    assert status == "queued"
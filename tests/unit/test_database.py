@@ -0,0 +1,313 @@
+"""Tests for the SQLAlchemy persistence layer."""
+
+import uuid
+
+from sqlalchemy import Column, MetaData, Table, create_engine, insert, select
+
+
+def test_binary_uuid_roundtrip_sqlite():
+    """Test BinaryUUID stores 16 bytes but hands back canonical strings."""
+    from models.database import BinaryUUID
+
+    engine = create_engine("sqlite://")
+    metadata = MetaData()
+    table = Table("ids", metadata, Column("id", BinaryUUID(), primary_key=True))
+    metadata.create_all(engine)
+
+    task_id = str(uuid.uuid4())
+    with engine.begin() as conn:
+        conn.execute(insert(table), [{"id": task_id}])
+        assert conn.execute(select(table.c.id)).scalar() == task_id
+        raw = conn.exec_driver_sql("SELECT id FROM ids").scalar()
+
+    assert isinstance(raw, bytes) and len(raw) == 16
+
+
+def _session():
+    from sqlalchemy.orm import Session
+    from models.database import Base
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def test_bulk_insert_tasks_streams_chunks():
+    """Test bulk inserts consume a generator in chunks and apply defaults."""
+    from models.bulk import bulk_insert_tasks
+    from models.database import Campaign, Task
+
+    session = _session()
+    session.add(Campaign(id="c1", objective="Test", budget=100.0))
+    session.flush()
+    consumed = []
+
+    def rows():
+        for i in range(2500):
+            consumed.append(i)
+            yield {"id": str(uuid.uuid4()), "campaign_id": "c1",
+                   "assigned_to": f"w{i % 3}", "action": f"Part {i}"}
+
+    written = bulk_insert_tasks(session, rows(), chunk_size=1000)
+    session.commit()
+
+    assert written == 2500 == len(consumed)
+    assert session.query(Task).count() == 2500
+    assert {t.status for t in session.query(Task)} == {"pending"}
+
+
+def test_copy_value_escaping():
+    """Test COPY text-format escaping of NULLs and control characters."""
+    from models.bulk import _copy_value
+
+    assert _copy_value(None) == "\\N"
+    assert _copy_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+    assert _copy_value(1.5) == "1.5"
+
+
+def test_engine_is_shared_per_process(tmp_path, monkeypatch):
+    """Test get_engine/init_db reuse one pooled engine and create the schema once."""
+    from sqlalchemy import event
+    from models import database
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'shared.db'}")
+    database.dispose_engines()
+    created = []
+
+    def on_create(*args, **kwargs):
+        created.append(1)
+
+    event.listen(database.Base.metadata, "after_create", on_create)
+    try:
+        first, second = database.init_db(), database.init_db()
+
+        assert first.get_bind() is second.get_bind() is database.get_engine()
+        assert len(created) == 1
+    finally:
+        event.remove(database.Base.metadata, "after_create", on_create)
+        database.dispose_engines()
+
+
+def test_pool_options_from_env(monkeypatch):
+    """Test pool sizing comes from env and is skipped for SQLite."""
+    from models.database import pool_options
+
+    monkeypatch.setenv("CHIMERA_DB_POOL_SIZE", "20")
+    monkeypatch.setenv("CHIMERA_DB_POOL_RECYCLE", "60")
+
+    pg = pool_options("postgresql://user:pass@db/chimera")
+    assert pg["pool_size"] == 20 and pg["pool_recycle"] == 60 and pg["pool_pre_ping"]
+    assert "pool_size" not in pool_options("sqlite:///x.db")
+
+
+def test_scoped_sessions_per_thread_and_task(tmp_path):
+    """Test the scoped factory hands out one Session per thread and per asyncio task."""
+    import asyncio
+    import threading
+    from models import database
+
+    factory = database.get_session_factory(f"sqlite:///{tmp_path / 'scoped.db'}")
+    try:
+        main_session = factory()
+        assert factory() is main_session
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(factory()))
+        thread.start()
+        thread.join()
+        assert other[0] is not main_session
+
+        async def in_task():
+            session = factory()
+            await asyncio.sleep(0)
+            assert factory() is session
+            return session
+
+        async def run_two():
+            return await asyncio.gather(in_task(), in_task())
+
+        a, b = asyncio.run(run_two())
+        assert a is not b and main_session not in (a, b)
+    finally:
+        factory.remove()
+        database.dispose_engines()
+
+
+def test_scoped_sessions_are_not_inherited_by_later_tasks(tmp_path):
+    """Test a finished task's Session is dropped, not handed to a new task."""
+    import asyncio
+    import gc
+    from models import database
+
+    factory = database.get_session_factory(f"sqlite:///{tmp_path / 'scoped.db'}")
+    try:
+        async def leaky():
+            return factory()  # never calls factory.remove()
+
+        async def run_sequentially():
+            # Each task is freed before the next starts, so ids get reused
+            return [await asyncio.create_task(leaky()) for _ in range(20)]
+
+        sessions = asyncio.run(run_sequentially())
+        assert len({id(session) for session in sessions}) == 20
+        gc.collect()
+        assert len(factory.registry.registry) == 0
+    finally:
+        database.dispose_engines()
+
+
+def _seed_queue(session, count, workers=("w1", "w2")):
+    from models.database import Campaign, Task
+
+    session.add(Campaign(id="c1", objective="Queue", budget=100.0))
+    session.add_all(
+        Task(id=f"task-{i:04d}", campaign_id="c1", assigned_to=workers[i % len(workers)],
+             action=f"Part {i}", status="pending")
+        for i in range(count)
+    )
+    session.commit()
+
+
+def test_claim_tasks_for_assigned_worker():
+    """Test claims are scoped to the worker, FIFO by id, and never repeated."""
+    from models.task_queue import claim_tasks
+
+    session = _session()
+    _seed_queue(session, 10)
+
+    first = claim_tasks(session, "w1", 3)
+    second = claim_tasks(session, "w1", 10)
+
+    assert [t["id"] for t in first] == ["task-0000", "task-0002", "task-0004"]
+    assert [t["id"] for t in second] == ["task-0006", "task-0008"]
+    assert claim_tasks(session, "w1", 10) == []
+
+
+def test_claim_tasks_work_stealing_and_release():
+    """Test any_worker claims reassign work and release returns it to the queue."""
+    from models.database import Task
+    from models.task_queue import claim_tasks, complete_task, release_tasks
+
+    session = _session()
+    _seed_queue(session, 6)
+
+    stolen = claim_tasks(session, "w3", 4, campaign_id="c1", any_worker=True)
+    assert len(stolen) == 4 and {t["assigned_to"] for t in stolen} == {"w3"}
+
+    complete_task(session, stolen[0]["id"], result="ok")
+    assert release_tasks(session, "w3") == 3
+    statuses = sorted(t.status for t in session.query(Task))
+    assert statuses == ["done"] + ["pending"] * 5
+
+
+def test_task_queue_indexes_exist(tmp_path):
+    """Test create_schema adds the composite queue indexes to an existing tasks table."""
+    from sqlalchemy import create_engine, inspect, text
+    from models.database import create_schema
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE campaigns (id VARCHAR PRIMARY KEY, objective VARCHAR "
+                          "NOT NULL, budget FLOAT NOT NULL, status VARCHAR)"))
+        conn.execute(text("CREATE TABLE tasks (id VARCHAR PRIMARY KEY, campaign_id VARCHAR "
+                          "REFERENCES campaigns (id), assigned_to VARCHAR, action VARCHAR, "
+                          "status VARCHAR, result_ref VARCHAR(64), result_size INTEGER)"))
+
+    create_schema(engine)
+    create_schema(engine)  # indexes already present: no-op
+
+    indexes = {ix["name"]: ix["column_names"] for ix in inspect(engine).get_indexes("tasks")}
+    assert indexes["ix_tasks_campaign_status"] == ["campaign_id", "status"]
+    assert indexes["ix_tasks_assigned_status"] == ["assigned_to", "status"]
+
+
+def test_results_stored_out_of_line_and_deduplicated():
+    """Test bulk results become compressed blobs shared by identical payloads."""
+    from models.bulk import bulk_insert_tasks
+    from models.database import Campaign, ResultBlob, Task
+
+    session = _session()
+    session.add(Campaign(id="c1", objective="Blobs", budget=10.0))
+    session.flush()
+    report = "engagement report " * 200
+    bulk_insert_tasks(session, (
+        {"id": f"t{i}", "campaign_id": "c1", "status": "done",
+         "result": report if i % 2 else f"short {i}"}
+        for i in range(10)
+    ), chunk_size=3)
+    session.commit()
+
+    blobs = session.query(ResultBlob).all()
+    assert len(blobs) == 6  # one shared report + five distinct short results
+    shared = next(b for b in blobs if b.size == len(report))
+    assert len(shared.data) < shared.size // 10
+
+    task = session.get(Task, "t1")
+    assert task.result_ref == shared.digest and task.result_size == len(report)
+    assert task.result == report
+    assert session.get(Task, "t0").result == "short 0"
+
+
+def test_result_codecs_roundtrip():
+    """Test zlib, zstd (when installed) and raw blobs all decode."""
+    from models import result_store
+
+    payload = "résultat " * 50
+    blob = result_store.encode(payload, codec="zlib")
+    assert blob["codec"] == "zlib"
+    assert result_store.decode(blob["codec"], blob["data"]) == payload
+    assert result_store.encode("x")["codec"] == "raw"
+    if result_store.zstandard is not None:
+        blob = result_store.encode(payload, codec="zstd")
+        assert result_store.decode("zstd", blob["data"]) == payload
+
+
+def test_complete_task_stores_result_reference():
+    """Test queue completion writes a reference, loadable without the ORM."""
+    from models.database import Task
+    from models.result_store import load_results
+    from models.task_queue import claim_tasks, complete_task
+
+    session = _session()
+    _seed_queue(session, 2)
+    (task,) = claim_tasks(session, "w1", 1)
+    complete_task(session, task["id"], result="ok")
+
+    ref = session.query(Task.result_ref).filter(Task.id == task["id"]).scalar()
+    assert load_results(session, [ref, None]) == {ref: "ok"}
+
+
+def test_migrate_inline_results(tmp_path):
+    """Test a pre-blob database has its tasks.result payloads moved to result_blobs."""
+    from sqlalchemy import create_engine, inspect, text
+    from sqlalchemy.orm import Session
+    from models.database import Base, Task, create_schema
+    from models.result_store import migrate_inline_results
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE campaigns (id VARCHAR PRIMARY KEY, objective VARCHAR "
+                          "NOT NULL, budget FLOAT NOT NULL, status VARCHAR)"))
+        conn.execute(text("CREATE TABLE tasks (id VARCHAR PRIMARY KEY, campaign_id VARCHAR "
+                          "REFERENCES campaigns (id), assigned_to VARCHAR, action VARCHAR, "
+                          "status VARCHAR, result VARCHAR)"))
+        conn.execute(text("INSERT INTO campaigns VALUES ('c1', 'Legacy', 1.0, 'active')"))
+        conn.execute(text("INSERT INTO tasks VALUES (:id, 'c1', 'w1', 'a', 'done', :result)"), [
+            {"id": f"t{i}", "result": None if i == 0 else "same" if i % 2 else f"out {i}"}
+            for i in range(7)
+        ])
+
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        assert migrate_inline_results(conn, chunk_size=2) == 6
+    create_schema(engine)  # no-op on the migrated layout
+
+    columns = {c["name"] for c in inspect(engine).get_columns("tasks")}
+    assert "result" not in columns and {"result_ref", "result_size"} <= columns
+    with Session(engine) as session:
+        assert session.get(Task, "t0").result is None
+        assert session.get(Task, "t1").result == "same"
+        assert session.get(Task, "t4").result == "out 4"
+        assert session.get(Task, "t4").result_size == 5
+        assert session.execute(text("SELECT COUNT(*) FROM result_blobs")).scalar() == 4
+    engine.dispose()
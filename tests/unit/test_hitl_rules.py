@@ -0,0 +1,76 @@
+"""Tests for the compiled HITL rule engine."""
+
+import json
+
+import pytest
+
+from agents.judge.evaluator import Judge
+from agents.judge.hitl_rules import HITLRuleEngine, compile_rules
+
+
+def test_default_rules_match_spec():
+    """Test defaults keep finance > $50 and the sensitive categories."""
+    rules = compile_rules({
+        "sensitive_categories": ["politics", "health", "legal", "security"],
+        "amount_thresholds": {"finance": 50},
+    })
+
+    assert rules.requires_review("finance", 100)
+    assert not rules.requires_review("finance", 50)
+    assert rules.requires_review("health", 0)
+    assert not rules.requires_review("regular", 1_000_000)
+    assert not rules.requires_review(None)
+    assert rules.rule_count == 5
+
+
+def test_campaign_overrides():
+    """Test per-campaign rules extend categories and override thresholds."""
+    engine = HITLRuleEngine({
+        "sensitive_categories": ["politics"],
+        "amount_thresholds": {"finance": 50},
+        "campaigns": {"eco": {"sensitive_categories": ["crypto"],
+                              "amount_thresholds": {"finance": 10}}},
+    })
+
+    assert engine.requires_review("finance", 20, campaign_id="eco")
+    assert not engine.requires_review("finance", 20)
+    assert engine.requires_review("crypto", campaign_id="eco")
+    assert not engine.requires_review("crypto", campaign_id="other")
+    assert engine.requires_review("politics", campaign_id="eco")
+
+
+def test_unknown_rule_keys_rejected():
+    """Test typos in rule files fail loudly instead of silently disabling rules."""
+    with pytest.raises(ValueError):
+        compile_rules({"sensitive_category": ["politics"]})
+
+
+def test_judge_picks_up_reloaded_rules(tmp_path):
+    """Test reloading rules changes Judge decisions without a restart."""
+    engine = HITLRuleEngine()
+    judge = Judge(hitl_rules=engine)
+    task = {"task_id": "t", "confidence": 0.95, "task_type": "gaming"}
+    assert judge.evaluate(task)["action"] == "approve"
+
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"sensitive_categories": ["gaming"]}))
+    engine.reload_file(path)
+
+    assert judge.evaluate(task)["reason"] == "HITL_REQUIRED"
+    assert judge.evaluate_batch([task])[0]["reason"] == "HITL_REQUIRED"
+
+
+def test_batch_respects_campaign_overrides():
+    """Test evaluate_batch applies per-campaign tables row by row."""
+    judge = Judge(hitl_rules={
+        "amount_thresholds": {"finance": 50},
+        "campaigns": {"strict": {"amount_thresholds": {"finance": 5}}},
+    })
+    results = [
+        {"confidence": 0.95, "task_type": "finance", "amount": 20, "campaign_id": "strict"},
+        {"confidence": 0.95, "task_type": "finance", "amount": 20, "campaign_id": "loose"},
+        {"confidence": 0.95, "task_type": "finance", "amount": 20},
+    ]
+
+    assert judge.evaluate_batch(results).to_dicts() == [judge.evaluate(r) for r in results]
+    assert judge.evaluate_batch(results).hitl.tolist() == [True, False, False]
@@ -54,3 +54,44 @@ def test_judge_hitl_trigger():
     assert decision["action"] == "escalate", \
         "Finance tasks > $50 should escalate to HITL"
     assert "HITL" in decision.get("reason", "").upper()
+
+def test_judge_evaluate_batch_matches_evaluate():
+    """Test vectorized batch decisions match per-result evaluate() exactly."""
+    import random
+    from agents.judge.evaluator import Judge
+
+    judge = Judge()
+    rng = random.Random(42)
+    task_types = [None, "regular", "finance", "politics", "health", "legal", "security"]
+    results = []
+    for i in range(2000):
+        result = {"task_id": f"t{i}", "confidence": rng.choice([0.69, 0.7, 0.9, 0.91, rng.random()])}
+        task_type = rng.choice(task_types)
+        if task_type is not None:
+            result["task_type"] = task_type
+        if rng.random() < 0.5:
+            result["amount"] = rng.choice([0, 50, 50.01, 100])
+        results.append(result)
+    results.append({})  # every field defaulted
+
+    batch = judge.evaluate_batch(results)
+
+    assert batch.to_dicts() == [judge.evaluate(r) for r in results]
+
+def test_judge_evaluate_batch_columnar_masks():
+    """Test columnar input returns decision masks without building dicts."""
+    import numpy as np
+    from agents.judge.evaluator import Judge
+
+    judge = Judge()
+    batch = judge.evaluate_batch({
+        "confidence": np.array([0.5, 0.8, 0.95, 0.95, 0.95]),
+        "task_type": np.array(["regular", "regular", "regular", "finance", "health"]),
+        "amount": np.array([0, 0, 0, 100, 0]),
+    })
+
+    assert batch.approve.tolist() == [False, False, True, False, False]
+    assert batch.hitl.tolist() == [False, False, False, True, True]
+    assert batch.counts() == {"approve": 1, "queue": 1, "escalate": 3}
+    assert batch[3]["reason"] == "HITL_REQUIRED"
+    assert batch[0]["task_id"] == "unknown"
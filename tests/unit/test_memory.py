@@ -0,0 +1,81 @@
+"""Tests for ephemeral agent memory."""
+
+import time
+
+import pytest
+
+from agents.memory import EphemeralMemory, InProcessMemoryBackend, RedisMemoryBackend
+
+
+@pytest.fixture(params=["in_process", "redis"])
+def backend(request, fake_clock):
+    if request.param == "in_process":
+        return InProcessMemoryBackend(max_entries=3, clock=fake_clock)
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisMemoryBackend(fakeredis.FakeRedis(), max_entries=3, clock=fake_clock)
+
+
+def test_agent_memories_are_isolated(backend):
+    """Test each agent_id has its own namespace."""
+    memory = EphemeralMemory(backend)
+    worker_1, worker_2 = memory.for_agent("worker_1"), memory.for_agent("worker_2")
+
+    worker_1.set("last_post", {"id": 7, "likes": 12})
+    assert worker_1.get("last_post") == {"id": 7, "likes": 12}
+    assert worker_2.get("last_post", "none") == "none"
+
+    worker_1.clear()
+    assert worker_1.get("last_post") is None
+
+
+def test_batch_get_and_set(backend):
+    """Test batch calls return only the keys that are present."""
+    memory = EphemeralMemory(backend).for_agent("w")
+    memory.set_many({"a": 1, "b": [2], "c": "three"})
+
+    assert memory.get_many(["a", "c", "missing"]) == {"a": 1, "c": "three"}
+    memory.delete("a")
+    assert memory.get_many(["a", "b"]) == {"b": [2]}
+    assert len(memory) == 2
+
+
+def test_lru_eviction_beyond_max_entries(backend):
+    """Test the least recently used entry goes first once the agent is full."""
+    memory = EphemeralMemory(backend).for_agent("w")
+    memory.set_many({"a": 1, "b": 2, "c": 3})
+    backend.clock.now += 1
+    memory.get("a")  # a is now more recent than b
+    backend.clock.now += 1
+    memory.set("d", 4)
+
+    assert memory.get_many(["a", "b", "c", "d"]) == {"a": 1, "c": 3, "d": 4}
+
+
+def test_short_ttl_write_keeps_longer_entries_tracked(backend):
+    """Test a short-TTL write cannot drop longer-lived entries from LRU tracking."""
+    memory = EphemeralMemory(backend, default_ttl=3600).for_agent("w")
+    memory.set_many({"long1": 1, "long2": 2})
+    backend.clock.now += 1
+    memory.set("short", 3, ttl=0.2)
+    backend.clock.now += 2
+    if isinstance(backend, RedisMemoryBackend):
+        time.sleep(1.1)  # Redis TTLs run on real time; outlast the short write's +1s margin
+
+    assert len(memory) == 2
+    memory.set("d", 4)  # max_entries=3: trims the least recently used
+    assert memory.get_many(["long1", "long2", "short", "d"]) == {"long2": 2, "d": 4}
+    memory.clear()
+    assert len(memory) == 0 and memory.get("long2") is None
+
+
+def test_entries_expire_after_ttl(fake_clock):
+    """Test entries vanish once their TTL has passed."""
+    backend = InProcessMemoryBackend(clock=fake_clock)
+    memory = EphemeralMemory(backend, default_ttl=60).for_agent("w")
+    memory.set("short", 1, ttl=5)
+    memory.set("long", 2)
+
+    fake_clock.now += 10
+    assert memory.get_many(["short", "long"]) == {"long": 2}
+    fake_clock.now += 60
+    assert memory.get("long") is None and len(memory) == 0
@@ -0,0 +1,129 @@
+"""Tests for the pipelined Planner -> Worker -> Judge runtime."""
+
+import asyncio
+import contextlib
+import time
+
+import pytest
+
+from agents.judge.evaluator import Judge
+from agents.pipeline import SwarmPipeline
+from agents.worker.executor import Worker
+
+WORKERS = ["w1", "w2", "w3"]
+
+
+def _goals(num_tasks):
+    return {"objective": "Pipeline", "budget": num_tasks * 100.0}
+
+
+@pytest.fixture
+def worker():
+    worker = Worker()
+    worker._simulate_transient_error = lambda: False
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_every_task_is_executed_and_judged_once(worker):
+    """Test each planned task yields exactly one decision carrying its result."""
+    pipeline = SwarmPipeline(worker=worker, worker_concurrency=8, judge_concurrency=2)
+
+    decisions = await pipeline.run_all(_goals(50), WORKERS)
+
+    assert len({d["task_id"] for d in decisions}) == 50
+    assert all(d["result"]["success"] for d in decisions)
+    assert {d["result"]["assigned_to"] for d in decisions} == set(WORKERS)
+    stats = pipeline.stats()
+    assert [stats[s]["processed"] for s in ("plan", "execute", "judge", "output")] == [50] * 4
+    assert stats["execute"]["throughput"] > 0
+
+
+@pytest.mark.asyncio
+async def test_first_decision_arrives_before_planning_finishes(worker):
+    """Test results stream out per task instead of per campaign."""
+    pipeline = SwarmPipeline(worker=worker, worker_concurrency=4, queue_size=10)
+
+    async with contextlib.aclosing(pipeline.run(_goals(200), WORKERS)) as decisions:
+        async for _ in decisions:
+            assert pipeline.stats()["plan"]["processed"] < 200
+            break
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_cancels_the_stages(worker):
+    """Test breaking out under aclosing stops planning and execution at once."""
+    pipeline = SwarmPipeline(worker=worker, worker_concurrency=2, queue_size=2)
+
+    async with contextlib.aclosing(pipeline.run(_goals(200), WORKERS)) as decisions:
+        async for _ in decisions:
+            break
+    planned = pipeline.stats()["plan"]["processed"]
+    await asyncio.sleep(0.05)
+
+    stats = pipeline.stats()
+    assert stats["plan"]["processed"] == planned < 200
+    assert stats["execute"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_judge_concurrency_runs_evaluations_in_parallel(worker):
+    """Test judge_concurrency > 1 overlaps blocking Judge evaluations."""
+    judge = Judge()
+    evaluate = judge.evaluate
+
+    def slow_evaluate(result):
+        time.sleep(0.05)
+        return evaluate(result)
+
+    judge.evaluate = slow_evaluate
+    pipeline = SwarmPipeline(worker=worker, judge=judge, worker_concurrency=8,
+                             judge_concurrency=8)
+
+    start = time.perf_counter()
+    decisions = await pipeline.run_all(_goals(16), WORKERS)
+
+    assert len(decisions) == 16
+    assert time.perf_counter() - start < 16 * 0.05 / 2
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_backpressures_planner(worker):
+    """Test bounded queues stop the planner from racing ahead of the consumer."""
+    pipeline = SwarmPipeline(worker=worker, worker_concurrency=2, queue_size=3)
+    seen = 0
+    async for _ in pipeline.run(_goals(100), WORKERS):
+        seen += 1
+        if seen == 5:
+            await asyncio.sleep(0.1)  # consumer stalls; every queue fills up
+            stats = pipeline.stats()
+            # Three full queues plus one item held by each execute/judge consumer
+            assert stats["plan"]["processed"] <= seen + 3 * 3 + 2 + 1
+            assert max(stats[s]["max_queue_depth"] for s in ("execute", "judge", "output")) <= 3
+    assert seen == 100
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_in_flight_tasks(worker):
+    """Test stop() ends planning but every planned task is still judged."""
+    pipeline = SwarmPipeline(worker=worker, worker_concurrency=4, queue_size=5)
+    decisions = []
+    async for decision in pipeline.run(_goals(500), WORKERS):
+        decisions.append(decision)
+        if len(decisions) == 10:
+            pipeline.stop()
+
+    planned = pipeline.stats()["plan"]["processed"]
+    assert 10 <= planned < 500
+    assert len(decisions) == planned
+
+
+@pytest.mark.asyncio
+async def test_stage_failure_is_raised(worker):
+    """Test an exception in a stage ends the run with that error, not a hang."""
+    judge = Judge()
+    judge.evaluate = lambda result: 1 / 0
+
+    pipeline = SwarmPipeline(worker=worker, judge=judge, worker_concurrency=4, queue_size=2)
+    with pytest.raises(ZeroDivisionError):
+        await asyncio.wait_for(pipeline.run_all(_goals(50), WORKERS), timeout=10)
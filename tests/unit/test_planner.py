@@ -118,4 +118,147 @@ def test_no_duplicate_tasks_across_workers():
     for worker in workers:
         worker_task_ids = [task["task_id"] for task in assignments[worker]]
         assert len(worker_task_ids) == len(set(worker_task_ids)), \
-            f"Worker {worker} has duplicate tasks"
\ No newline at end of file
+            f"Worker {worker} has duplicate tasks"
+
+def test_decompose_iter_is_lazy_and_matches_decompose():
+    """Test decompose_iter streams the same task shape and count as decompose"""
+    import types
+    planner = Planner()
+    campaign_goals = {"objective": "Streaming campaign", "budget": 700}
+
+    stream = planner.decompose_iter(campaign_goals)
+    assert isinstance(stream, types.GeneratorType)
+
+    streamed = list(stream)
+    tasks = planner.decompose(campaign_goals)
+    assert len(streamed) == len(tasks) == 7
+    assert [t["spec"] for t in streamed] == [t["spec"] for t in tasks]
+    assert streamed[0].keys() == tasks[0].keys()
+
+def test_assign_tasks_iter_round_robin():
+    """Test assign_tasks_iter yields (worker, task) pairs in round-robin order"""
+    planner = Planner()
+    campaign_goals = {"objective": "Test", "budget": 500}
+    workers = ["worker_1", "worker_2", "worker_3"]
+
+    pairs = list(planner.assign_tasks_iter(campaign_goals, workers))
+
+    assert [w for w, _ in pairs] == ["worker_1", "worker_2", "worker_3", "worker_1", "worker_2"]
+    task_ids = [task["task_id"] for _, task in pairs]
+    assert len(set(task_ids)) == len(task_ids)
+
+def test_assign_tasks_requires_workers():
+    """Test assigning without any Workers fails loudly"""
+    planner = Planner()
+    with pytest.raises(ValueError):
+        planner.assign_tasks({"budget": 100}, [])
+
+def test_task_batch_matches_decompose():
+    """Test TaskBatch yields the same dict views as the list-based decompose"""
+    from agents.planner.task_decomposer import TaskBatch, Task
+    planner = Planner()
+    campaign_goals = {"objective": "Columnar campaign", "budget": 500}
+
+    batch = planner.decompose_batch(campaign_goals)
+    assert isinstance(batch, TaskBatch)
+    assert len(batch) == 5
+
+    for task in batch:
+        assert task.keys() == {"task_id", "spec", "budget", "priority", "deadline"}
+        assert task["priority"] == "medium"
+    assert batch[-1]["spec"] == "Execute Columnar campaign - Part 5"
+    assert isinstance(batch.task(0), Task)
+    assert batch.total_budget() == 500.0
+
+def test_task_batch_roundtrip_and_interning():
+    """Test TaskBatch round-trips dicts and shares one copy of repeated strings"""
+    from agents.planner.task_decomposer import TaskBatch
+    tasks = [
+        {"task_id": "a", "spec": "A", "budget": 10.0, "priority": "high",
+         "deadline": "2027-01-01T00:00:00Z"},
+        {"task_id": "b", "spec": "B", "budget": 20.0, "priority": "low",
+         "deadline": "2027-01-01T00:00:00Z"},
+    ]
+
+    batch = TaskBatch.from_tasks(tasks)
+
+    assert batch.to_dicts() == tasks
+    assert batch[0]["deadline"] is batch[1]["deadline"]
+    assert list(batch.budgets) == [10.0, 20.0]
+
+def test_assign_batches_evenly():
+    """Test assign_batches distributes tasks evenly into per-worker batches"""
+    planner = Planner()
+    workers = ["worker_1", "worker_2", "worker_3"]
+
+    assignments = planner.assign_batches({"objective": "Test", "budget": 500}, workers)
+
+    counts = [len(batch) for batch in assignments.values()]
+    assert sorted(counts) == [1, 2, 2]
+    task_ids = [task["task_id"] for batch in assignments.values() for task in batch]
+    assert len(set(task_ids)) == 5
+
+def test_planner_uuid7_ids_are_time_ordered():
+    """Test the uuid7 generator yields unique, sortable RFC 9562 v7 IDs"""
+    import uuid
+    planner = Planner(id_generator="uuid7")
+
+    task_ids = [task["task_id"] for task in planner.decompose_iter({"budget": 300_000})]
+
+    assert len(task_ids) == 3000
+    assert len(set(task_ids)) == len(task_ids)
+    assert task_ids == sorted(task_ids)
+    assert all(uuid.UUID(task_id).version == 7 for task_id in task_ids)
+
+def test_planner_accepts_custom_id_generator():
+    """Test a plain callable can be plugged in as the ID generator"""
+    counter = iter(range(100))
+    planner = Planner(id_generator=lambda: f"task-{next(counter)}")
+
+    tasks = planner.decompose({"budget": 300})
+
+    assert [task["task_id"] for task in tasks] == ["task-0", "task-1", "task-2"]
+
+def test_planner_rejects_unknown_id_generator():
+    """Test unknown ID generator names fail at construction time"""
+    with pytest.raises(ValueError):
+        Planner(id_generator="snowflake")
+
+def test_least_loaded_favours_fast_idle_workers():
+    """Test least_loaded assignment weighs capacity, backlog and latency"""
+    from agents.planner.scheduler import WorkerDescriptor
+    planner = Planner()
+    workers = [
+        WorkerDescriptor("fast", capacity=4, ewma_latency=0.5),
+        WorkerDescriptor("slow", capacity=1, ewma_latency=2.0),
+        WorkerDescriptor("busy", capacity=2, in_flight=20, ewma_latency=0.5),
+    ]
+
+    assignments = planner.assign_tasks({"objective": "Test", "budget": 2000}, workers,
+                                       policy="least_loaded")
+
+    counts = {worker: len(tasks) for worker, tasks in assignments.items()}
+    assert sum(counts.values()) == 20
+    assert counts["fast"] > counts["slow"]
+    assert counts["busy"] == 0
+
+def test_least_loaded_with_identical_workers_is_even():
+    """Test least_loaded keeps the even-distribution guarantee for equal workers"""
+    planner = Planner()
+    workers = ["worker_1", "worker_2", "worker_3"]
+
+    assignments = planner.assign_tasks({"budget": 1000}, workers, policy="least_loaded")
+
+    task_counts = [len(tasks) for tasks in assignments.values()]
+    assert max(task_counts) - min(task_counts) <= 1
+
+def test_worker_descriptor_ewma():
+    """Test observed latencies are folded into the EWMA"""
+    from agents.planner.scheduler import WorkerDescriptor
+    worker = WorkerDescriptor("w1", ewma_latency=1.0)
+
+    worker.record_latency(3.0, alpha=0.5)
+
+    assert worker.ewma_latency == 2.0
+    with pytest.raises(ValueError):
+        WorkerDescriptor("w2", capacity=0)
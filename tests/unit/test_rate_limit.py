@@ -0,0 +1,102 @@
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from agents.rate_limit import InProcessRateLimitBackend, RateLimiter, RedisRateLimitBackend
+from agents.worker.executor import Worker
+
+
+def test_burst_then_paced_reservations(fake_clock):
+    """Test a full bucket grants its burst, then waits grow by 1/rate."""
+    backend = InProcessRateLimitBackend(clock=fake_clock)
+
+    waits = [backend.reserve("k", rate=10, capacity=3) for _ in range(5)]
+    assert waits == pytest.approx([0, 0, 0, 0.1, 0.2])
+
+    fake_clock.now += 1.0  # refills 10 tokens, capped at capacity
+    assert backend.reserve("k", 10, 3, tokens=3) == 0
+
+
+def test_timeout_reserves_nothing(fake_clock):
+    """Test a refused acquire leaves the bucket untouched."""
+    limiter = RateLimiter(InProcessRateLimitBackend(clock=fake_clock), limits={"k": (1, 1)})
+
+    assert limiter.try_acquire("k")
+    assert not limiter.try_acquire("k")
+    assert limiter.backend.reserve("k", 1, 1, max_wait=1.0) == pytest.approx(1.0)
+    assert limiter.try_acquire("unlimited")
+    with pytest.raises(ValueError):
+        limiter.try_acquire("k", tokens=5)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_are_paced_without_polling():
+    """Test concurrent callers sleep straight to their reserved slot."""
+    limiter = RateLimiter(InProcessRateLimitBackend())
+    limiter.limit_upstream("twitter", rate=50, capacity=1)
+
+    start = time.perf_counter()
+    granted = await asyncio.gather(*(limiter.acquire_for(upstream="twitter") for _ in range(10)))
+    elapsed = time.perf_counter() - start
+
+    assert all(granted)
+    assert 0.17 <= elapsed < 0.5  # 9 paced slots at 50/s
+
+
+@pytest.mark.asyncio
+async def test_worker_paces_calls_per_agent():
+    """Test the Worker acquires on its agent bucket before every attempt."""
+    limiter = RateLimiter(InProcessRateLimitBackend())
+    limiter.limit_agent("worker_1", rate=100, capacity=1)
+    worker = Worker(rate_limiter=limiter)
+    worker._simulate_transient_error = lambda: False
+    tasks = [{"task_id": f"t{i}", "spec": "s", "action": "content", "assigned_to": "worker_1"}
+             for i in range(6)]
+
+    start = time.perf_counter()
+    results = await worker.execute_many_async(tasks)
+
+    assert all(r["success"] for r in results)
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_redis_backend_matches_in_process():
+    """Test the Lua token bucket grants bursts and paces like the local one."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    backend = RedisRateLimitBackend(fakeredis.FakeRedis())
+
+    waits = [backend.reserve("rate_limit:w", rate=10, capacity=2) for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.02) and waits[3] == pytest.approx(0.2, abs=0.02)
+    assert backend.reserve("rate_limit:w", 10, 2, max_wait=0.05) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_acquire_does_not_block_the_event_loop():
+    """Test async acquires run the Redis round trip off the loop."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+
+    class SlowRedisBackend(RedisRateLimitBackend):
+        def reserve(self, *args, **kwargs):
+            time.sleep(0.1)  # a slow network round trip
+            return super().reserve(*args, **kwargs)
+
+    limiter = RateLimiter(SlowRedisBackend(fakeredis.FakeRedis()))
+    limiter.limit_upstream("twitter", rate=100, capacity=10)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.ensure_future(ticker())
+    assert await limiter.acquire_for("w1", "twitter")
+    task.cancel()
+    assert ticks >= 5
@@ -0,0 +1,116 @@
+"""Tests for Worker retry policies, retry budgets and circuit breakers."""
+
+import pytest
+
+from agents.worker.executor import Worker
+from agents.worker.retry_policy import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, RetryBudget, RetryEngine, RetryPolicy,
+)
+
+
+def test_retry_policy_jitter_bounds():
+    """Test each jitter mode stays within its documented bounds."""
+    none = RetryPolicy(base=1.0, cap=8.0, jitter="none")
+    full = RetryPolicy(base=1.0, cap=8.0, jitter="full")
+    decorrelated = RetryPolicy(base=1.0, cap=8.0, jitter="decorrelated")
+
+    assert [none.next_delay(a) for a in range(5)] == [1.0, 2.0, 4.0, 8.0, 8.0]
+    for attempt in range(5):
+        assert 0 <= full.next_delay(attempt) <= min(8.0, 2 ** attempt)
+    delay = 0.0
+    for attempt in range(10):
+        delay = decorrelated.next_delay(attempt, delay)
+        assert 1.0 <= delay <= 8.0
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter="sometimes")
+
+
+def test_retry_budget_limits_retries_to_ratio(fake_clock):
+    """Test retries are capped at a fraction of requests once the reserve is spent."""
+    budget = RetryBudget(ratio=0.1, min_retries_per_sec=0, max_tokens=5, clock=fake_clock)
+
+    assert sum(budget.try_withdraw() for _ in range(10)) == 5  # initial reserve
+    for _ in range(100):
+        budget.record_request()
+    assert sum(budget.try_withdraw() for _ in range(100)) == 5  # capped at max_tokens
+
+
+def test_circuit_breaker_opens_and_probes_half_open(fake_clock):
+    """Test the breaker trips on failure rate, fails fast, then probes half-open."""
+    breaker = CircuitBreaker(window_size=4, min_calls=4, failure_rate_threshold=0.5,
+                             reset_timeout=10.0, clock=fake_clock)
+
+    for _ in range(4):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    fake_clock.now = 10.0
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()        # single probe
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["times_opened"] == 1
+
+
+def test_circuit_breaker_reopens_on_failed_probe(fake_clock):
+    """Test a failed half-open probe re-opens the breaker."""
+    breaker = CircuitBreaker(window_size=2, min_calls=2, reset_timeout=5.0, clock=fake_clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    fake_clock.now = 5.0
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["times_opened"] == 2
+
+
+def test_worker_fails_fast_when_circuit_open():
+    """Test the Worker returns CIRCUIT_OPEN without calling the action."""
+    engine = RetryEngine(
+        default_policy=RetryPolicy(max_retries=0),
+        breaker_factory=lambda: CircuitBreaker(window_size=2, min_calls=2, reset_timeout=60),
+    )
+    worker = Worker(retry_engine=engine)
+    worker._simulate_transient_error = lambda: True
+    task = {"task_id": "t", "spec": "s", "action": "trends"}
+
+    assert worker.execute(task)["error_code"] == "API_ERROR"
+    assert worker.execute(task)["error_code"] == "API_ERROR"
+    assert worker.execute(task)["error_code"] == "CIRCUIT_OPEN"
+
+    snapshot = engine.snapshot()
+    assert snapshot["breakers"]["trends"]["state"] == OPEN
+    assert snapshot["circuit_rejections"] == 1
+    assert snapshot["requests"] == 3
+
+
+def test_worker_stops_retrying_when_budget_exhausted():
+    """Test a spent retry budget ends the retry loop early."""
+    engine = RetryEngine(
+        default_policy=RetryPolicy(max_retries=5, base=0.0, jitter="none"),
+        budget=RetryBudget(ratio=0.0, min_retries_per_sec=0, max_tokens=1),
+    )
+    worker = Worker(retry_engine=engine)
+    worker._simulate_transient_error = lambda: True
+
+    result = worker.execute({"task_id": "t", "spec": "s", "action": "content"})
+
+    assert result["error_code"] == "RETRY_BUDGET_EXHAUSTED"
+    assert engine.snapshot()["retries"] == 1
+
+
+def test_per_action_policy_override():
+    """Test a per-action policy replaces the default retry count."""
+    engine = RetryEngine(default_policy=RetryPolicy(max_retries=3, base=0.0, jitter="none"))
+    engine.set_policy("commerce", RetryPolicy(max_retries=0))
+    worker = Worker(retry_engine=engine)
+    worker._simulate_transient_error = lambda: True
+
+    worker.execute({"task_id": "t", "spec": "s", "action": "commerce"})
+
+    assert engine.snapshot()["retries"] == 0
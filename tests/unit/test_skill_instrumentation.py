@@ -0,0 +1,79 @@
+"""Tests for per-skill invocation metrics."""
+
+import asyncio
+
+import pytest
+
+from skills.instrumentation import SkillMetrics
+from skills.registry import SkillRegistry
+
+
+class FakeTrends:
+    def fetch(self, topic):
+        if topic == "boom":
+            raise RuntimeError("upstream down")
+        return [topic]
+
+    async def fetch_async(self, topic):
+        await asyncio.sleep(0)
+        return [topic]
+
+    label = "trends"
+
+
+def test_sync_methods_count_calls_errors_and_latency():
+    """Test each method gets its own counters and histogram."""
+    metrics = SkillMetrics()
+    trends = metrics.instrument("trends", FakeTrends())
+
+    assert trends.fetch("ai") == ["ai"]
+    with pytest.raises(RuntimeError):
+        trends.fetch("boom")
+    assert trends.label == "trends"  # non-callables pass through
+
+    stats = metrics.snapshot()["trends"]["fetch"]
+    assert (stats["calls"], stats["errors"], stats["sampled"]) == (2, 1, 2)
+    assert sum(stats["buckets"].values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_methods_and_plain_functions():
+    """Test coroutine methods stay awaitable and function skills are wrapped."""
+    metrics = SkillMetrics()
+    trends = metrics.instrument("trends", FakeTrends())
+    scorer = metrics.instrument("score", lambda text: len(text))
+
+    assert await trends.fetch_async("x") == ["x"]
+    assert scorer("four") == 4
+    snapshot = metrics.snapshot()
+    assert snapshot["trends"]["fetch_async"]["calls"] == 1
+    assert snapshot["score"]["__call__"]["calls"] == 1
+
+
+def test_sampling_off_counts_without_timing():
+    """Test sample_every=0 keeps counts but records no latencies."""
+    metrics = SkillMetrics(sample_every=0)
+    trends = metrics.instrument("trends", FakeTrends())
+    for _ in range(5):
+        trends.fetch("ai")
+
+    stats = metrics.snapshot()["trends"]["fetch"]
+    assert stats["calls"] == 5 and stats["sampled"] == 0
+
+
+def test_registry_hands_out_instrumented_skills():
+    """Test get_skill returns a cached proxy and metrics export as Prometheus text."""
+    metrics = SkillMetrics(sample_every=2)
+    registry = SkillRegistry(metrics=metrics)
+    registry.register("trends", FakeTrends())
+
+    trends = registry.get_skill("trends")
+    assert registry.get_skill("trends") is trends
+    for _ in range(4):
+        trends.fetch("ai")
+    registry.get_skill("engagement").analyze_sentiment("great")
+
+    text = metrics.to_prometheus()
+    assert 'chimera_skill_calls_total{skill="trends",method="fetch"} 4' in text
+    assert 'chimera_skill_latency_seconds_count{skill="trends",method="fetch"} 2' in text
+    assert 'method="analyze_sentiment"' in text
@@ -0,0 +1,196 @@
+"""Tests for opt-in skill result memoization."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from skills.memoize import CachePolicy, MemoCache, argument_key, memoize_skill
+from skills.registry import SkillRegistry
+
+
+class SentimentSkill:
+    cache_policy = CachePolicy(ttl=60, methods=frozenset({"analyze"}))
+
+    def __init__(self):
+        self.calls = 0
+
+    def analyze(self, text, options=None):
+        self.calls += 1
+        return {"text": text, "score": 0.5}
+
+    def reply(self, text):
+        self.calls += 1
+        return f"re: {text}"
+
+
+def test_argument_key_is_stable():
+    """Test equal calls hash equally regardless of kwarg or dict key order."""
+    a = argument_key("analyze", ("hi",), {"options": {"x": 1, "y": 2}, "lang": "en"})
+    b = argument_key("analyze", ("hi",), {"lang": "en", "options": {"y": 2, "x": 1}})
+    assert a == b
+    assert a != argument_key("reply", ("hi",), {"options": {"x": 1, "y": 2}, "lang": "en"})
+
+
+def test_lru_bound_and_ttl_expiry(fake_clock):
+    """Test entries are evicted past maxsize and re-fetched after their TTL."""
+    cache = MemoCache(maxsize=2, ttl=10, clock=fake_clock)
+    calls = []
+
+    def fetch(topic):
+        calls.append(topic)
+        return topic.upper()
+
+    for topic in ("a", "b", "a", "c", "b"):
+        cache.call(topic, fetch, (topic,), {})
+    assert calls == ["a", "b", "c", "b"]  # c evicted b (least recent)
+    assert cache.stats()["evictions"] == 2
+
+    fake_clock.now += 11
+    cache.call("b", fetch, ("b",), {})
+    assert calls[-1] == "b" and cache.stats()["misses"] == 5
+
+
+def test_thread_single_flight():
+    """Test concurrent identical calls from threads share one upstream call."""
+    cache = MemoCache()
+    calls = []
+    start = threading.Barrier(8)
+
+    def slow(topic):
+        calls.append(topic)
+        time.sleep(0.05)
+        return [topic]
+
+    def worker(out):
+        start.wait()
+        out.append(cache.call("k", slow, ("ai",), {}))
+
+    results = []
+    threads = [threading.Thread(target=worker, args=(results,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["ai"] and results == [["ai"]] * 8
+    stats = cache.stats()
+    assert stats["misses"] == 1 and stats["hits"] + stats["coalesced"] == 7
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_and_errors_not_cached():
+    """Test concurrent awaits coalesce and a failure is retried next time."""
+    calls = []
+
+    async def fetch_trends(topic):
+        calls.append(topic)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ConnectionError("upstream down")
+        return [topic]
+
+    fetch, cache = memoize_skill(fetch_trends, CachePolicy())
+    with pytest.raises(ConnectionError):
+        await asyncio.gather(*(fetch("ai") for _ in range(5)))
+    assert len(calls) == 1
+
+    results = await asyncio.gather(*(fetch("ai") for _ in range(5)))
+    assert results == [["ai"]] * 5 and len(calls) == 2
+    assert cache.stats()["coalesced"] == 8
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_fail_followers():
+    """Test a timed-out first caller leaves coalesced callers with the result."""
+    calls = []
+
+    async def fetch_trends(topic):
+        calls.append(topic)
+        await asyncio.sleep(0.05)
+        return [topic]
+
+    fetch, cache = memoize_skill(fetch_trends, CachePolicy())
+    leader = asyncio.ensure_future(fetch("ai"))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(fetch("ai"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == ["ai"]
+    assert leader.cancelled()
+    assert len(calls) == 1 and cache.stats()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_call_cancelled_when_every_caller_leaves():
+    """Test the upstream call stops once no caller is waiting for it."""
+    cancelled = asyncio.Event()
+
+    async def fetch_trends(topic):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    fetch, cache = memoize_skill(fetch_trends, CachePolicy())
+    for _ in range(2):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.gather(fetch("ai"), fetch("ai")), 0.01)
+        await asyncio.wait_for(cancelled.wait(), 1)
+        cancelled.clear()
+    assert cache.stats()["size"] == 0 and not cache._async_flights
+
+
+@pytest.mark.asyncio
+async def test_caller_after_abandoned_call_starts_a_fresh_one():
+    """Test a caller arriving just after the last waiter cancels is not cancelled too."""
+    calls = []
+
+    async def fetch_trends(topic):
+        calls.append(topic)
+        await asyncio.sleep(0.02)
+        return [topic]
+
+    fetch, cache = memoize_skill(fetch_trends, CachePolicy())
+    first = asyncio.ensure_future(fetch("ai"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0)  # first's cleanup cancels the shared call
+
+    assert await fetch("ai") == ["ai"]
+    assert first.cancelled()
+    assert len(calls) == 2 and not cache._async_flights
+
+
+def test_registry_memoizes_declared_methods_only():
+    """Test a skill's own cache_policy applies to the listed methods only."""
+    registry = SkillRegistry()
+    skill = SentimentSkill()
+    registry.register("sentiment", skill)
+
+    handle = registry.get_skill("sentiment")
+    for _ in range(3):
+        handle.analyze("great post")
+        handle.reply("great post")
+
+    assert skill.calls == 1 + 3
+    assert registry.cache_stats()["sentiment"]["hits"] == 2
+
+
+def test_register_cache_argument_opts_in():
+    """Test register(cache=...) memoizes skills that did not declare a policy."""
+    registry = SkillRegistry()
+    registry.register("engagement_cached", registry.get_skill("engagement"),
+                      cache=CachePolicy(ttl=30, maxsize=10))
+
+    engagement = registry.get_skill("engagement_cached")
+    engagement.analyze_sentiment("hello")
+    engagement.analyze_sentiment("hello")
+
+    assert registry.cache_stats() == {
+        "engagement_cached": {"hits": 1, "misses": 1, "coalesced": 0, "evictions": 0,
+                              "size": 1, "hit_ratio": 0.5}
+    }
@@ -0,0 +1,137 @@
+"""Tests for lazy skill loading and thread safety in the SkillRegistry."""
+
+import subprocess
+import sys
+import threading
+import time
+import types
+
+import skills.registry as registry_module
+from skills.registry import LazySkill, SkillRegistry
+
+
+def test_registry_creation_imports_no_skill_packages():
+    """Test creating and listing the registry leaves skill packages unimported."""
+    code = (
+        "import sys\n"
+        "from skills.registry import get_skill_registry\n"
+        "names = [s['name'] for s in get_skill_registry().list_skills()]\n"
+        "assert names == ['trends', 'commerce', 'content', 'engagement'], names\n"
+        "print(sorted(m for m in sys.modules if m.startswith('skills.')))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "['skills.registry']"
+
+
+def test_get_skill_loads_once_and_caches():
+    """Test the first get_skill imports and instantiates, later calls reuse it."""
+    registry = SkillRegistry()
+    content = registry.get_skill("content")
+
+    assert type(content).__name__ == "ContentGenerator"
+    assert registry.get_skill("content") is content
+    listed = {s["name"]: s for s in registry.list_skills()}
+    assert listed["content"]["module"] == "skills.content.generator"
+
+
+def test_broken_skill_does_not_block_others(caplog):
+    """Test a skill that fails to import returns None and is logged."""
+    registry = SkillRegistry()
+    registry.register("missing", LazySkill("skills.nope:thing", "function"))
+
+    assert registry.has_skill("missing")
+    assert registry.get_skill("missing") is None
+    assert "Failed to load skill 'missing'" in caplog.text
+    assert registry.get_skill("engagement") is not None
+
+
+def test_register_plain_skill():
+    """Test eagerly registered skills are returned as-is."""
+    registry = SkillRegistry()
+    registry.register("echo", print)
+
+    assert registry.get_skill("echo") is print
+    assert {"name": "echo", "type": "builtin_function_or_method", "module": "builtins"} \
+        in registry.list_skills()
+
+
+def run_threads(count, target):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(i):
+        barrier.wait()
+        try:
+            target(i)
+        except Exception as e:  # surfaced by the assertion below
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_global_registry_is_created_once(monkeypatch):
+    """Test concurrent first calls to get_skill_registry share one instance."""
+    monkeypatch.setattr(registry_module, "_registry_instance", None)
+    created = []
+    original_init = SkillRegistry.__init__
+
+    def slow_init(self, *args, **kwargs):
+        created.append(self)
+        time.sleep(0.01)  # widen the check-then-create window
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(SkillRegistry, "__init__", slow_init)
+    seen = []
+    run_threads(16, lambda i: seen.append(registry_module.get_skill_registry()))
+    assert len(created) == 1
+    assert all(registry is created[0] for registry in seen)
+
+
+def test_concurrent_first_get_skill_loads_once(monkeypatch):
+    """Test racing readers of a lazy skill trigger exactly one load."""
+    instances = []
+
+    class SlowSkill:
+        def __init__(self):
+            instances.append(self)
+            time.sleep(0.01)
+
+    module = types.ModuleType("slow_skill_module")
+    module.SlowSkill = SlowSkill
+    monkeypatch.setitem(sys.modules, "slow_skill_module", module)
+    registry = SkillRegistry()
+    registry.register("slow", LazySkill("slow_skill_module:SlowSkill", "SlowSkill",
+                                        instantiate=True))
+    handles = []
+    run_threads(16, lambda i: handles.append(registry.get_skill("slow")))
+    assert len(instances) == 1
+    assert all(handle is instances[0] for handle in handles)
+
+
+def test_register_and_read_under_contention():
+    """Stress: writers register while readers get, list and check skills."""
+    registry = SkillRegistry()
+    registry.register("base", print)
+    writers, per_writer = 8, 100
+
+    def work(i):
+        if i < writers:
+            for n in range(per_writer):
+                registry.register(f"w{i}-{n}", len)
+                assert registry.get_skill(f"w{i}-{n}") is len
+        else:
+            for n in range(10 * per_writer):
+                assert registry.get_skill("base") is print
+                assert registry.has_skill("base")
+                if n % 50 == 0:
+                    names = [s["name"] for s in registry.list_skills()]
+                    assert names[:5] == ["trends", "commerce", "content", "engagement", "base"]
+
+    run_threads(32, work)
+    assert len(registry.list_skills()) == 5 + writers * per_writer
+    assert all(registry.get_skill(f"w{i}-{per_writer - 1}") is len for i in range(writers))
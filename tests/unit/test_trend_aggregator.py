@@ -0,0 +1,179 @@
+"""Tests for concurrent, cached trend aggregation (with local stand-in sources)."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from skills.trends.trend_fetcher import (
+    TrendAggregator, TrendSource, merge_trends, sources_from_env,
+)
+
+
+class StandInSources:
+    """Routes requests by host to scripted trend endpoints and records them."""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def add(self, host, trends, delay=0.0, status=200, headers=None):
+        self.routes[host] = {"trends": trends, "delay": delay, "status": status,
+                             "headers": headers or {}}
+        return TrendSource(host.split(".")[0], f"https://{host}/trends", timeout=0.5)
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        route = self.routes[request.url.host]
+        if route["delay"]:
+            await asyncio.sleep(route["delay"])
+        headers = dict(route["headers"])
+        etag = headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers)
+        last_modified = headers.get("Last-Modified")
+        if last_modified and request.headers.get("If-Modified-Since") == last_modified:
+            return httpx.Response(304)
+        if route["status"] != 200:
+            return httpx.Response(route["status"])
+        return httpx.Response(200, json={"trends": route["trends"]}, headers=headers)
+
+    def client(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self))
+
+
+@pytest.mark.asyncio
+async def test_sources_are_polled_concurrently():
+    """Test total latency is the slowest source, not the sum."""
+    stand_ins = StandInSources()
+    sources = [stand_ins.add(f"s{i}.test", [f"topic {i}"], delay=0.2) for i in range(5)]
+    async with stand_ins.client() as client:
+        aggregator = TrendAggregator(sources, client=client)
+        start = time.perf_counter()
+        trends = await aggregator.fetch()
+    assert time.perf_counter() - start < 0.6
+    assert {t["topic"] for t in trends} == {f"topic {i}" for i in range(5)}
+
+
+@pytest.mark.asyncio
+async def test_slow_source_times_out_with_partial_results():
+    """Test a source past its timeout is dropped while the others still answer."""
+    stand_ins = StandInSources()
+    fast = stand_ins.add("fast.test", [{"topic": "fast news", "score": 0.8}])
+    slow = stand_ins.add("slow.test", [{"topic": "slow news", "score": 0.9}], delay=1.0)
+    slow.timeout = 0.05
+    async with stand_ins.client() as client:
+        aggregator = TrendAggregator([fast, slow], client=client)
+        start = time.perf_counter()
+        trends = await aggregator.fetch()
+    assert time.perf_counter() - start < 0.5
+    assert [t["topic"] for t in trends] == ["fast news"]
+    assert aggregator.stats["timeouts"] == 1
+    assert "timed out" in aggregator.last_errors["slow"]
+
+
+@pytest.mark.asyncio
+async def test_failing_source_falls_back_to_last_good_result():
+    """Test an erroring source reuses its previous trends instead of vanishing."""
+    stand_ins = StandInSources()
+    source = stand_ins.add("flaky.test", ["steady topic"])
+    async with stand_ins.client() as client:
+        aggregator = TrendAggregator([source], client=client)
+        assert [t["topic"] for t in await aggregator.fetch()] == ["steady topic"]
+        stand_ins.routes["flaky.test"]["status"] = 503
+        assert [t["topic"] for t in await aggregator.fetch()] == ["steady topic"]
+    assert aggregator.stats["errors"] == 1
+    assert "503" in aggregator.last_errors["flaky"]
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_reuses_cached_trends():
+    """Test a repeat poll sends If-None-Match and a 304 keeps the cached trends."""
+    stand_ins = StandInSources()
+    source = stand_ins.add("etag.test", ["cached topic"], headers={"ETag": '"v1"'})
+    async with stand_ins.client() as client:
+        aggregator = TrendAggregator([source], client=client)
+        first = await aggregator.fetch()
+        second = await aggregator.fetch()
+    assert first == second
+    assert "If-None-Match" not in stand_ins.requests[0].headers
+    assert stand_ins.requests[1].headers["If-None-Match"] == '"v1"'
+    assert aggregator.stats["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_if_modified_since_revalidation():
+    """Test Last-Modified is echoed back as If-Modified-Since."""
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+    stand_ins = StandInSources()
+    source = stand_ins.add("lm.test", ["dated topic"], headers={"Last-Modified": stamp})
+    async with stand_ins.client() as client:
+        aggregator = TrendAggregator([source], client=client)
+        await aggregator.fetch()
+        assert [t["topic"] for t in await aggregator.fetch()] == ["dated topic"]
+    assert stand_ins.requests[1].headers["If-Modified-Since"] == stamp
+    assert aggregator.stats["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fresh_max_age_skips_the_request():
+    """Test responses within Cache-Control max-age are served without a request."""
+    now = [0.0]
+    stand_ins = StandInSources()
+    source = stand_ins.add("fresh.test", ["fresh topic"], headers={"Cache-Control": "max-age=60"})
+    async with stand_ins.client() as client:
+        aggregator = TrendAggregator([source], client=client, clock=lambda: now[0])
+        await aggregator.fetch()
+        await aggregator.fetch()
+        assert len(stand_ins.requests) == 1
+        now[0] = 61.0
+        await aggregator.fetch()
+    assert len(stand_ins.requests) == 2
+    assert aggregator.stats["fresh"] == 1
+
+
+@pytest.mark.asyncio
+async def test_category_is_part_of_the_cache_key():
+    """Test different categories are requested and cached separately."""
+    stand_ins = StandInSources()
+    source = stand_ins.add("cat.test", ["x"], headers={"Cache-Control": "max-age=60"})
+    async with stand_ins.client() as client:
+        aggregator = TrendAggregator([source], client=client)
+        await aggregator.fetch(category="music")
+        await aggregator.fetch(category="sports")
+        await aggregator.fetch(category="music")
+    assert [r.url.params.get("category") for r in stand_ins.requests] == ["music", "sports"]
+
+
+@pytest.mark.asyncio
+async def test_default_client_is_pooled_per_loop():
+    """Test the aggregator's own client is reused across polls on one loop."""
+    aggregator = TrendAggregator()
+    client = aggregator._get_client()
+    assert aggregator._get_client() is client
+    await aggregator.aclose()
+    assert client.is_closed
+
+
+def test_merge_deduplicates_topics_across_sources():
+    """Test merging keeps the best score per topic and lists every source."""
+    a, b = TrendSource("a", "https://a.test"), TrendSource("b", "https://b.test")
+    merged = merge_trends([
+        (a, a.parse([{"topic": "AI", "score": 0.5}, {"topic": "NFT", "score": 0.7}])),
+        (b, b.parse([{"topic": "ai", "score": 0.6, "url": "https://b.test/ai"}])),
+    ])
+    assert [(t["topic"], t["relevance_score"]) for t in merged] == [("NFT", 0.7), ("AI", 0.6)]
+    assert merged[1]["sources"] == ["a", "b"]
+    assert merged[1]["source_url"] == "https://b.test/ai"
+    assert merge_trends([(a, a.parse(["one", "two", "three"]))], limit=2)[0]["topic"] == "one"
+
+
+def test_sources_from_env():
+    """Test CHIMERA_TREND_SOURCES parsing."""
+    sources = sources_from_env("news=https://news.test/t, social=https://social.test/t")
+    assert [(s.name, s.url) for s in sources] == [
+        ("news", "https://news.test/t"), ("social", "https://social.test/t")]
+    assert sources_from_env("") == []
+    with pytest.raises(ValueError):
+        sources_from_env("missing-url")
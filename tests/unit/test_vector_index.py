@@ -0,0 +1,173 @@
+"""Tests for the embedded vector index and its registry / memory consumers."""
+
+import numpy as np
+import pytest
+
+from agents.memory import SemanticMemory
+from models.vector_index import VectorIndex, hashing_embedder
+from skills.registry import SkillRegistry
+
+
+def clustered(n=2000, dim=16, clusters=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)) * 5
+    return (centers[rng.integers(clusters, size=n)] + rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def brute_force(vectors, query, k, metric):
+    if metric == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        query = query / np.linalg.norm(query)
+    if metric == "l2":
+        scores = -((vectors - query) ** 2).sum(axis=1)
+    else:
+        scores = vectors @ query
+    return list(np.argsort(-scores)[:k])
+
+
+@pytest.mark.parametrize("metric", ["cosine", "ip", "l2"])
+def test_exact_search_matches_brute_force(metric):
+    """Test exact top-k agrees with a straightforward NumPy ranking."""
+    vectors = clustered()
+    index = VectorIndex(16, metric=metric)
+    index.add(vectors)
+    queries = clustered(n=5, seed=1)
+    for query, hits in zip(queries, index.search(queries, k=10)):
+        assert [hit["id"] for hit in hits] == brute_force(vectors, query, 10, metric)
+        scores = [hit["score"] for hit in hits]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_batched_adds_and_custom_ids():
+    """Test adds in several batches keep ids and metadata aligned with rows."""
+    index = VectorIndex(3)
+    index.add([[1, 0, 0], [0, 1, 0]], ids=["x", "y"], metadata=[{"n": 1}, {"n": 2}])
+    index.add(np.array([[0, 0, 1]]), ids=["z"], metadata=[{"n": 3}])
+    assert len(index) == 3
+    hit = index.search([0, 0.1, 1], k=1)[0]
+    assert hit["id"] == "z" and hit["metadata"] == {"n": 3}
+    with pytest.raises(ValueError):
+        index.add([[1, 2]])
+
+
+def test_metadata_filter():
+    """Test ``where`` restricts results to rows whose metadata match."""
+    vectors = clustered(n=500)
+    index = VectorIndex(16)
+    index.add(vectors, metadata=[{"agent_id": f"a{i % 3}"} for i in range(500)])
+    hits = index.search(vectors[0], k=20, where={"agent_id": "a1"})
+    assert len(hits) == 20
+    assert all(hit["metadata"]["agent_id"] == "a1" for hit in hits)
+    assert index.search(vectors[0], k=5, where={"agent_id": "nobody"}) == []
+
+
+def test_ivf_recall_and_incremental_adds():
+    """Test IVF search finds most true neighbours and sees vectors added later."""
+    vectors = clustered(n=5000)
+    index = VectorIndex(16)
+    index.add(vectors[:4000])
+    index.build_ivf(nlist=32)
+    index.add(vectors[4000:])
+
+    queries = clustered(n=50, seed=2)
+    found = 0
+    for query, hits in zip(queries, index.search(queries, k=10, nprobe=8)):
+        found += len({hit["id"] for hit in hits} & set(brute_force(vectors, query, 10, "cosine")))
+    assert found / 500 >= 0.9
+
+    # A vector added after clustering is its own nearest neighbour
+    assert index.search(vectors[4500], k=1, nprobe=1)[0]["id"] == 4500
+    exact = index.search(queries[0], k=10, exact=True)
+    assert [hit["id"] for hit in exact] == brute_force(vectors, queries[0], 10, "cosine")
+
+
+def test_l2_ivf_probes_the_nearest_lists():
+    """Test l2 IVF ranks lists by distance, not inner product, on varied norms."""
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(40, 16)) * rng.uniform(1, 20, size=(40, 1))
+    labels = rng.integers(40, size=4000)
+    vectors = (centers[labels] + rng.normal(size=(4000, 16))).astype(np.float32)
+    index = VectorIndex(16, metric="l2")
+    index.add(vectors)
+    index.build_ivf(nlist=40)
+
+    queries = (centers[rng.integers(40, size=50)] + rng.normal(size=(50, 16))).astype(np.float32)
+    found = 0
+    for query, hits in zip(queries, index.search(queries, k=10, nprobe=2)):
+        found += len({hit["id"] for hit in hits} & set(brute_force(vectors, query, 10, "l2")))
+    assert found / 500 >= 0.9
+
+
+def test_filtered_ivf_search_returns_k_hits():
+    """Test a filter matching rows outside the probed lists still yields k hits."""
+    rng = np.random.default_rng(4)
+    centers = rng.normal(size=(20, 16)) * 5
+    labels = np.repeat(np.arange(20), 100)
+    vectors = (centers[labels] + rng.normal(size=(2000, 16))).astype(np.float32)
+    # "rare" rows sit in one cluster, "wide" rows in two, both far from the query
+    agents = np.where(labels == 0, "rare", np.where(labels <= 2, "wide", "other"))
+    agents[np.flatnonzero(labels == 0)[30:]] = "other"
+    index = VectorIndex(16)
+    index.add(vectors, metadata=[{"agent_id": agent} for agent in agents])
+    index.build_ivf(nlist=20)
+    query = centers[10]
+
+    for agent in ("rare", "wide"):  # selective filter, then a widened probe
+        hits = index.search(query, k=10, where={"agent_id": agent}, nprobe=1)
+        assert len(hits) == 10
+        assert all(hit["metadata"]["agent_id"] == agent for hit in hits)
+    exact = index.search(query, k=10, where={"agent_id": "rare"}, exact=True)
+    assert index.search(query, k=10, where={"agent_id": "rare"}, nprobe=1) == exact
+    assert len(index.search(query, k=50, where={"agent_id": "rare"}, nprobe=1)) == 30
+
+
+def test_save_and_memory_mapped_load(tmp_path):
+    """Test a saved IVF index reloads memory-mapped and stays appendable."""
+    vectors = clustered(n=1000)
+    index = VectorIndex(16, metric="l2")
+    index.add(vectors, ids=[f"v{i}" for i in range(1000)],
+              metadata=[{"i": i} for i in range(1000)])
+    index.build_ivf(nlist=8)
+    index.save(tmp_path / "idx")
+
+    loaded = VectorIndex.load(tmp_path / "idx")
+    assert isinstance(loaded._vectors, np.memmap)
+    assert loaded.is_ivf and loaded.metric == "l2" and len(loaded) == 1000
+    assert loaded.search(vectors[7], k=3) == index.search(vectors[7], k=3)
+
+    loaded.add(vectors[:1] + 100, ids=["new"])
+    assert loaded.search(vectors[0] + 100, k=1, nprobe=8)[0]["id"] == "new"
+    # The file on disk is untouched by the append
+    assert len(VectorIndex.load(tmp_path / "idx")) == 1000
+
+
+def test_hashing_embedder_ranks_shared_words_higher():
+    """Test texts sharing words embed closer than unrelated ones."""
+    embed = hashing_embedder(dim=64)
+    vectors = embed(["post a tweet", "buy tokens", "Post_Tweet"])
+    assert vectors.shape == (3, 64)
+    assert vectors[0] @ vectors[2] > vectors[0] @ vectors[1]
+
+
+def test_registry_search_skills():
+    """Test skill discovery ranks by description and follows registrations."""
+    registry = SkillRegistry()
+
+    def post_tweet(text):
+        """Publish a tweet to the twitter timeline."""
+
+    registry.register("tweet", post_tweet)
+    results = registry.search_skills("publish on twitter", k=2)
+    assert results[0]["name"] == "tweet"
+    assert set(results[0]) == {"name", "type", "module", "score"}
+    assert registry.search_skills("engagement replies", k=1)[0]["name"] == "engagement"
+
+
+def test_semantic_memory_recall_is_per_agent():
+    """Test recall returns the closest memories of the requesting agent only."""
+    memory = SemanticMemory()
+    memory.remember("a", ["campaign budget is 500 usdc", "audience likes cats"])
+    memory.remember("b", "budget approved for the dog campaign")
+    texts = [text for text, _ in memory.recall("a", "what is the budget", k=2)]
+    assert texts[0] == "campaign budget is 500 usdc"
+    assert "budget approved for the dog campaign" not in texts
@@ -0,0 +1,86 @@
+"""Tests for the Worker asyncio execution engine."""
+
+import asyncio
+
+import pytest
+
+from agents.worker.executor import Worker
+
+
+def _task(i):
+    return {"task_id": f"task_{i}", "spec": f"Task {i}", "action": "test"}
+
+
+@pytest.mark.asyncio
+async def test_execute_many_async_bounds_concurrency():
+    """Test no more than max_concurrency tasks run at the same time."""
+    worker = Worker()
+    worker._simulate_transient_error = lambda: False
+    running = 0
+    peak = 0
+    original = worker._execute_single
+
+    async def tracked(task_spec):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            return await original(task_spec)
+        finally:
+            running -= 1
+
+    worker._execute_single = tracked
+    results = await worker.execute_many_async((_task(i) for i in range(50)), max_concurrency=5)
+
+    assert peak == 5
+    assert [r["output"] for r in results] == [f"Executed: Task {i}" for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_execute_async_backoff_does_not_block_loop():
+    """Test retry backoff yields to the event loop instead of sleeping the thread."""
+    from agents.worker.retry_policy import RetryPolicy
+    worker = Worker(max_retries=2)
+    worker.retry_engine.default_policy = RetryPolicy(max_retries=2, base=0.05, cap=0.05, jitter="none")
+    failures = iter([True, True, False])
+    worker._simulate_transient_error = lambda: next(failures)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticking = asyncio.ensure_future(ticker())
+    result = await worker.execute_async(_task(0))
+    ticking.cancel()
+
+    assert result["success"] is True
+    assert result["attempts"] == 3
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_execute_async_is_cancellable():
+    """Test cancelling an in-flight task interrupts its backoff."""
+    worker = Worker()
+    worker._simulate_transient_error = lambda: True
+
+    task = asyncio.ensure_future(worker.execute_async(_task(0)))
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def test_sync_execute_wraps_async_engine():
+    """Test the blocking execute API still returns a result dict."""
+    worker = Worker()
+    worker._simulate_transient_error = lambda: False
+
+    result = worker.execute(_task(1))
+
+    assert result["success"] is True
+    assert worker.execute({"task_id": "x"})["error_code"] == "INVALID_SPEC"
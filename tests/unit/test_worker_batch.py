@@ -0,0 +1,122 @@
+"""Tests for Worker.execute_batch."""
+
+import asyncio
+
+import pytest
+
+from agents.rate_limit import InProcessRateLimitBackend, RateLimiter, upstream_key
+from agents.worker.executor import Worker
+from agents.worker.retry_policy import CircuitBreaker, RetryEngine
+
+
+def _task(i, action="test"):
+    return {"task_id": f"task_{i}", "spec": f"Task {i}", "action": action}
+
+
+@pytest.fixture
+def worker():
+    worker = Worker()
+    worker._simulate_transient_error = lambda: False
+    return worker
+
+
+def test_execute_batch_returns_every_result_with_task_id(worker):
+    """Test every task, valid or not, produces exactly one tagged result."""
+    tasks = [_task(i) for i in range(20)] + [{"task_id": "broken"}]
+
+    results = {r["task_id"]: r for r in worker.execute_batch(tasks)}
+
+    assert len(results) == 21
+    assert results["broken"]["error_code"] == "INVALID_SPEC"
+    assert all(results[f"task_{i}"]["success"] for i in range(20))
+
+
+def test_execute_batch_groups_bulk_actions(worker):
+    """Test bulk-capable actions get one handler call per group chunk."""
+    calls = []
+
+    async def score_bulk(task_specs):
+        calls.append(len(task_specs))
+        return [{"score": len(t["spec"]), "confidence": 0.8} for t in task_specs]
+
+    worker.register_bulk_handler("sentiment", score_bulk)
+    worker.max_bulk_size = 4
+    tasks = [_task(i, "sentiment") for i in range(10)] + [_task(i, "test") for i in range(10, 13)]
+
+    results = list(worker.execute_batch(tasks))
+
+    assert sorted(calls) == [2, 4, 4]
+    bulk = [r for r in results if isinstance(r["output"], dict)]
+    assert len(bulk) == 10 and all(r["confidence"] == 0.8 for r in bulk)
+    assert len(results) == 13
+
+
+def test_execute_batch_yields_in_completion_order(worker):
+    """Test fast groups are yielded before slow ones regardless of input order."""
+    async def slow(task_specs):
+        await asyncio.sleep(0.2)
+        return ["slow"] * len(task_specs)
+
+    worker.register_bulk_handler("slow", slow)
+    worker.register_bulk_handler("fast", lambda task_specs: ["fast"] * len(task_specs))
+    tasks = [_task(0, "slow"), _task(1, "fast")]
+
+    outputs = [r["output"] for r in worker.execute_batch(tasks)]
+
+    assert outputs == ["fast", "slow"]
+
+
+def test_execute_batch_bulk_handler_failure(worker):
+    """Test a failing or mis-sized bulk call turns into per-task errors."""
+    worker.register_bulk_handler("short", lambda task_specs: [])
+    tasks = [_task(i, "short") for i in range(3)]
+
+    results = list(worker.execute_batch(tasks))
+
+    assert [r["error_code"] for r in results] == ["EXECUTION_ERROR"] * 3
+    assert {r["task_id"] for r in results} == {"task_0", "task_1", "task_2"}
+
+
+def test_bulk_calls_share_the_single_task_breaker():
+    """Test bulk and single calls to one skill trip the same breaker."""
+    engine = RetryEngine(
+        breaker_factory=lambda: CircuitBreaker(window_size=2, min_calls=2, reset_timeout=60),
+    )
+    worker = Worker(retry_engine=engine)
+    calls = []
+    worker.register_bulk_handler("post", lambda task_specs: calls.append(task_specs) or [])
+    breaker = engine.breaker_for("twitter")
+    breaker.record_failure()
+    breaker.record_failure()
+    tasks = [dict(_task(i, "post"), skill="twitter") for i in range(3)]
+
+    results = list(worker.execute_batch(tasks))
+
+    assert [r["error_code"] for r in results] == ["CIRCUIT_OPEN"] * 3
+    assert calls == []
+    assert "post" not in engine._breakers
+
+
+def test_bulk_calls_are_rate_limited_once_per_call(worker):
+    """Test each bulk handler call takes one token from the upstream bucket."""
+    limiter = RateLimiter(InProcessRateLimitBackend())
+    limiter.limit_upstream("sentiment", rate=1, capacity=2)
+    worker.rate_limiter = limiter
+    worker.register_bulk_handler("sentiment", lambda task_specs: [0.5] * len(task_specs))
+    worker.max_bulk_size = 5
+
+    results = list(worker.execute_batch([_task(i, "sentiment") for i in range(10)]))
+
+    assert all(r["success"] for r in results)
+    # Two calls spent the burst of two; a third token is not available yet
+    assert not limiter.try_acquire(upstream_key("sentiment"))
+
+
+def test_execute_batch_early_stop_cancels_pending(worker):
+    """Test abandoning the iterator does not leave jobs running."""
+    results = worker.execute_batch([_task(i) for i in range(50)], max_concurrency=2)
+
+    first = next(results)
+    results.close()
+
+    assert first["success"] is True
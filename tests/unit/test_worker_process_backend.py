@@ -0,0 +1,94 @@
+"""Tests for the Worker process-pool execution backend."""
+
+import pytest
+
+from agents.worker.executor import Worker
+from agents.worker.process_backend import ProcessPoolBackend
+
+@pytest.fixture(scope="module")
+def backend():
+    handlers = {
+        "broken": "os:getpid",  # takes no arguments, so every call raises
+        "len": len,
+        "sentiment": "skills.engagement.replier:EngagementManager.analyze_sentiment",
+    }
+    with ProcessPoolBackend(handlers, max_workers=2, chunk_size=4) as pool:
+        yield pool
+
+
+def test_process_backend_streams_all_results(backend):
+    """Test every task comes back exactly once with its task_id."""
+    worker = Worker(process_backend=backend)
+    tasks = ({"task_id": f"t{i}", "spec": "x" * i, "action": "len"} for i in range(50))
+
+    results = list(worker.execute_in_processes(tasks))
+
+    assert len(results) == 50
+    assert all(r["success"] for r in results)
+    # len() receives the task spec dict itself
+    assert {r["task_id"] for r in results} == {f"t{i}" for i in range(50)}
+
+
+def test_process_backend_reports_errors(backend):
+    """Test invalid specs and unknown actions become standard error responses."""
+    tasks = [
+        {"task_id": "bad"},
+        {"task_id": "unknown", "spec": "x", "action": "nope"},
+    ]
+
+    results = {r["task_id"]: r for r in backend.map_unordered(tasks)}
+
+    assert results["bad"]["error_code"] == "INVALID_SPEC"
+    assert results["unknown"]["error_code"] == "UNKNOWN_ACTION"
+
+
+def test_process_backend_captures_handler_exceptions(backend):
+    """Test a handler raising inside a child becomes an EXECUTION_ERROR result."""
+    tasks = [{"task_id": str(i), "spec": "boom", "action": "broken"} for i in range(8)]
+
+    results = list(backend.map_unordered(tasks))
+
+    assert len(results) == 8
+    assert all(r["error_code"] == "EXECUTION_ERROR" for r in results)
+
+
+def test_process_backend_uses_warm_skill_instances(backend):
+    """Test class-method handlers run on a skill instance created at pool start."""
+    tasks = [{"task_id": "s", "spec": "Great post!", "action": "sentiment"}]
+
+    (result,) = backend.map_unordered(tasks)
+
+    assert result["success"] is True
+    assert result["output"]["sentiment"] == "neutral"
+
+
+def test_resolve_handler_instantiates_class_once():
+    """Test Class.method specs resolve to a bound method of a fresh instance."""
+    from agents.worker.process_backend import resolve_handler
+    from skills.engagement.replier import EngagementManager
+
+    handler = resolve_handler("skills.engagement.replier:EngagementManager.generate_reply")
+
+    assert isinstance(handler.__self__, EngagementManager)
+
+
+def test_worker_without_backend_refuses_process_execution():
+    """Test execute_in_processes requires a configured backend."""
+    with pytest.raises(RuntimeError):
+        Worker().execute_in_processes([])
+
+
+def test_abandoned_stream_cancels_queued_chunks():
+    """Test closing the result generator early cancels chunks not yet started."""
+    with ProcessPoolBackend({"len": len}, max_workers=1, chunk_size=1,
+                            max_pending_chunks=20) as pool:
+        submitted = []
+        submit = pool._executor.submit
+        pool._executor.submit = lambda *args: submitted.append(submit(*args)) or submitted[-1]
+        results = pool.map_unordered({"task_id": str(i), "spec": "x", "action": "len"}
+                                     for i in range(100))
+        next(results)
+        results.close()
+
+        assert len(submitted) == 20
+        assert sum(future.cancelled() for future in submitted) >= 10